@@ -64,5 +64,11 @@ if __name__ == "__main__":
     stop_threads = True
     [broker_worker.join() for broker_worker in broker_workers]
 
+    # Complete pending memory operations
+    config.memory.close()
+
+    # Release cart flasher
+    config.cart_flasher_pool.close()
+
     logger.debug("Exit main thread")
     logging_shutdown()
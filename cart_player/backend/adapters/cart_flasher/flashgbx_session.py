@@ -0,0 +1,245 @@
+import json
+import logging
+import os
+import queue
+import subprocess
+import threading
+from typing import Callable, List, Optional
+
+from cart_player.backend import config
+
+from .utils import READ_CHUNK_SIZE, LineSplitter, get_native_command_prefix
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::FlashGBXSession")
+
+READY_MARKER = "@@READY"
+ERROR_MARKER = "@@ERROR"
+DONE_MARKER = "@@DONE"
+
+# Source of the worker process, passed with `python -c` (source files are not available in frozen builds).
+# FlashGBX is imported once, and its CLI is patched so that a single instance keeps the device connection open
+# across actions: device discovery and connection are only performed again after a failure.
+# It relies on FlashGBX internals (FlashGBX.main, LoadConfig and FlashGBX_CLI), tested with FlashGBX 3.27.
+WORKER_SOURCE = f'''
+import io, json, sys, traceback
+protocol_in, protocol_out = sys.stdin, sys.stdout
+try:
+    from FlashGBX import FlashGBX as fgbx, FlashGBX_CLI
+except Exception as e:
+    protocol_out.write("{ERROR_MARKER} " + repr(e) + "\\n")
+    protocol_out.flush()
+    sys.exit(1)
+
+load_config, configs = fgbx.LoadConfig, {{}}
+def cached_load_config(args):
+    if args["config_path"] not in configs:
+        configs[args["config_path"]] = load_config(args)
+    return configs[args["config_path"]]
+fgbx.LoadConfig = cached_load_config
+
+CLI, session = FlashGBX_CLI.FlashGBX_CLI, {{}}
+class SessionCLI(CLI):
+    def __new__(cls, args):
+        if "cli" not in session:
+            session["cli"] = super().__new__(cls)
+            CLI.__init__(session["cli"], args)
+        session["cli"].ARGS = args
+        return session["cli"]
+    def __init__(self, args):
+        pass
+    def FindDevices(self, port=None):
+        if self.DEVICE is not None and self.CONN is not None:
+            return True
+        self.DEVICE = None
+        return CLI.FindDevices(self, port=port)
+    def ConnectDevice(self):
+        if self.CONN is not None and self.CONN.IsConnected():
+            return True
+        return CLI.ConnectDevice(self)
+    def DisconnectDevice(self):
+        pass
+    def reset(self):
+        CLI.DisconnectDevice(self)
+        self.DEVICE = None
+FlashGBX_CLI.FlashGBX_CLI = SessionCLI
+
+protocol_out.write("{READY_MARKER}\\n")
+protocol_out.flush()
+for request in protocol_in:
+    request = json.loads(request)
+    if request.get("reset") and "cli" in session:
+        session["cli"].reset()
+    sys.argv = ["FlashGBX"] + request["args"]
+    sys.stdin = io.StringIO("")
+    try:
+        fgbx.main()
+    except BaseException:
+        traceback.print_exc(file=protocol_out)
+        if "cli" in session:
+            session["cli"].reset()
+    protocol_out.write("\\n{DONE_MARKER}\\n")
+    protocol_out.flush()
+'''
+
+
+class FlashGBXSession:
+    """Long-lived FlashGBX worker process, running FlashGBX actions one after the other.
+
+    FlashGBX is imported once and the device connection is kept open across actions, which saves interpreter startup,
+    configuration loading and device discovery for each of them. The worker is started on first use, and restarted
+    after a crash or a timeout.
+
+    Args:
+        command: Command starting the Python interpreter where FlashGBX is installed (e.g. ['python3']).
+        timeout: Maximal time in seconds to wait for the next output line of an action.
+
+    Properties:
+        is_available: False if FlashGBX cannot be driven through a worker (actions have to be run otherwise).
+    """
+
+    def __init__(self, command: List[str], timeout: float = 10):
+        self._command = command
+        self._timeout = timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._lines: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._is_available = True
+        self._reset_connection = False
+
+    @property
+    def is_available(self) -> bool:
+        """False if FlashGBX cannot be driven through a worker (actions have to be run otherwise)."""
+        return self._is_available
+
+    def run(self, args: List[str], handler: Callable[[str], None]) -> bool:
+        """Run a FlashGBX action and call the given handler with each line of its output in real time.
+
+        Args:
+            args: FlashGBX command line arguments (e.g. ['--mode', 'dmg', '--action', 'info']).
+            handler: The function to call with each line of the action's output.
+
+        Returns:
+            True if the action has run until its end, False otherwise.
+        """
+        with self._lock:
+            if not self._start():
+                return False
+
+            logger.debug(f"FlashGBX worker action: {args=}")
+            try:
+                request = json.dumps({"args": args, "reset": self._reset_connection}) + "\n"
+                self._process.stdin.write(request.encode("utf-8"))
+                self._process.stdin.flush()
+            except OSError as e:
+                logger.info(f"FlashGBX worker is not reachable: {e}", exc_info=True)
+                self._stop()
+                return False
+            self._reset_connection = False
+
+            while True:
+                try:
+                    line = self._lines.get(timeout=self._timeout)
+                except queue.Empty:
+                    logger.error("FlashGBX worker timed out.")
+                    self._stop()
+                    return False
+
+                if line is None:  # worker has exited
+                    logger.error("FlashGBX worker has exited unexpectedly.")
+                    self._stop()
+                    return False
+                if line == DONE_MARKER:
+                    return True
+
+                line = line.strip()
+                if line:
+                    logger.debug(line)
+                    handler(line)
+
+    def reset_connection(self):
+        """Close the device connection before the next action (e.g. after an action has failed)."""
+        self._reset_connection = True
+
+    def close(self):
+        """Stop the worker process."""
+        with self._lock:
+            self._stop()
+
+    def _start(self) -> bool:
+        """Start the worker process if not running yet, and return True if it is ready."""
+        if not self._is_available:
+            return False
+        if self._process is not None and self._process.poll() is None:
+            return True
+
+        try:
+            self._process = subprocess.Popen(
+                self._command + ["-u", "-c", WORKER_SOURCE],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.info(f"Unable to start FlashGBX worker, falling back to one process per action: {e}", exc_info=True)
+            self._is_available = False
+            return False
+
+        self._lines = queue.Queue()
+        threading.Thread(target=self._read_lines, args=(self._process, self._lines), daemon=True).start()
+
+        try:
+            line = self._lines.get(timeout=self._timeout * 3)
+        except queue.Empty:
+            line = None
+        if line != READY_MARKER:
+            logger.info(f"FlashGBX worker is not available, falling back to one process per action: {line=}")
+            self._stop()
+            self._is_available = False
+            return False
+
+        logger.debug(f"FlashGBX worker started ({self._process.pid=})")
+        return True
+
+    def _stop(self):
+        if self._process is None:
+            return
+
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+        self._process = None
+
+    @staticmethod
+    def _read_lines(process: subprocess.Popen, lines: queue.Queue):
+        """Split worker output on both carriage returns and newlines, as progress is reported with carriage returns
+        (executed by a reader thread). None is put once the worker has exited."""
+        splitter = LineSplitter()
+        while True:
+            chunk = process.stdout.read1(READ_CHUNK_SIZE)
+            for line in splitter.feed(chunk) if chunk else splitter.flush():
+                lines.put(line)
+            if not chunk:
+                break
+        lines.put(None)
+
+    @staticmethod
+    def find_python_command(flashgbx_path: str) -> Optional[List[str]]:
+        """Return the command starting the Python interpreter of a FlashGBX installation, from the shebang of its
+        launcher script. None if FlashGBX is not installed as a Python package (e.g. Windows portable build).
+        """
+        try:
+            with open(flashgbx_path, "rb") as f:
+                first_line = f.readline(1024).decode("utf-8", errors="replace").strip()
+        except OSError:
+            return None
+
+        if not first_line.startswith("#!") or "python" not in first_line:
+            return None
+
+        return get_native_command_prefix() + first_line[2:].split()
@@ -3,21 +3,31 @@ import logging
 import os
 import re
 import tempfile
-from datetime import datetime, timedelta
+import time
+from copy import copy
+from datetime import timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 from cart_player.backend import config
 from cart_player.backend.domain.dtos import CartInfo as CartInfoDTO
 from cart_player.backend.domain.models import CartInfo
 from cart_player.backend.domain.ports import CartFlasher
 from cart_player.backend.utils.models import GameSupport
+from cart_player.backend.utils.nointro import get_nointro_rom
+from cart_player.core import metrics
 
-from .utils import get_name, get_region, run_command_with_realtime_output
+from .flashgbx_session import FlashGBXSession
+from .progress import DEFAULT_FREQUENCY, ProgressTracker
+from .stats import OperationStats
+from .utils import find_device_port, get_name, get_region, run_command_with_realtime_output
 
 logger = logging.getLogger(f"{config.LOGGER_NAME}::GBXFlasher")
 
+# Duration in seconds during which cart info read previously is considered valid (extended by each successful action
+# performed on the same cart, as FlashGBX prints cart header before each action)
+CART_INFO_CACHE_TTL = 60
 
 # Success messages
 ROM_BACKUP_VERIFIED = "The ROM backup is complete and the checksum was verified successfully!"
@@ -45,6 +55,18 @@ GAME_BOY_COLOR = "Game Boy Color"
 HEADER_CHECKSUM = "Header Checksum"
 SAVE_TYPE = "Save Type"
 SUPER_GAME_BOY = "Super Game Boy"
+ROM_SIZE = "ROM Size"
+
+# FlashGBX actions performing each operation
+ACTIONS = {
+    "read_cart_info": "info",
+    "read_game": "backup-rom",
+    "dump_game": "backup-rom",
+    "read_save": "backup-save",
+    "erase_save": "erase-save",
+    "write_save": "restore-save",
+}
+ROM_SIZE_UNITS = {"KiB": 1024, "MiB": 1024 * 1024, "MB": 1024 * 1024}  # FlashGBX prints AGB sizes in 'MB' (MiB)
 
 
 class GBXFlasherMode(str, Enum):
@@ -55,38 +77,90 @@ class GBXFlasherMode(str, Enum):
 class GBXFlasher(CartFlasher):
     """Cart flasher, allowing to interact with real carts using a GBxCart.
 
+    Args:
+        device_port: Serial port of the GBxCart (e.g. '/dev/ttyACM0' or 'COM3'). If None, the device is auto-detected.
+        device_serial_number: USB serial number of the GBxCart, used to find its serial port if no port is provided
+            (requires pyserial).
+        progress_frequency: Maximal number of progress reports per second.
+        stats: Store of past operations, used to predict the duration of operations. If None, operations are only
+            kept in RAM.
+        flashgbx_command: Command running FlashGBX (e.g. a fake FlashGBX, see `cart_player.backend.tests.mocks`),
+            with one process per action. If None, the installed FlashGBX is used.
+
     Properties:
         cart_inserted: True if a cart is inserted.
-        is_busy: True if cart flasher is not available.
+        is_busy: True if cart flasher is running an operation.
     """
 
-    last_command_success: bool = False
+    def __init__(
+        self,
+        device_port: Optional[str] = None,
+        device_serial_number: Optional[str] = None,
+        progress_frequency: float = DEFAULT_FREQUENCY,
+        stats: Optional[OperationStats] = None,
+        flashgbx_command: Optional[List[str]] = None,
+    ):
+        super().__init__()
+        self._device_port = device_port
+        self._device_serial_number = device_serial_number
+        self._found_device_port: Optional[str] = None  # port of the device with the configured serial number
+        self._progress_frequency = progress_frequency
+        self._stats = stats if stats is not None else OperationStats()
+        self._flashgbx_command = flashgbx_command
+        self._last_command_success = False
+        self._session: Optional[FlashGBXSession] = None
+        self._cart_info: Optional[CartInfo] = None
+        self._cart_info_time = 0.0
+        self._last_mode: Optional[GBXFlasherMode] = None
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
 
     @property
     def cart_inserted(self) -> bool:
         return True  # cannot determine if cart is inserted or not, so we assume it is always the case
 
+    def estimate_duration(self, cart_info: CartInfo, operation: str) -> Optional[timedelta]:
+        action = ACTIONS.get(operation, None)
+        if action is None:
+            return None
+
+        n_bytes = self.__get_rom_size(cart_info) if action == "backup-rom" else None
+        duration = self._stats.estimate_duration(action, cart_info.support.value, n_bytes)
+        return timedelta(seconds=duration) if duration is not None else None
+
+    def _get_cached_cart_info(self) -> Optional[CartInfo]:
+        if self._cart_info is None or time.monotonic() - self._cart_info_time > CART_INFO_CACHE_TTL:
+            return None
+        return copy(self._cart_info)
+
     def _read_cart_info(self) -> CartInfo:
-        # Fill up CartInfoDTO
+        self._cart_info = None
+
+        # Fill up CartInfoDTO (most recently successful mode first)
         dto = None
-        for mode in GBXFlasherMode:
+        for mode in sorted(GBXFlasherMode, key=lambda mode: mode != self._last_mode):
             exceptions = []
             dto = CartInfoDTO(support=GameSupport.GAMEBOY_ADVANCE if mode == GBXFlasherMode.AGB else None)
-            flashgbx_path = self.__get_flashgbx_path()
-            command = f"{flashgbx_path} --mode {mode} --action info"
+            args = ["--mode", mode.value, "--action", "info"]
             try:
-                GBXFlasher.last_command_success = False
-                run_command_with_realtime_output(command, lambda line: self.__read_cart_info_handler(mode, dto, line))
+                self._last_command_success = False
+                metrics.increment("cart_flasher.gbx.info_runs")
+                start_time = time.monotonic()
+                self.__run_flashgbx(args, lambda line: self.__read_cart_info_handler(mode, dto, line))
             except RuntimeError as e:
                 dto = None
                 exceptions.append((mode, e))
             else:
-                if GBXFlasher.last_command_success:
+                if self._last_command_success:
+                    self._last_mode = mode
+                    self._stats.record("info", dto.support.value, mode.value, None, time.monotonic() - start_time)
                     break
 
         # Error cases
-        if not GBXFlasher.last_command_success:
-            raise RuntimeError(f"Command '{command}' has failed.")
+        if not self._last_command_success:
+            raise RuntimeError(f"Command '{' '.join(args)}' has failed.")
         if not dto:
             raise RuntimeError("\n".join(f"[{mode}]: {type(e)} >> {e}" for mode, e in exceptions))
 
@@ -96,28 +170,43 @@ class GBXFlasher(CartFlasher):
 
         logger.debug(f"Bash command(s) result(s): {dto=}")
 
-        return CartInfo.create(dto)
+        self._cart_info = CartInfo.create(dto)
+        self._cart_info_time = time.monotonic()
+        return copy(self._cart_info)
 
     def _read_game(
         self, cart_info: CartInfo, report_progress_callback: Callable[[float, Optional[timedelta]], None]
     ) -> bytes:
-        mode = GBXFlasherMode.AGB if cart_info.support == GameSupport.GAMEBOY_ADVANCE else GBXFlasherMode.DMG
-
         # Get a temporary filepath
         f = tempfile.NamedTemporaryFile(delete=False)
         f.close()
         os.unlink(f.name)
         filepath = Path(f.name)
 
-        flashgbx_path = self.__get_flashgbx_path()
-        command = f"{flashgbx_path} --mode {mode} --action backup-rom {filepath}"
-        GBXFlasher.last_command_success = False
-        run_command_with_realtime_output(command, lambda line: self.__read_game_handler(report_progress_callback, line))
-        if not GBXFlasher.last_command_success:
-            raise RuntimeError(f"Command '{command}' has failed.")
+        try:
+            self._dump_game(cart_info, filepath, report_progress_callback)
+            with open(filepath, "rb") as f:
+                return f.read()
+        finally:
+            filepath.unlink(missing_ok=True)
+
+    def _dump_game(
+        self,
+        cart_info: CartInfo,
+        filepath: Path,
+        report_progress_callback: Callable[[float, Optional[timedelta]], None],
+    ):
+        mode = GBXFlasherMode.AGB if cart_info.support == GameSupport.GAMEBOY_ADVANCE else GBXFlasherMode.DMG
 
-        with open(filepath, "rb") as f:
-            return f.read()
+        args = ["--mode", mode.value, "--action", "backup-rom", str(filepath)]
+        self.__run_transfer(
+            cart_info,
+            mode,
+            args,
+            ROM_BACKUP_VERIFIED,
+            report_progress_callback,
+            self.__get_rom_size(cart_info),
+        )
 
     def _read_save(
         self, cart_info: CartInfo, report_progress_callback: Callable[[float, Optional[timedelta]], None]
@@ -130,12 +219,8 @@ class GBXFlasher(CartFlasher):
         os.unlink(f.name)
         filepath = Path(f.name)
 
-        flashgbx_path = self.__get_flashgbx_path()
-        command = f"{flashgbx_path} --mode {mode} --action backup-save {filepath}"
-        GBXFlasher.last_command_success = False
-        run_command_with_realtime_output(command, lambda line: self.__read_save_handler(report_progress_callback, line))
-        if not GBXFlasher.last_command_success:
-            raise RuntimeError(f"Command '{command}' has failed.")
+        args = ["--mode", mode.value, "--action", "backup-save", str(filepath)]
+        self.__run_transfer(cart_info, mode, args, SAVE_BACKUP_VERIFIED, report_progress_callback)
 
         with open(filepath, "rb") as f:
             data = f.read()
@@ -147,14 +232,8 @@ class GBXFlasher(CartFlasher):
     ) -> bytes:
         mode = GBXFlasherMode.AGB if cart_info.support == GameSupport.GAMEBOY_ADVANCE else GBXFlasherMode.DMG
 
-        flashgbx_path = self.__get_flashgbx_path()
-        command = f"{flashgbx_path} --mode {mode} --action erase-save --overwrite"
-        GBXFlasher.last_command_success = False
-        run_command_with_realtime_output(
-            command, lambda line: self.__erase_save_handler(report_progress_callback, line)
-        )
-        if not GBXFlasher.last_command_success:
-            raise RuntimeError(f"Command '{command}' has failed.")
+        args = ["--mode", mode.value, "--action", "erase-save", "--overwrite"]
+        self.__run_transfer(cart_info, mode, args, SAVE_ERASE_COMPLETED, report_progress_callback)
 
     def _write_save(
         self, cart_info: CartInfo, data: bytes, report_progress_callback: Callable[[float, Optional[timedelta]], None]
@@ -167,27 +246,147 @@ class GBXFlasher(CartFlasher):
             f.write(data)
         filepath = Path(f.name)
 
-        flashgbx_path = self.__get_flashgbx_path()
-        command = f"{flashgbx_path} --mode {mode} --action restore-save {filepath} --overwrite"
-        GBXFlasher.last_command_success = False
-        run_command_with_realtime_output(
-            command, lambda line: self.__write_save_handler(report_progress_callback, line)
+        args = ["--mode", mode.value, "--action", "restore-save", str(filepath), "--overwrite"]
+        try:
+            self.__run_transfer(cart_info, mode, args, SAVE_UPLOAD_COMPLETED, report_progress_callback, len(data))
+        finally:
+            os.remove(f.name)
+
+    def __run_transfer(
+        self,
+        cart_info: CartInfo,
+        mode: GBXFlasherMode,
+        args: List[str],
+        success_message: str,
+        report_progress_callback: Callable[[float, Optional[timedelta]], None],
+        n_bytes: Optional[int] = None,
+    ):
+        """Run a FlashGBX action transferring data, report its progress (with an ETA predicted from past operations
+        until throughput is measured), then record its duration.
+
+        Args:
+            cart_info: Cart info of the cart the action is performed on.
+            mode: Mode of the cart flasher.
+            args: FlashGBX command line arguments.
+            success_message: Message printed by FlashGBX when the action has succeeded.
+            report_progress_callback: Method to be called to report current progress of the process (in [0; 1]).
+            n_bytes: Number of bytes to transfer, if known before the action starts.
+
+        Raises:
+            RuntimeError: If the action has failed.
+        """
+        action = args[args.index("--action") + 1]
+        expected_duration = self._stats.estimate_duration(action, cart_info.support.value, n_bytes)
+        tracker = ProgressTracker(
+            report_progress_callback, self._progress_frequency, expected_duration=expected_duration
         )
 
-        os.remove(f.name)
-        if not GBXFlasher.last_command_success:
-            raise RuntimeError(f"Command '{command}' has failed.")
-
-    @classmethod
-    def __check_if_success_message_received(cls, line: str):
-        if any(success_message in line for success_message in SUCCESS_MESSAGES):
-            message = line.split(".")[0] + "."
-            message = re.sub(r"\033\[[0-9;]*m", "", message)  # remove ANSI colour
-            return True
-        return False
-
-    @classmethod
-    def __read_cart_info_handler(cls, mode: GBXFlasherMode, dto: CartInfoDTO, line: str):
+        self._last_command_success = False
+        start_time = time.monotonic()
+        tracker.start()
+        self.__run_flashgbx(args, lambda line: self.__progress_handler(tracker, success_message, line), cart_info)
+        if not self._last_command_success:
+            raise RuntimeError(f"Command '{' '.join(args)}' has failed.")
+
+        duration = time.monotonic() - start_time
+        self._stats.record(action, cart_info.support.value, mode.value, tracker.size or n_bytes, duration)
+        metrics.record(f"cart_flasher.gbx.{action}", duration)
+
+    def __run_flashgbx(
+        self,
+        args: List[str],
+        handler: Callable[[str], None],
+        cart_info: Optional[CartInfo] = None,
+    ) -> bool:
+        """Run a FlashGBX command, through the FlashGBX session when available, in its own process otherwise.
+
+        Args:
+            args: FlashGBX command line arguments.
+            handler: The function to call with each line of FlashGBX output.
+            cart_info: Cart info of the cart the command is performed on. If provided, cart header printed by FlashGBX
+                is checked against it, so that cached cart info is invalidated (or its validity extended).
+
+        Raises:
+            RuntimeError: If inserted cart does not match the provided cart info.
+
+        Returns:
+            True if FlashGBX has run until its end, False otherwise.
+        """
+        args = self.__get_device_args() + args
+        if cart_info is None:
+            return self.__run_flashgbx_command(args, handler)
+
+        header_checksums = []
+
+        def check_header_handler(line: str):
+            if line.startswith(HEADER_CHECKSUM):
+                header_checksum = re.search(r"(?<=0x)[0-9A-Fa-f]+", line)
+                header_checksums.append(header_checksum.group().strip() if header_checksum else None)
+            handler(line)
+
+        success = self.__run_flashgbx_command(args, check_header_handler)
+        if any(header_checksum != cart_info.header_checksum for header_checksum in header_checksums):
+            self._cart_info = None
+            raise RuntimeError(f"Inserted cart does not match cart info ({cart_info.id=}, {header_checksums=}).")
+
+        if self._last_command_success and header_checksums and self._cart_info is not None:
+            if self._cart_info.header_checksum == cart_info.header_checksum:
+                self._cart_info_time = time.monotonic()
+        elif not self._last_command_success:
+            self._cart_info = None
+        return success
+
+    def __run_flashgbx_command(self, args: List[str], handler: Callable[[str], None]) -> bool:
+        success = self.__run_flashgbx_process(args, handler)
+
+        # Device may have been re-plugged (on another port): look up its port again on next command
+        if not self._last_command_success:
+            self._found_device_port = None
+
+        return success
+
+    def __run_flashgbx_process(self, args: List[str], handler: Callable[[str], None]) -> bool:
+        if self._flashgbx_command is not None:
+            return run_command_with_realtime_output(self._flashgbx_command + args, handler)
+
+        session = self.__get_session()
+        if session is not None and session.is_available:
+            success = session.run(args, handler)
+            if not self._last_command_success:
+                session.reset_connection()
+
+            # Fall back to one process per command only if the session could not be started (command has not run)
+            if session.is_available:
+                return success
+
+        return run_command_with_realtime_output([self.__get_flashgbx_path()] + args, handler)
+
+    def __get_session(self) -> Optional[FlashGBXSession]:
+        """Return the FlashGBX session (created on first use), None if FlashGBX is not installed as a Python package."""
+        if self._session is None:
+            python_command = FlashGBXSession.find_python_command(self.__get_flashgbx_path())
+            if python_command is None:
+                return None
+            self._session = FlashGBXSession(python_command)
+        return self._session
+
+    def __get_device_args(self) -> List[str]:
+        """Return FlashGBX arguments selecting the device of this cart flasher (none if it is auto-detected).
+
+        Raises:
+            RuntimeError: If no device has the configured serial number.
+        """
+        device_port = self._device_port
+        if device_port is None and self._device_serial_number is not None:
+            if self._found_device_port is None:
+                self._found_device_port = find_device_port(self._device_serial_number)
+                if self._found_device_port is None:
+                    raise RuntimeError(f"Cannot find cart flasher device ({self._device_serial_number=}).")
+            device_port = self._found_device_port
+
+        return ["--device-port", device_port] if device_port is not None else []
+
+    def __read_cart_info_handler(self, mode: GBXFlasherMode, dto: CartInfoDTO, line: str):
         try:
             if line.startswith(GAME_TITLE):
                 dto.title = re.search(fr"{GAME_TITLE}:\s+(.+)", line).group(1).strip()
@@ -195,11 +394,14 @@ class GBXFlasher(CartFlasher):
                 dto.code = re.search(fr"{GAME_CODE}:\s+(.+)", line).group(1).strip()
             if mode == GBXFlasherMode.DMG and line.startswith(GAME_BOY_COLOR):
                 gamboy_color_support_str = re.search(fr"{GAME_BOY_COLOR}:\s+(.+)", line).group(1).strip()
-                dto.support = cls.__to_support(gamboy_color_support_str)
+                dto.support = self.__to_support(gamboy_color_support_str)
             if line.startswith(HEADER_CHECKSUM):
                 if INVALID_HEADER_CHECKSUM not in line:
                     dto.header_checksum = re.search(r"(?<=0x)[0-9A-Fa-f]+", line).group().strip()
-                    cls.last_command_success = True
+                    self._last_command_success = True
+            if line.startswith(ROM_SIZE):
+                rom_size = re.search(fr"{ROM_SIZE}:\s+(\d+)\s*(KiB|MiB|MB)", line)
+                dto.rom_size = int(rom_size.group(1)) * ROM_SIZE_UNITS[rom_size.group(2)] if rom_size else None
             if line.startswith(SAVE_TYPE):
                 dto.save_supported = re.search(fr"{SAVE_TYPE}:\s+(.+)", line).group(1).strip() != NONE_SAVE_TYPE
             if mode == GBXFlasherMode.DMG and line.startswith(SUPER_GAME_BOY):
@@ -210,6 +412,18 @@ class GBXFlasher(CartFlasher):
         except AttributeError:
             pass
 
+    @staticmethod
+    def __get_rom_size(cart_info: CartInfo) -> Optional[int]:
+        """Return the ROM size of a cart, from its header or else from its No-Intro reference (None if unknown)."""
+        if cart_info.rom_size:
+            return cart_info.rom_size
+
+        nointro_rom = get_nointro_rom(cart_info.game_filename, cart_info.support)
+        try:
+            return int(nointro_rom["size"]) if nointro_rom else None
+        except (KeyError, ValueError):
+            return None
+
     @classmethod
     def __to_support(cls, gamboy_color_support_str: str) -> GameSupport:
         if GAMEBOY_COLOR_NO_SUPPORT in gamboy_color_support_str:
@@ -220,69 +434,13 @@ class GBXFlasher(CartFlasher):
             return GameSupport.GAMEBOY_COLOR
         return GameSupport.GAMEBOY
 
-    @classmethod
-    def __read_game_handler(cls, callback: Callable[[float, Optional[timedelta]], None], line: str):
-        if cls.__check_if_success_message_received(line):
-            cls.last_command_success = True
-            return
-
-        if "%" in line:
-            current = max(0, min(100, int(re.search(r"\d+%", line).group()[:-1]))) / 100.0
-            eta = GBXFlasher.__get_eta(line)
-            callback(current, eta)
-        if ROM_BACKUP_VERIFIED in line:
-            callback(1.0, None)
-
-    @classmethod
-    def __read_save_handler(cls, callback: Callable[[float, Optional[timedelta]], None], line: str):
-        if cls.__check_if_success_message_received(line):
-            cls.last_command_success = True
+    def __progress_handler(self, tracker: ProgressTracker, success_message: str, line: str):
+        if success_message in line:
+            self._last_command_success = True
+            tracker.complete()
             return
 
-        if "%" in line:
-            current = max(0, min(100, int(re.search(r"\d+%", line).group()[:-1]))) / 100.0
-            eta = GBXFlasher.__get_eta(line)
-            callback(current, eta)
-        if SAVE_BACKUP_VERIFIED in line:
-            callback(1.0, None)
-
-    @classmethod
-    def __erase_save_handler(cls, callback: Callable[[float, Optional[timedelta]], None], line: str):
-        if cls.__check_if_success_message_received(line):
-            cls.last_command_success = True
-            return
-
-        if "%" in line:
-            current = max(0, min(100, int(re.search(r"\d+%", line).group()[:-1]))) / 100.0
-            eta = GBXFlasher.__get_eta(line)
-            callback(current, eta)
-        if SAVE_ERASE_COMPLETED in line:
-            callback(1.0, None)
-
-    @classmethod
-    def __write_save_handler(cls, callback: Callable[[float, Optional[timedelta]], None], line: str):
-        if cls.__check_if_success_message_received(line):
-            cls.last_command_success = True
-            return
-
-        if "%" in line:
-            current = max(0, min(100, int(re.search(r"\d+%", line).group()[:-1]))) / 100.0
-            eta = GBXFlasher.__get_eta(line)
-            callback(current, eta)
-        if SAVE_UPLOAD_COMPLETED in line:
-            callback(1.0, None)
-
-    @classmethod
-    def __get_eta(cls, line: str) -> Optional[timedelta]:
-        if "ETA" not in line:
-            return None
-        eta_str = line.split("ETA")[1].strip()
-        try:
-            eta = datetime.strptime(eta_str, "%H:%M:%S") - datetime.strptime("00:00:00", "%H:%M:%S")
-        except Exception as e:
-            logger.info(f"Unable to parse ETA ({line=}): {e}", exc_info=True)
-            return None
-        return eta
+        tracker.update(line)
 
     def __get_flashgbx_path(self) -> str:
         # FlashGBX path
@@ -0,0 +1,131 @@
+import re
+import time
+from datetime import timedelta
+from typing import Callable, Optional
+
+# FlashGBX progress line, e.g. '  1.25MiB/8.00MiB 00:00:03 [420.12KiB/s] [████      ]  15% ETA 00:00:16'
+TRANSFER_PROGRESS_REGEX = re.compile(
+    r"(?P<pos>\d+(?:\.\d+)?)(?P<pos_unit>B|KiB|MiB)/(?P<size>\d+(?:\.\d+)?)(?P<size_unit>B|KiB|MiB)"
+)
+PERCENT_PROGRESS_REGEX = re.compile(r"(?P<percent>\d+)%")
+UNIT_SIZES = {"B": 1, "KiB": 1024, "MiB": 1024 * 1024}
+
+DEFAULT_FREQUENCY = 10  # callbacks per second
+DEFAULT_SMOOTHING = 0.3  # weight of the latest throughput sample
+
+
+class ProgressTracker:
+    """Parse progress lines printed by FlashGBX and report progress through a callback.
+
+    Throughput is measured from the transferred size (or from the percentage if the size is not printed), then
+    exponentially smoothed to compute a steady ETA. Until throughput is known, ETA is computed from the expected
+    duration of the process (if provided). Callbacks are rate-limited to a maximal frequency, except for the first and
+    last ones.
+
+    Args:
+        callback: Method to be called with current progress (in [0; 1]) and ETA.
+        frequency: Maximal number of callbacks per second.
+        smoothing: Weight of the latest throughput sample in the smoothed throughput (in ]0; 1]).
+        expected_duration: Expected duration of the process in seconds (e.g. predicted from past processes).
+
+    Properties:
+        throughput: Smoothed throughput, in bytes per second (None if unknown).
+        size: Size of the transfer in bytes, as printed in progress lines (None if unknown).
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[float, Optional[timedelta]], None],
+        frequency: float = DEFAULT_FREQUENCY,
+        smoothing: float = DEFAULT_SMOOTHING,
+        expected_duration: Optional[float] = None,
+    ):
+        self._callback = callback
+        self._min_interval = 1.0 / frequency if frequency > 0 else 0.0
+        self._smoothing = smoothing
+        self._expected_duration = expected_duration
+        self._start_time = time.monotonic()
+
+        self._last_time: Optional[float] = None
+        self._last_position: Optional[float] = None
+        self._last_callback_time: Optional[float] = None
+        self._rate: Optional[float] = None  # progress units per second
+        self._in_bytes = False
+        self._size: Optional[float] = None
+
+    @property
+    def throughput(self) -> Optional[float]:
+        """Smoothed throughput, in bytes per second (None if unknown)."""
+        return self._rate if self._in_bytes else None
+
+    @property
+    def size(self) -> Optional[int]:
+        """Size of the transfer in bytes, as printed in progress lines (None if unknown)."""
+        return int(self._size) if self._in_bytes and self._size is not None else None
+
+    def start(self):
+        """Report that the process has started, with the expected duration as ETA (if provided)."""
+        self._start_time = time.monotonic()
+        self._last_callback_time = self._start_time
+        eta = timedelta(seconds=self._expected_duration) if self._expected_duration is not None else None
+        self._callback(0.0, eta)
+
+    def update(self, line: str) -> bool:
+        """Parse a line and report progress if it is a progress line.
+
+        Args:
+            line: Line printed by FlashGBX.
+
+        Returns:
+            True if the line is a progress line, False otherwise.
+        """
+        match = TRANSFER_PROGRESS_REGEX.search(line)
+        if match:
+            position = float(match.group("pos")) * UNIT_SIZES[match.group("pos_unit")]
+            size = float(match.group("size")) * UNIT_SIZES[match.group("size_unit")]
+            self._in_bytes = True
+            self._size = size
+        else:
+            match = PERCENT_PROGRESS_REGEX.search(line)
+            if not match:
+                return False
+            position, size = float(match.group("percent")), 100.0
+            self._in_bytes = False
+
+        if size <= 0:
+            return False
+
+        now = time.monotonic()
+        self._update_rate(now, position)
+
+        if self._last_callback_time is None or now - self._last_callback_time >= self._min_interval:
+            self._last_callback_time = now
+            eta = self._get_eta(now, position, size)
+            self._callback(max(0.0, min(1.0, position / size)), eta)
+        return True
+
+    def complete(self):
+        """Report that the process is complete."""
+        self._last_callback_time = time.monotonic()
+        self._callback(1.0, None)
+
+    def _get_eta(self, now: float, position: float, size: float) -> Optional[timedelta]:
+        if self._rate:
+            return timedelta(seconds=(size - position) / self._rate)
+        if self._expected_duration is not None:
+            return timedelta(seconds=max(0.0, self._expected_duration - (now - self._start_time)))
+        return None
+
+    def _update_rate(self, now: float, position: float):
+        """Update the smoothed rate with the progress made since the previous progress line."""
+        if self._last_time is not None and position < self._last_position:  # a new transfer has started
+            self._last_time = None
+            self._rate = None
+
+        if self._last_time is not None and now > self._last_time and position > self._last_position:
+            rate = (position - self._last_position) / (now - self._last_time)
+            self._rate = rate if self._rate is None else self._smoothing * rate + (1 - self._smoothing) * self._rate
+
+        if self._last_time is None or position > self._last_position:
+            self._last_time = now
+            self._last_position = position
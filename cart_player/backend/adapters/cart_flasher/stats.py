@@ -0,0 +1,121 @@
+import json
+import logging
+import statistics
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from cart_player.backend import config
+from cart_player.backend.utils.files import move_file
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::OperationStats")
+
+DEFAULT_MAX_RECORDS = 50  # per operation and support
+
+
+class OperationStats:
+    """Store of past cart flasher operations (duration, byte count, support and mode), used to predict the duration of
+    the next ones before they start.
+
+    The duration of an operation is modelled as a fixed overhead (process start, device connection, header read) plus
+    a transfer time proportional to its byte count, fitted on the most recent operations of the same kind.
+
+    Args:
+        filepath: Path to the JSON file where operations are stored. If None, operations are only kept in RAM.
+        max_records: Maximal number of operations kept per operation and support.
+    """
+
+    def __init__(self, filepath: Optional[Path] = None, max_records: int = DEFAULT_MAX_RECORDS):
+        self._filepath = Path(filepath) if filepath is not None else None
+        self._max_records = max_records
+        self._lock = threading.Lock()
+        self._records: Dict[str, List[dict]] = self._load()
+
+    def record(self, operation: str, support: str, mode: str, n_bytes: Optional[int], duration: float):
+        """Record a completed operation.
+
+        Args:
+            operation: Name of the operation (e.g. 'backup-rom').
+            support: Support of the cart (e.g. 'GAMEBOY').
+            mode: Mode of the cart flasher (e.g. 'dmg').
+            n_bytes: Number of bytes transferred (None if unknown).
+            duration: Duration of the operation in seconds.
+        """
+        record = {
+            "date": datetime.now().isoformat(),
+            "mode": mode,
+            "bytes": n_bytes,
+            "duration": duration,
+        }
+        with self._lock:
+            records = self._records.setdefault(OperationStats._get_key(operation, support), [])
+            records.append(record)
+            del records[: -self._max_records]
+            self._save()
+
+    def estimate_duration(self, operation: str, support: str, n_bytes: Optional[int]) -> Optional[float]:
+        """Predict the duration of an operation from past operations of the same kind.
+
+        Args:
+            operation: Name of the operation (e.g. 'backup-rom').
+            support: Support of the cart (e.g. 'GAMEBOY').
+            n_bytes: Number of bytes to transfer (None if unknown).
+
+        Returns:
+            Predicted duration in seconds, None if no operation of the same kind has been recorded yet.
+        """
+        with self._lock:
+            records = list(self._records.get(OperationStats._get_key(operation, support), []))
+        if not records:
+            return None
+
+        sized_records = [record for record in records if record["bytes"]]
+        if not n_bytes or not sized_records:
+            return statistics.median(record["duration"] for record in records)
+
+        overhead, seconds_per_byte = OperationStats._fit(sized_records)
+        return overhead + seconds_per_byte * n_bytes
+
+    @staticmethod
+    def _fit(records: List[dict]) -> Tuple[float, float]:
+        """Fit 'duration = overhead + seconds_per_byte * bytes' on records (least squares), falling back to a
+        proportional model if sizes do not vary enough."""
+        sizes = [record["bytes"] for record in records]
+        durations = [record["duration"] for record in records]
+        mean_size, mean_duration = statistics.fmean(sizes), statistics.fmean(durations)
+        variance = sum((size - mean_size) ** 2 for size in sizes)
+        if variance > 0:
+            covariance = sum((size - mean_size) * (d - mean_duration) for size, d in zip(sizes, durations))
+            seconds_per_byte = covariance / variance
+            overhead = mean_duration - seconds_per_byte * mean_size
+            if seconds_per_byte > 0 and overhead >= 0:
+                return overhead, seconds_per_byte
+
+        return 0.0, statistics.median(d / size for size, d in zip(sizes, durations))
+
+    def _load(self) -> Dict[str, List[dict]]:
+        if self._filepath is None or not self._filepath.is_file():
+            return {}
+
+        try:
+            return json.loads(self._filepath.read_text())
+        except (OSError, ValueError) as e:
+            logger.info(f"Unable to load operation stats, starting from scratch: {e}", exc_info=True)
+            return {}
+
+    def _save(self):
+        if self._filepath is None:
+            return
+
+        try:
+            self._filepath.parent.mkdir(parents=True, exist_ok=True)
+            tmp_filepath = self._filepath.with_suffix(self._filepath.suffix + ".tmp")
+            tmp_filepath.write_text(json.dumps(self._records))
+            move_file(tmp_filepath, self._filepath)
+        except OSError as e:
+            logger.info(f"Unable to save operation stats: {e}", exc_info=True)
+
+    @staticmethod
+    def _get_key(operation: str, support: str) -> str:
+        return f"{operation}/{support}"
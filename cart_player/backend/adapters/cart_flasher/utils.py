@@ -1,172 +1,234 @@
-import json
+import asyncio
+import codecs
+import functools
 import logging
 import os
-import xml.etree.ElementTree as ET
+import re
+import signal
+import subprocess
+import sys
+import threading
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 from cart_player.backend import config
-from cart_player.backend.resources import MD5_FOLDER_PATH, NOINTRO_FOLDER_PATH
+from cart_player.backend.utils.md5_index import get_md5_index
 from cart_player.backend.utils.models import GameRegion, GameSupport
+from cart_player.backend.utils.nointro import get_nointro_index
+from cart_player.backend.utils.resource_database import get_resource_database
 
 logger = logging.getLogger(f"{config.LOGGER_NAME}::bash")
 
+READ_CHUNK_SIZE = 64 * 1024
+CANCEL_CHECK_INTERVAL = 0.5  # seconds
+KILL_TIMEOUT = 1  # seconds
+LINE_SEPARATOR_REGEX = re.compile(r"\r\n?|\n")  # progress is reported with carriage returns
 
-def run_command_with_realtime_output(command: str, handler: Callable[[str], None]) -> bool:
+
+class LineSplitter:
+    """Incrementally split a stream of bytes into lines, on carriage returns and newlines.
+
+    Args:
+        encoding: Encoding of the stream. Undecodable bytes are replaced.
+    """
+
+    def __init__(self, encoding: str = "utf-8"):
+        self._decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+        self._buffer = ""
+
+    def feed(self, chunk: bytes) -> List[str]:
+        """Return the lines completed by a chunk of the stream."""
+        self._buffer += self._decoder.decode(chunk)
+        *lines, self._buffer = LINE_SEPARATOR_REGEX.split(self._buffer)
+        return lines
+
+    def flush(self) -> List[str]:
+        """Return the last line of the stream, if not terminated by a line separator."""
+        self._buffer += self._decoder.decode(b"", final=True)
+        lines = [self._buffer] if self._buffer else []
+        self._buffer = ""
+        return lines
+
+
+def run_command_with_realtime_output(
+    command: List[str],
+    handler: Callable[[str], None],
+    timeout: float = 10,
+    cancel_event: Optional[threading.Event] = None,
+) -> bool:
     """Runs the given command as a subprocess and calls the given handler
     function with each line of the subprocess's output in real time.
 
+    The subprocess is started in its own process group, which is killed on timeout or cancellation.
+
     Args:
-        command: The command to run as a subprocess.
+        command: The command to run as a subprocess (program and arguments).
         handler: The function to call with each line of the subprocess's output.
+        timeout: Maximal time in seconds to wait for the subprocess's output.
+        cancel_event: Event to set for cancelling the subprocess.
 
     Returns:
-        True if the subprocess completed successfully, False otherwise.
+        True if the subprocess completed, False otherwise.
     """
-    if os.name == 'nt':  # for Windows
-        import subprocess
-
-        # Start the subprocess and redirect its standard input and output streams
-        try:
-            logger.debug(command)
-            process = subprocess.Popen(
-                command.split(" "), stdout=subprocess.PIPE, stderr=subprocess.PIPE, shell=True, universal_newlines=True
-            )
-        except subprocess.SubprocessError as e:
-            logger.error(f"Failed to start subprocess: {e}", exc_info=True)
-            return False
-
-        # Loop until the subprocess has finished running
-        while process.poll() is None:
-            if not process_data(process, handler):
+    return asyncio.run(run_command(command, handler, timeout, cancel_event))
+
+
+async def run_command(
+    command: List[str],
+    handler: Callable[[str], None],
+    timeout: float = 10,
+    cancel_event: Optional[threading.Event] = None,
+) -> bool:
+    """Coroutine version of `run_command_with_realtime_output` (also cancelled when the awaiting task is cancelled)."""
+    command = get_native_command_prefix() + command
+    logger.debug(command)
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+            **_get_process_group_kwargs(),
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Failed to start subprocess: {e}", exc_info=True)
+        return False
+
+    splitter = LineSplitter()
+    idle_time = 0.0
+    try:
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"Subprocess cancelled ({command=})")
                 return False
-        return True
 
-    elif os.name == 'posix':  # for macOS and Linux
-        import pexpect
-
-        # Start the subprocess and redirect its standard input and output streams
-        try:
-            logger.debug(command)
-            command_args = command.split(" ")
-            child = pexpect.spawn(
-                "arch -arm64 " + " ".join(command_args), encoding="utf-8", timeout=10
-            )  # TODO detect real arch automatically (difficult under rosetta2)
-        except pexpect.ExceptionPexpect as e:
-            logger.error(f"Failed to start subprocess: {e}", exc_info=True)
-            return False
-
-        # Loop until the subprocess has finished running
-        while child.isalive():
-            if not process_data(child, handler):
-                return False
+            try:
+                chunk = await asyncio.wait_for(process.stdout.read(READ_CHUNK_SIZE), CANCEL_CHECK_INTERVAL)
+            except asyncio.TimeoutError:
+                idle_time += CANCEL_CHECK_INTERVAL
+                if idle_time >= timeout:
+                    logger.error(f"Subprocess timed out ({command=})")
+                    return False
+                continue
+
+            idle_time = 0.0
+            lines = splitter.feed(chunk) if chunk else splitter.flush()
+            for line in lines:
+                line = line.strip()
+                if line:
+                    logger.debug(line)
+                    handler(line)
+            if not chunk:
+                break
+
+        await process.wait()
         return True
+    finally:
+        if process.returncode is None:
+            await _kill_process_group(process)
 
-    else:
-        raise RuntimeError("Unsupported operating system")
 
+@functools.lru_cache(maxsize=None)
+def get_native_command_prefix() -> List[str]:
+    """Return the prefix running a command natively. On macOS, when running under Rosetta 2 (x86_64 build on Apple
+    silicon), commands have to be run with 'arch -arm64' to reach the native architecture.
+    """
+    if sys.platform != "darwin":
+        return []
+
+    try:
+        result = subprocess.run(
+            ["sysctl", "-n", "sysctl.proc_translated"],
+            capture_output=True,
+            text=True,
+            timeout=KILL_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.info(f"Unable to determine if running under Rosetta 2: {e}", exc_info=True)
+        return []
+
+    return ["arch", "-arm64"] if result.stdout.strip() == "1" else []
+
+
+def find_device_port(serial_number: str) -> Optional[str]:
+    """Return the serial port of the USB device with the given serial number, None if not found (or if pyserial, which
+    is installed along with FlashGBX, is not available).
+    """
+    try:
+        from serial.tools import list_ports
+    except ImportError:
+        logger.error("Cannot look for cart flasher devices by serial number, pyserial is not installed.")
+        return None
 
-def process_data(process, handler):
-    """Processes the data from the subprocess.
+    return next((port.device for port in list_ports.comports() if port.serial_number == serial_number), None)
 
-    Args:
-        process: The subprocess object.
-        handler: The function to call with each line of the subprocess's output.
 
-    Returns:
-        True if the data was processed successfully, False otherwise.
-    """
+def _get_process_group_kwargs() -> dict:
     if os.name == 'nt':  # for Windows
-        # Read a line from the subprocess's standard output stream
-        try:
-            line = process.stdout.readline()
-            if not line:
-                return True
-        except UnicodeDecodeError:
-            logger.error("Error decoding subprocess output: {e}", exc_info=True)
-            return False
-
-        # Call the handler function with the received data
-        logger.debug(line.strip())
-        handler(line.strip())
-        return True
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
 
-    elif os.name == 'posix':  # for macOS and Linux
-        import pexpect
-
-        # Expect a newline in the subprocess's output
-        try:
-            process.expect("\r|\n")
-        except pexpect.TIMEOUT:
-            logger.error("Subprocess timed out: {e}", exc_info=True)
-            return False
-        except pexpect.EOF:
-            return True
-
-        # Call the handler function with the received data
-        data = process.before.strip()
-        if data:
-            logger.debug(data)
-            handler(data)
-        return True
 
+async def _kill_process_group(process: asyncio.subprocess.Process):
+    """Terminate the process group of a subprocess, then kill it if still running after KILL_TIMEOUT."""
+    if os.name == 'nt':  # for Windows
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)], capture_output=True)
     else:
-        raise RuntimeError("Unsupported operating system")
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    try:
+        await asyncio.wait_for(process.wait(), KILL_TIMEOUT)
+    except asyncio.TimeoutError:
+        if os.name != 'nt':
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        if process.returncode is None:
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        await process.wait()
 
 
 def get_name(title: str, code: str, header_checksum: str, support: GameSupport) -> str:
+    # Use cart identity resolved offline if available
+    resource_database = get_resource_database()
+    if resource_database is not None:
+        cart_identity = resource_database.find_cart_identity(title, code, header_checksum, support)
+        if cart_identity is not None:
+            return cart_identity.name
+
     # Get md5
     md5 = get_md5(title, code, header_checksum, support)
     if not md5:
         return None
 
-    # Determine which files to use for retrieving nointro info
-    filename = {
-        GameSupport.GAMEBOY: "Nintendo - Game Boy",
-        GameSupport.GAMEBOY_OR_GAMEBOY_COLOR: "Nintendo - Game Boy Color",
-        GameSupport.GAMEBOY_COLOR: "Nintendo - Game Boy Color",
-        GameSupport.GAMEBOY_ADVANCE: "Nintendo - Game Boy Advance",
-    }[support]
-    nointro_filepath = NOINTRO_FOLDER_PATH / Path(f"{filename}.xml")
-
-    # Parse the nointro file and extract name
-    tree = ET.parse(nointro_filepath)
-    root = tree.getroot()
-    entry = root.find(".//rom[@md5='{}']".format(md5))
-    rom_name = entry.get("name")
+    # Use compiled resources if available
+    if resource_database is not None:
+        return resource_database.find_nointro_name(md5, support)
+
+    # Look up name in the No-Intro index (streamed once)
+    nointro_rom = get_nointro_index(support).find("md5", md5)
+    rom_name = nointro_rom.get("name") if nointro_rom else None
     name = Path(rom_name).stem if rom_name else None
 
     return name
 
 
 def get_md5(title: str, code: Optional[str], header_checksum: str, support: GameSupport) -> str:
-    # Determine which files to use for retrieving md5
-    filename = {
-        GameSupport.GAMEBOY: "Nintendo - Game Boy",
-        GameSupport.GAMEBOY_OR_GAMEBOY_COLOR: "Nintendo - Game Boy Color",
-        GameSupport.GAMEBOY_COLOR: "Nintendo - Game Boy Color",
-        GameSupport.GAMEBOY_ADVANCE: "Nintendo - Game Boy Advance",
-    }[support]
-    md5_filepath = MD5_FOLDER_PATH / Path(f"{filename}.json")
-
-    # Parse the md5 file and extract md5
-    with open(md5_filepath, "r") as file:
-        md5_references = json.load(file)
-    key = next(
-        (
-            k
-            for k in md5_references.keys()
-            if k.startswith(title) and (not code or code in k) and k.endswith(header_checksum)
-        ),
-        None,
-    )
-    md5 = md5_references.get(key, None)
-
-    # Retry without code if it failed
-    if code and not md5:
-        return get_md5(title, None, header_checksum, support)
-
-    return md5
+    # Use compiled resources if available
+    resource_database = get_resource_database()
+    if resource_database is not None:
+        return resource_database.find_md5(title, code, header_checksum, support)
+
+    # Look up md5 in the md5 index (keys starting with title, loaded once)
+    return get_md5_index(support).find(title, code, header_checksum)
 
 
 def get_region(name: Optional[str]) -> GameRegion:
@@ -1,2 +1,3 @@
 from .game_image_library import LibretroImageLibrary
+from .game_library_cache import SqliteGameLibraryCache
 from .game_metadata_library import CartMetadataLibrary, LaunchboxMetadataLibrary, LibretroMetadataLibrary
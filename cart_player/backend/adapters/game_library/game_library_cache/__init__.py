@@ -0,0 +1 @@
+from .sqlite_game_library_cache import SqliteGameLibraryCache
@@ -0,0 +1,146 @@
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from cart_player.backend import config
+from cart_player.backend.domain.models import CartInfo, GameImage, GameMetadata
+from cart_player.backend.domain.ports import GameLibraryCache
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::SqliteGameLibraryCache")
+
+DAY = 24 * 60 * 60
+DEFAULT_METADATA_TTL = 90 * DAY
+DEFAULT_METADATA_MISS_TTL = 30 * DAY  # metadata only depends on resources, already part of the key
+DEFAULT_IMAGE_TTL = 90 * DAY
+DEFAULT_IMAGE_MISS_TTL = 1 * DAY  # images are fetched online, a miss may be due to a network failure
+
+METADATA_KIND = "metadata"
+IMAGE_KIND = "image"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT,
+    support TEXT,
+    cart_id TEXT,
+    version TEXT,
+    expires REAL,
+    data BLOB,
+    PRIMARY KEY (kind, support, cart_id)
+) WITHOUT ROWID;
+"""
+
+
+class SqliteGameLibraryCache(GameLibraryCache):
+    """Cache of game library lookups, persisted in a SQLite file.
+
+    Entries are keyed by cart (support and ID) and by resource version: entries cached from other resources are
+    ignored, and removed when the cache is opened. A miss is stored as an entry without data, usually with a shorter
+    TTL than a hit. Errors of the cache file are logged and handled as cache misses.
+
+    Args:
+        filepath: Path to the SQLite file.
+        resource_version: Version of the resources lookups are based on (see `get_resource_version`).
+        metadata_ttl: Time to live of found game metadata, in seconds.
+        metadata_miss_ttl: Time to live of game metadata not found, in seconds.
+        image_ttl: Time to live of found game images, in seconds.
+        image_miss_ttl: Time to live of game images not found, in seconds.
+    """
+
+    def __init__(
+        self,
+        filepath: Path,
+        resource_version: str,
+        metadata_ttl: float = DEFAULT_METADATA_TTL,
+        metadata_miss_ttl: float = DEFAULT_METADATA_MISS_TTL,
+        image_ttl: float = DEFAULT_IMAGE_TTL,
+        image_miss_ttl: float = DEFAULT_IMAGE_MISS_TTL,
+    ):
+        self._filepath = Path(filepath)
+        self._resource_version = resource_version
+        self._ttls = {
+            (METADATA_KIND, True): metadata_ttl,
+            (METADATA_KIND, False): metadata_miss_ttl,
+            (IMAGE_KIND, True): image_ttl,
+            (IMAGE_KIND, False): image_miss_ttl,
+        }
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = self._connect()
+
+    def get_metadata(self, cart_info: CartInfo) -> Optional[GameMetadata]:
+        found, data = self._get(METADATA_KIND, cart_info)
+        if not found:
+            return None
+
+        return GameMetadata.create_from_bytes(data) if data is not None else GameMetadata()
+
+    def save_metadata(self, cart_info: CartInfo, game_metadata: GameMetadata):
+        self._save(METADATA_KIND, cart_info, game_metadata.bytes() if not game_metadata.is_empty() else None)
+
+    def get_image(self, cart_info: CartInfo) -> Optional[GameImage]:
+        found, data = self._get(IMAGE_KIND, cart_info)
+        if not found:
+            return None
+
+        return GameImage(data=data)
+
+    def save_image(self, cart_info: CartInfo, game_image: GameImage):
+        self._save(IMAGE_KIND, cart_info, game_image.data or None)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the cache file, and remove expired entries and entries of other resource versions."""
+        try:
+            self._filepath.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self._filepath, check_same_thread=False)
+            with connection:
+                connection.executescript(SCHEMA)
+                connection.execute(
+                    "DELETE FROM entries WHERE version != ? OR expires <= ?",
+                    (self._resource_version, time.time()),
+                )
+            return connection
+        except (OSError, sqlite3.Error) as e:
+            logger.info(f"Unable to open game library cache, lookups are not cached ({self._filepath=}): {e}")
+            return None
+
+    def _get(self, kind: str, cart_info: CartInfo) -> tuple:
+        """Return whether a cart has a valid entry, and its data (None for a miss)."""
+        with self._lock:
+            if self._connection is None:
+                return False, None
+
+            try:
+                row = self._connection.execute(
+                    "SELECT data FROM entries WHERE kind = ? AND support = ? AND cart_id = ? AND version = ? "
+                    "AND expires > ?",
+                    (kind, cart_info.support.value, cart_info.id, self._resource_version, time.time()),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.info(f"Unable to read game library cache ({kind=}, {cart_info.id=}): {e}")
+                return False, None
+
+        return (True, row[0]) if row else (False, None)
+
+    def _save(self, kind: str, cart_info: CartInfo, data: Optional[bytes]):
+        """Store the entry of a cart (a miss if data is None)."""
+        expires = time.time() + self._ttls[(kind, data is not None)]
+        with self._lock:
+            if self._connection is None:
+                return
+
+            try:
+                with self._connection:
+                    self._connection.execute(
+                        "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                        (kind, cart_info.support.value, cart_info.id, self._resource_version, expires, data),
+                    )
+            except sqlite3.Error as e:
+                logger.info(f"Unable to write game library cache ({kind=}, {cart_info.id=}): {e}")
@@ -1,7 +1,11 @@
-from cart_player.backend.adapters.game_library.utils import LaunchboxMetadataParser
+import functools
+import json
+
+from cart_player.backend.adapters.game_library.utils import LaunchboxIndex, LaunchboxMetadataParser
 from cart_player.backend.domain.models import CartInfo, GameMetadata
 from cart_player.backend.domain.ports import GameMetadataLibrary
 from cart_player.backend.utils.models import GameSupport
+from cart_player.backend.utils.resource_database import get_cart_identity, get_resource_database
 
 BASE_PATH = "./cart_player/backend/resources/launchbox"
 
@@ -13,19 +17,26 @@ class LaunchboxMetadataLibrary(GameMetadataLibrary):
     def get_metadata(self, cart_info: CartInfo) -> GameMetadata:
         game_metadata = GameMetadata()
 
-        # Browse all metadat fields
-        support_filename = self._get_support_filename(cart_info.support)
-
-        # Load text
-        filepath = f"{BASE_PATH}/{support_filename}"
-        with open(filepath, "r", encoding="utf-8") as f:
-            text = f.read()
-
-        # Parse text and merge extracted game metadata with current one
-        game_metadata.add_from(self.parser.parse_text(text, cart_info))
+        # Use compiled resources if available
+        resource_database = get_resource_database()
+        if resource_database is not None:
+            cart_identity = get_cart_identity(resource_database, cart_info)
+            if cart_identity is not None:  # best entry already known
+                entry = None
+                if cart_identity.launchbox_name is not None:
+                    entry = resource_database.get_launchbox_entry(cart_identity.launchbox_name, cart_info.support)
+                game_metadata.add_from(self.parser.parse_entry(entry))
+                return game_metadata
+
+        # Look up the entry best matching the cart in indexed entries (loaded once per platform)
+        index = self._get_index(cart_info.support)
+        game_metadata.add_from(self.parser.parse_index(index, cart_info))
 
         return game_metadata
 
+    def _get_index(self, support: GameSupport) -> LaunchboxIndex:
+        return _load_index(self._get_support_filename(support), support)
+
     def _get_support_filename(cls, support: GameSupport) -> str:
         return {
             GameSupport.GAMEBOY: "Nintendo - Game Boy.json",
@@ -33,3 +44,14 @@ class LaunchboxMetadataLibrary(GameMetadataLibrary):
             GameSupport.GAMEBOY_COLOR: "Nintendo - Game Boy Color.json",
             GameSupport.GAMEBOY_ADVANCE: "Nintendo - Game Boy Advance.json",
         }[support]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_index(support_filename: str, support: GameSupport) -> LaunchboxIndex:
+    """Load and index the Launchbox entries of a platform, from compiled resources if available."""
+    resource_database = get_resource_database()
+    if resource_database is not None:
+        return LaunchboxIndex(resource_database.get_launchbox_entries(support))
+
+    with open(f"{BASE_PATH}/{support_filename}", "r", encoding="utf-8") as f:
+        return LaunchboxIndex(json.load(f))
@@ -1,18 +1,21 @@
+import functools
 from collections import defaultdict
 
 from cart_player.backend.adapters.game_library.utils import LibretroMetadatField, LibretroMetadatParser
 from cart_player.backend.domain.models import CartInfo, GameMetadata
 from cart_player.backend.domain.ports import GameMetadataLibrary
+from cart_player.backend.utils.clrmamepro import GameRecordIndex, load_metadat_records
 from cart_player.backend.utils.models import GameSupport
+from cart_player.backend.utils.resource_database import get_cart_identity, get_resource_database
 
 BASE_PATH = "./cart_player/backend/resources/libretro/libretro-database/metadat"
 LIBRETRO_METADAT_MAP = defaultdict()
 LIBRETRO_METADAT_MAP.update(
     {
-        LibretroMetadatField.GENRE: f"{BASE_PATH}/genre",
-        LibretroMetadatField.DEVELOPER: f"{BASE_PATH}/developer",
-        LibretroMetadatField.RELEASEYEAR: f"{BASE_PATH}/releaseyear",
-        LibretroMetadatField.CRC: f"{BASE_PATH}/developer",
+        LibretroMetadatField.GENRE: "genre",
+        LibretroMetadatField.DEVELOPER: "developer",
+        LibretroMetadatField.RELEASEYEAR: "releaseyear",
+        LibretroMetadatField.CRC: "developer",
     }
 )
 
@@ -24,21 +27,26 @@ class LibretroMetadataLibrary(GameMetadataLibrary):
     def get_metadata(self, cart_info: CartInfo) -> GameMetadata:
         game_metadata = GameMetadata()
 
-        # Browse all metadat fields
-        support_filename = self._get_support_filename(cart_info.support)
+        # Find the record of the game (values of all metadat fields), from compiled resources if available
+        resource_database = get_resource_database()
+        if resource_database is not None:
+            cart_identity = get_cart_identity(resource_database, cart_info)
+            if cart_identity is not None:
+                record = cart_identity.libretro
+            else:
+                record = resource_database.find_libretro_record(cart_info.id, cart_info.support)
+        else:
+            record = self._get_records(cart_info.support).find(cart_info.id)
+
+        # Merge game metadata extracted from each field
         for field in LibretroMetadatField:
-            # Load text
-            base_filepath = LIBRETRO_METADAT_MAP[field]
-            filepath = f"{base_filepath}/{support_filename}"
-            with open(filepath, "r") as f:
-                text = f.read()
-
-            # Parse text and merge extracted game metadata with current one
-            parser = self.parsers[field]
-            game_metadata.add_from(parser.parse_text(text, cart_info))
+            game_metadata.add_from(self.parsers[field].parse_record(record))
 
         return game_metadata
 
+    def _get_records(self, support: GameSupport) -> GameRecordIndex:
+        return _load_records(self._get_support_filename(support))
+
     def _get_support_filename(cls, support: GameSupport) -> str:
         return {
             GameSupport.GAMEBOY: "Nintendo - Game Boy.dat",
@@ -46,3 +54,10 @@ class LibretroMetadataLibrary(GameMetadataLibrary):
             GameSupport.GAMEBOY_COLOR: "Nintendo - Game Boy Color.dat",
             GameSupport.GAMEBOY_ADVANCE: "Nintendo - Game Boy Advance.dat",
         }[support]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_records(support_filename: str) -> GameRecordIndex:
+    """Load the game records of a platform, merging the metadat files of all fields (each file is parsed once)."""
+    folders = {field.value: folder for field, folder in LIBRETRO_METADAT_MAP.items()}
+    return load_metadat_records(BASE_PATH, support_filename, folders)
@@ -1,3 +1,3 @@
 from .game_image_parsers import LibretroImageParser
-from .game_metadata_parsers import LaunchboxMetadataParser, LibretroMetadatField, LibretroMetadatParser
+from .game_metadata_parsers import LaunchboxIndex, LaunchboxMetadataParser, LibretroMetadatField, LibretroMetadatParser
 from .website_loader import ResponseType, WebsiteLoader
@@ -1,2 +1,2 @@
-from .launchbox_metadata_parser import LaunchboxMetadataParser
+from .launchbox_metadata_parser import LaunchboxIndex, LaunchboxMetadataParser
 from .libretro_metadata_parser import LibretroMetadatField, LibretroMetadatParser
@@ -1,8 +1,10 @@
+import bisect
 import json
 import re
-from typing import Dict, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from unidecode import unidecode
 
 from cart_player.backend.domain.models import CartInfo, GameMetadata
@@ -11,27 +13,128 @@ from .game_metadata_parser import GameMetadataParser
 
 DESCR_KEY = "descr"
 RELEASE_KEY = "release"
+MIN_RATIO = 0.8  # minimal matching ratio between the name of a game and its entry
+
+
+class LaunchboxIndex:
+    """Launchbox entries of a platform, with their names preprocessed once and indexed for fuzzy matching.
+
+    Matching returns the same entry as scoring every entry with `token_set_ratio` (the first best one), but only scores
+    the entries that can be close enough:
+    - an entry sharing no token with the name scores the ratio of their sorted tokens, which is at most
+      200 * min(la, lb) / (la + lb) (la and lb being the lengths of the sorted tokens), so entries are also indexed
+      by length;
+    - other entries are found through an inverted index of tokens.
+
+    Args:
+        entries: Launchbox entries ('descr' and 'release'), by name (in order of the Launchbox file).
+    """
+
+    def __init__(self, entries: Dict[str, Dict[str, Optional[str]]]):
+        self._entries = entries
+        self._names = list(entries.keys())
+        self._preprocessed_names = [LaunchboxMetadataParser.preprocess_string(name) for name in self._names]
+        self._tokens: List[Set[str]] = [set(name.split()) for name in self._preprocessed_names]
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for i, (name, tokens) in enumerate(zip(self._preprocessed_names, self._tokens)):
+            self._exact.setdefault(name, i)
+            for token in tokens:
+                self._postings[token].append(i)
+        self._lengths = sorted((LaunchboxIndex._get_length(tokens), i) for i, tokens in enumerate(self._tokens))
+
+    def get(self, name: str) -> Optional[Dict[str, Optional[str]]]:
+        """Return the entry with the given name, None if there is none."""
+        return self._entries.get(name, None)
+
+    def find(self, name: str) -> Tuple[Optional[str], float]:
+        """Find the entry best matching a game name (the first one if several entries match as well).
+
+        Args:
+            name: Preprocessed name of the game (see `LaunchboxMetadataParser.preprocess_string`).
+
+        Returns:
+            Name of the best entry and its matching ratio (in [0; 1]), (None, 0) if no entry is close enough.
+        """
+        tokens = set(name.split())
+        if not tokens:
+            return None, 0.0
+
+        # Entries sharing a token
+        candidates = set()
+        for token in tokens:
+            candidates.update(self._postings.get(token, []))
+
+        # Exact match: best entry is the first one whose tokens include, or are included in, those of the name
+        exact = self._exact.get(name, None)
+        if exact is not None:
+            i = min(i for i in candidates if i <= exact and (self._tokens[i] <= tokens or tokens <= self._tokens[i]))
+            return self._names[i], 1.0
+
+        # Entries sharing no token, with a length allowing a ratio above minimal ratio
+        length = LaunchboxIndex._get_length(tokens)
+        start = bisect.bisect_left(self._lengths, (int(length * MIN_RATIO / (2 - MIN_RATIO)), -1))
+        end = bisect.bisect_right(self._lengths, (int(length * (2 - MIN_RATIO) / MIN_RATIO) + 1, len(self._names)))
+        candidates.update(
+            i
+            for other_length, i in self._lengths[start:end]
+            if 2 * min(length, other_length) >= MIN_RATIO * (length + other_length)
+        )
+
+        candidates = sorted(candidates)
+        result = process.extractOne(
+            name,
+            [self._preprocessed_names[i] for i in candidates],
+            scorer=fuzz.token_set_ratio,
+            processor=None,
+            score_cutoff=MIN_RATIO * 100,
+        )
+        if result is None or result[1] / 100 <= MIN_RATIO:
+            return None, 0.0
+
+        _, score, i = result
+        return self._names[candidates[i]], score / 100
+
+    @staticmethod
+    def _get_length(tokens: Set[str]) -> int:
+        """Return the length of sorted tokens (as compared by `token_set_ratio`)."""
+        return len(" ".join(sorted(tokens)))
 
 
 class LaunchboxMetadataParser(GameMetadataParser):
     def _parse_text(self, text: str, cart_info: CartInfo) -> GameMetadata:
-        name = LaunchboxMetadataParser._preprocess_string(cart_info.base_name)
         db: Dict[str, Dict[str, Optional[str]]] = json.loads(text)
-        entries = [(LaunchboxMetadataParser._preprocess_string(entry[0]), entry[1]) for entry in db.items()]
-        entries.sort(key=lambda entry: LaunchboxMetadataParser._ratio(name, entry[0]), reverse=True)
+        return self.parse_index(LaunchboxIndex(db), cart_info)
+
+    def parse_index(self, index: LaunchboxIndex, cart_info: CartInfo) -> GameMetadata:
+        """Extract game metadata from indexed Launchbox entries (see `LaunchboxIndex`, built once per platform).
+
+        Args:
+            index: Indexed Launchbox entries.
+            cart_info: Cart info.
 
-        entry_data = entries[0] if LaunchboxMetadataParser._ratio(name, entries[0][0]) > 0.8 else None
-        if not entry_data:
+        Returns:
+            Game metadata of the entry best matching the cart, empty if none is close enough.
+        """
+        name, _ = index.find(LaunchboxMetadataParser.preprocess_string(cart_info.base_name))
+        return self.parse_entry(index.get(name) if name is not None else None)
+
+    def parse_entry(self, entry: Optional[Dict[str, Optional[str]]]) -> GameMetadata:
+        """Extract game metadata from the Launchbox entry of a game (e.g. found in compiled resources).
+
+        Args:
+            entry: Launchbox entry ('descr' and 'release'), None if the game has no entry.
+
+        Returns:
+            Game metadata of the entry.
+        """
+        if not entry:
             return GameMetadata()
 
-        return GameMetadata(description=entry_data[1][DESCR_KEY] or None, release=entry_data[1][RELEASE_KEY] or None)
+        return GameMetadata(description=entry[DESCR_KEY] or None, release=entry[RELEASE_KEY] or None)
 
     @staticmethod
-    def _preprocess_string(s):
+    def preprocess_string(s):
         s = unidecode(s.lower())
         s = re.sub(r'[^a-z0-9 ]', '', s)
         return s
-
-    @staticmethod
-    def _ratio(seq1: str, seq2: str) -> float:
-        return fuzz.token_set_ratio(seq1, seq2) / 100
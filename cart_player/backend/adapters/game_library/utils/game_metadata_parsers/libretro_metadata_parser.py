@@ -1,7 +1,9 @@
 from collections import defaultdict
 from enum import Enum
+from typing import Dict, Optional
 
 from cart_player.backend.domain.models import CartInfo, GameMetadata
+from cart_player.backend.utils.clrmamepro import GameRecordIndex, parse_metadat_records
 
 from .game_metadata_parser import GameMetadataParser
 
@@ -21,46 +23,41 @@ class LibretroMetadatParser(GameMetadataParser):
         self.field = field
 
     def _parse_text(self, text: str, cart_info: CartInfo) -> GameMetadata:
-        field_values = defaultdict(str)
-        field_name = self.field.value
         try:
-            field_values[field_name] = self._find(field_name, text, cart_info.id)
+            records = GameRecordIndex()
+            for name, values in parse_metadat_records(text, [self.field.value]):
+                records.add(name, values)
         except Exception:
             return GameMetadata()
 
-        return GameMetadata(
-            genre=field_values.get("genre", None),
-            developer=field_values.get("developer", None),
-            release=field_values.get("releaseyear", None),
-            crc=field_values.get("crc", None),
-        )
+        return self.parse_record(records.find(cart_info.id))
 
-    @classmethod
-    def _find(cls, field_name: str, text: str, cart_id: str) -> GameMetadata:
-        """Find the value of a field in the given text, based on the given cart ID.
+    def parse_record(self, record: Optional[Dict[str, Optional[str]]]) -> GameMetadata:
+        """Build game metadata from the record of a game (values of the fields read from metadat files, see
+        `GameRecordIndex`).
 
         Args:
-            field_name: Name of the field to find.
-            text: Text to search for the field.
-            cart_id: ID of the game cartridge to search for.
+            record: Values of the fields, by field name, None if the game has no record.
 
         Returns:
-            Value of the field.
+            Game metadata holding the value of the field.
         """
-        # Split the content of the .dat file into lines
-        lines = text.split("\n")
+        return self.parse_value(record.get(self.field.value, None) if record else None)
 
-        # Iterate through the lines of the .dat file
-        for i, line in enumerate(lines):
-            if "comment" in line:
-                comment = " ".join(line.split(" ")[1:]).strip('"')
-                # Check if the comment matches the given cart_id
-                if comment in cart_id or cart_id in comment:
-                    # Find the next line with field_name
-                    for j in range(i + 1, len(lines)):
-                        if field_name in lines[j]:
-                            # Extract and return the value after field_name
-                            return " ".join(lines[j].split(" ")[1:]).strip('"')
+    def parse_value(self, value: Optional[str]) -> GameMetadata:
+        """Build game metadata from the value of the field (already found, e.g. in compiled resources).
+
+        Args:
+            value: Value of the field, None if not found.
 
-        # Return None if the cart_id was not found
-        return None
+        Returns:
+            Game metadata holding the value.
+        """
+        field_values = defaultdict(str)
+        field_values[self.field.value] = value
+        return GameMetadata(
+            genre=field_values.get("genre", None),
+            developer=field_values.get("developer", None),
+            release=field_values.get("releaseyear", None),
+            crc=field_values.get("crc", None),
+        )
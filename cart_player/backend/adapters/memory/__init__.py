@@ -1,2 +1,4 @@
+from .cached_memory import CachedMemory
 from .dummy_memory import DummyMemory
 from .local_memory import LocalMemory
+from .write_behind_memory import WriteBehindMemory
@@ -0,0 +1,237 @@
+import logging
+import threading
+from collections import OrderedDict
+from copy import copy
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from cart_player.backend.domain.dtos import MemoryConfiguration
+from cart_player.backend.domain.models import CartInfo, CartSummary, GameData
+from cart_player.backend.domain.ports import Memory
+from cart_player.backend.utils.models import GameDataType
+from cart_player.core import config, metrics
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::CachedMemory")
+
+# Small game data read on every refresh; games and saves are not worth keeping in RAM
+CACHED_TYPES = [GameDataType.CART, GameDataType.METADATA, GameDataType.IMAGE]
+DEFAULT_MAX_SIZE = 32 * 1024 * 1024
+
+
+class CachedEntry:
+    """Game data kept in cache.
+
+    Args:
+        game_data: Game data (with content).
+        version: Version of game data in decorated memory when it has been cached.
+
+    Attributes:
+        game_data: Game data (with content).
+        version: Version of game data in decorated memory when it has been cached.
+
+    Properties:
+        size: Approximate size of the entry in bytes.
+    """
+
+    def __init__(self, game_data: GameData, version: str):
+        self.game_data = game_data
+        self.version = version
+
+    @property
+    def size(self) -> int:
+        """Approximate size of the entry in bytes."""
+        return len(self.game_data.content or b"") + len(self.game_data.name) + len(self.version)
+
+
+class CachedMemory(Memory):
+    """Memory decorator keeping recently used game data in RAM (least recently used ones are evicted first).
+
+    Only carts, metadata and images are cached, with their content. Cached game data is checked for freshness against
+    the decorated memory (see `Memory.get_version`) before being served. Saves are written through the decorated
+    memory, then cached.
+
+    Hits, misses and evictions are available through `cart_player.core.metrics` ('memory.cache.*').
+
+    Args:
+        memory: Decorated memory.
+        max_size: Maximal size of cached game data in bytes.
+    """
+
+    def __init__(self, memory: Memory, max_size: int = DEFAULT_MAX_SIZE):
+        self._memory = memory
+        self._max_size = max_size
+        self._entries: OrderedDict[Tuple[GameDataType, str], CachedEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.RLock()
+
+    def save(self, cart_info: CartInfo, content: bytes, type: GameDataType, metadata: dict = {}):
+        self._memory.save(cart_info, content, type, metadata)
+        if type not in CACHED_TYPES:
+            return
+
+        name = CachedMemory._get_name(cart_info, type)
+        version = self._memory.get_version(name, type)
+        with self._lock:
+            self._evict(type, name)
+            if version is not None:
+                game_data = GameData(
+                    name=name,
+                    date=datetime.now(),
+                    content=content,
+                    type=type,
+                    extension=Path(name).suffix,
+                    metadata=dict(metadata) or None,
+                )
+                self._put(type, name, CachedEntry(game_data, version))
+
+    def save_file(
+        self,
+        cart_info: CartInfo,
+        filepath: Path,
+        type: GameDataType,
+        metadata: dict = {},
+    ) -> Dict[str, str]:
+        checksums = self._memory.save_file(cart_info, filepath, type, metadata)
+        if type in CACHED_TYPES:
+            with self._lock:
+                self._evict(type, CachedMemory._get_name(cart_info, type))
+        return checksums
+
+    def get_temporary_filepath(self) -> Path:
+        return self._memory.get_temporary_filepath()
+
+    def get_by_name(self, name: str, type: GameDataType, with_content: bool = False) -> Optional[GameData]:
+        if type not in CACHED_TYPES:
+            return self._memory.get_by_name(name, type, with_content)
+
+        version = self._memory.get_version(name, type)
+        game_data = self._get(type, name, version)
+        if game_data is None:
+            game_data = self._memory.get_by_name(name, type, with_content=True)
+            if game_data is not None and version is not None:
+                with self._lock:
+                    self._put(type, name, CachedEntry(game_data, version))
+
+        return CachedMemory._copy(game_data, with_content)
+
+    def export(self, name: str, type: GameDataType, target_filepath: Path) -> bool:
+        return self._memory.export(name, type, target_filepath)
+
+    def prepare_export(self, name: str, type: GameDataType):
+        self._memory.prepare_export(name, type)
+
+    def get_version(self, name: str, type: GameDataType) -> Optional[str]:
+        return self._memory.get_version(name, type)
+
+    def get_all(
+        self,
+        cart_info: CartInfo,
+        type: Optional[GameDataType] = None,
+        with_content: bool = False,
+    ) -> List[GameData]:
+        return self._memory.get_all(cart_info, type, with_content)
+
+    def get_many_by_name(
+        self,
+        names: List[str],
+        type: GameDataType,
+        with_content: bool = False,
+    ) -> Dict[str, Optional[GameData]]:
+        if type not in CACHED_TYPES:
+            return self._memory.get_many_by_name(names, type, with_content)
+
+        versions = {name: self._memory.get_version(name, type) for name in names}
+        game_data_by_name = {name: self._get(type, name, versions[name]) for name in names}
+
+        missing_names = [name for name, game_data in game_data_by_name.items() if game_data is None]
+        if missing_names:
+            game_data_by_name.update(self._memory.get_many_by_name(missing_names, type, with_content=True))
+            with self._lock:
+                for name in missing_names:
+                    if game_data_by_name[name] is not None and versions[name] is not None:
+                        self._put(type, name, CachedEntry(game_data_by_name[name], versions[name]))
+
+        return {name: CachedMemory._copy(game_data, with_content) for name, game_data in game_data_by_name.items()}
+
+    def list_carts(self) -> List[CartSummary]:
+        return self._memory.list_carts()
+
+    def open(self, name: str, type: GameDataType) -> Optional[BinaryIO]:
+        return self._memory.open(name, type)
+
+    def get_checksums(self, type: GameDataType) -> Dict[str, Optional[str]]:
+        return self._memory.get_checksums(type)
+
+    def update_configuration(self, dto: MemoryConfiguration):
+        """Update memory configuration and clear the cache.
+
+        Args:
+            dto: Memory configuration.
+        """
+        self._memory.update_configuration(dto)
+        self.clear()
+
+    def clear(self):
+        """Remove all game data from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            metrics.set("memory.cache.size", self._size)
+
+    def close(self):
+        self._memory.close()
+
+    def _get(self, type: GameDataType, name: str, version: Optional[str]) -> Optional[GameData]:
+        """Return cached game data if it is still fresh, None otherwise."""
+        with self._lock:
+            entry = self._entries.get((type, name), None)
+            if entry is not None and version is not None and entry.version == version:
+                self._entries.move_to_end((type, name))
+                metrics.increment("memory.cache.hits")
+                return entry.game_data
+
+            if entry is not None:
+                self._evict(type, name)
+            metrics.increment("memory.cache.misses")
+            return None
+
+    def _put(self, type: GameDataType, name: str, entry: CachedEntry):
+        """Cache game data, then evict least recently used game data until the cache fits in its maximal size."""
+        if entry.size > self._max_size:
+            return
+
+        self._evict(type, name)
+        self._entries[(type, name)] = entry
+        self._size += entry.size
+        while self._size > self._max_size:
+            (evicted_type, evicted_name), _ = next(iter(self._entries.items()))
+            self._evict(evicted_type, evicted_name)
+            metrics.increment("memory.cache.evictions")
+        metrics.set("memory.cache.size", self._size)
+
+    def _evict(self, type: GameDataType, name: str):
+        entry = self._entries.pop((type, name), None)
+        if entry is not None:
+            self._size -= entry.size
+            metrics.set("memory.cache.size", self._size)
+
+    @staticmethod
+    def _copy(game_data: Optional[GameData], with_content: bool) -> Optional[GameData]:
+        """Return a copy of game data, so that cached game data cannot be altered by the caller."""
+        if game_data is None:
+            return None
+
+        game_data = copy(game_data)
+        game_data.metadata = dict(game_data.metadata) if game_data.metadata else game_data.metadata
+        if not with_content:
+            game_data.content = None
+        return game_data
+
+    @staticmethod
+    def _get_name(cart_info: CartInfo, type: GameDataType) -> str:
+        return {
+            GameDataType.CART: cart_info.cart_filename,
+            GameDataType.METADATA: cart_info.metadata_filename,
+            GameDataType.IMAGE: cart_info.image_filename,
+        }[type]
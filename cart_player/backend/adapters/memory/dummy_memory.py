@@ -1,8 +1,9 @@
 import abc
-from typing import List, Optional
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional
 
 from cart_player.backend.domain.dtos import MemoryConfiguration
-from cart_player.backend.domain.models import CartInfo, GameData
+from cart_player.backend.domain.models import CartInfo, CartSummary, GameData
 from cart_player.backend.domain.ports import Memory
 from cart_player.backend.utils.models import GameDataType
 
@@ -16,6 +17,9 @@ class DummyMemory(Memory):
     def get_by_name(self, name: str, type: GameDataType, with_content: bool = False) -> Optional[GameData]:
         return None
 
+    def export(self, name: str, type: GameDataType, target_filepath: Path) -> bool:
+        return False
+
     def get_all(
         self,
         cart_info: CartInfo,
@@ -24,5 +28,22 @@ class DummyMemory(Memory):
     ) -> List[GameData]:
         return []
 
+    def get_many_by_name(
+        self,
+        names: List[str],
+        type: GameDataType,
+        with_content: bool = False,
+    ) -> Dict[str, Optional[GameData]]:
+        return {name: None for name in names}
+
+    def list_carts(self) -> List[CartSummary]:
+        return []
+
+    def open(self, name: str, type: GameDataType) -> Optional[BinaryIO]:
+        return None
+
+    def get_checksums(self, type: GameDataType) -> Dict[str, Optional[str]]:
+        return {}
+
     def update_configuration(self, dto: MemoryConfiguration):
         return
@@ -4,21 +4,30 @@ import hashlib
 import itertools
 import json
 import logging
+import os
 import pickle
 import re
 import shutil
+import threading
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Union
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple, Union
+from uuid import uuid4
 
 from cart_player.backend.domain.dtos import LocalMemoryConfiguration
-from cart_player.backend.domain.models import CartInfo, GameData
+from cart_player.backend.domain.models import CartInfo, CartSummary, GameData
 from cart_player.backend.domain.ports import Memory
+from cart_player.backend.utils.files import copy_file, hash_file, move_file
 from cart_player.backend.utils.models import GameDataType, GameSupport
 from cart_player.core import config
 
 logger = logging.getLogger(f"{config.LOGGER_NAME}::LocalMemory")
 
+SAVE_FILE_REGEX = r"^(.+\.sav)(\.[1-9][0-9]*)?$"
+STAGING_INDEX_FILENAME = "index.json"
+HASH_CHUNK_SIZE = 1024 * 1024
+
 
 class LocalMemory(Memory):
     """Implementation of Memory where data is stored locally
@@ -33,10 +42,15 @@ class LocalMemory(Memory):
         metadata_path: Path to metadata folder within memory folder.
         image_path: Path to image folder within memory folder.
         pocket_image_path: Path to pocket image folder within memory folder.
+        staging_path: Path to staging folder within memory folder, where games are staged before being exported.
+        incoming_path: Path to incoming folder within memory folder, where game data is written before being saved.
     """
 
     def __init__(self, root_path: Union[Path, str]):
         self._root_path = Path(root_path)
+        self._staging_lock = threading.Lock()
+        self._checksums_lock = threading.Lock()  # checksums file is read, modified, then rewritten
+        self._data_lock = threading.Lock()  # same for data file
 
     def configure(self):
         """Configure the memory folders."""
@@ -48,6 +62,13 @@ class LocalMemory(Memory):
             (self.metadata_path / support_subpath).mkdir(parents=True, exist_ok=True)
             (self.image_path / support_subpath).mkdir(parents=True, exist_ok=True)
             (self.pocket_image_path / support_subpath).mkdir(parents=True, exist_ok=True)
+        self.staging_path.mkdir(parents=True, exist_ok=True)
+
+        # Delete temporary files left by a previous run
+        self.incoming_path.mkdir(parents=True, exist_ok=True)
+        for file in self.incoming_path.iterdir():
+            if file.is_file():
+                file.unlink(missing_ok=True)
 
     @property
     def root_path(self) -> Path:
@@ -63,6 +84,15 @@ class LocalMemory(Memory):
             filepath.write_text("{}")
         return filepath
 
+    @property
+    def checksums_filepath(self) -> Path:
+        """Path to file 'checksums', where the checksum of each game and save is recorded when saved."""
+        filepath = self._root_path / Path("checksums.json")
+        if not filepath.exists():
+            filepath.touch()
+            filepath.write_text("{}")
+        return filepath
+
     @property
     def cart_path(self) -> Path:
         """Path to memory cart folder."""
@@ -93,6 +123,16 @@ class LocalMemory(Memory):
         """Path to memory pocket image folder."""
         return self._root_path / Path("pocket_image")
 
+    @property
+    def staging_path(self) -> Path:
+        """Path to memory staging folder."""
+        return self._root_path / Path("staging")
+
+    @property
+    def incoming_path(self) -> Path:
+        """Path to memory incoming folder."""
+        return self._root_path / Path("incoming")
+
     def save(self, cart_info: CartInfo, content: bytes, type: GameDataType, metadata: dict = {}):
         """Save game data into local memory, which follows this structure:
             * Cart games location: <root_path>/games/
@@ -142,8 +182,11 @@ class LocalMemory(Memory):
             ) from e
 
         # Historize saves
+        historized_filepath = None
         if type == GameDataType.SAVE and filepath.exists():
+            historized_filepath = filepath.with_suffix(filepath.suffix + f".{LocalMemory._get_increment(filepath)}")
             LocalMemory._historize_file(filepath)
+            self._move_checksum(filepath, historized_filepath)
 
         try:
             with open(str(filepath), "wb" if is_bytes else "w") as f:
@@ -155,17 +198,106 @@ class LocalMemory(Memory):
             # Restore initial save in case of error
             if type == GameDataType.SAVE:
                 LocalMemory._restore_last_file(filepath)
+                if historized_filepath:
+                    self._move_checksum(historized_filepath, filepath)
 
             raise RuntimeError(
                 f"An error occured when writing content into file ({cart_info=}, {filepath=}).",
             ) from e
 
+        # Record checksum
+        if type in [GameDataType.GAME, GameDataType.SAVE]:
+            self._record_checksum(filepath, LocalMemory._get_md5(processed_content))
+
         # Save metadata
         if metadata:
-            data = json.loads(self.data_filepath.read_text())
-            md5 = LocalMemory._get_md5(content)
-            data[md5] = metadata
-            self.data_filepath.write_text(json.dumps(data))
+            self._record_data(LocalMemory._get_md5(content), metadata)
+
+    def save_file(
+        self,
+        cart_info: CartInfo,
+        filepath: Path,
+        type: GameDataType,
+        metadata: dict = {},
+    ) -> Dict[str, str]:
+        """Save the content of a file into local memory (see `save`).
+
+        Games and saves are renamed into place without being loaded: the move is atomic when the file is within the
+        memory folder (see `get_temporary_filepath`). Other game data is processed the same way as with `save`.
+
+        Args:
+            cart_info: Information about the cart whose content has to be saved.
+            filepath: Path to the file to save.
+            type: Type of game data.
+            metadata: Metadata of the file to save.
+
+        Returns:
+            Checksums of the file content ('md5', 'sha1' and 'crc').
+
+        Raises:
+            RuntimeError: If an error happens when creating local memory folders or when moving the file.
+        """
+        if type not in [GameDataType.GAME, GameDataType.SAVE]:
+            return super().save_file(cart_info, filepath, type, metadata)
+
+        target_filepath = self._get_filepath(cart_info, type, metadata)
+        checksums = hash_file(filepath)
+
+        # Skip if file already exists
+        if (
+            target_filepath.is_file()
+            and target_filepath.stat().st_size == filepath.stat().st_size
+            and LocalMemory._get_file_md5(target_filepath) == checksums["md5"]
+        ):
+            logger.warning(
+                "File content is the same, no new file has been created "
+                f"(id={cart_info.id}, filepath={str(target_filepath)})"
+            )
+            filepath.unlink()
+            return checksums
+
+        # Create file parent directory(ies)
+        try:
+            target_filepath.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            raise RuntimeError(
+                "An error occured when creating missing parent directories " f"({cart_info=}, {target_filepath=}).",
+            ) from e
+
+        # Historize saves
+        historized_filepath = None
+        if type == GameDataType.SAVE and target_filepath.exists():
+            historized_filepath = target_filepath.with_suffix(
+                target_filepath.suffix + f".{LocalMemory._get_increment(target_filepath)}"
+            )
+            LocalMemory._historize_file(target_filepath)
+            self._move_checksum(target_filepath, historized_filepath)
+
+        try:
+            move_file(filepath, target_filepath)
+        except Exception as e:
+            # Restore initial save in case of error
+            if historized_filepath:
+                LocalMemory._restore_last_file(target_filepath)
+                self._move_checksum(historized_filepath, target_filepath)
+
+            raise RuntimeError(
+                f"An error occured when moving file into memory ({cart_info=}, {filepath=}, {target_filepath=}).",
+            ) from e
+
+        # Record checksum
+        self._record_checksum(target_filepath, checksums["md5"])
+
+        # Save metadata
+        if metadata:
+            self._record_data(checksums["md5"], metadata)
+
+        return checksums
+
+    def get_temporary_filepath(self) -> Path:
+        """Return a path to a new temporary file within the incoming folder, so that saving it is an atomic rename."""
+        self.incoming_path.mkdir(parents=True, exist_ok=True)
+        return self.incoming_path / f"{uuid4().hex}.tmp"
 
     def get_by_name(self, name: str, type: GameDataType, with_content: bool = False) -> Optional[GameData]:
         path = self._get_path(type)
@@ -174,23 +306,111 @@ class LocalMemory(Memory):
         if file is None:
             return None
 
-        date = datetime.fromtimestamp(file.stat().st_mtime)
-        if not with_content:
-            content = None
-        elif type in [GameDataType.CART, GameDataType.METADATA]:
-            content = pickle.dumps(json.loads(file.read_text()))
-        elif type == GameDataType.IMAGE:
-            content = base64.b64encode(file.read_bytes())
-        else:
-            content = file.read_bytes()
+        data = self._load_data()
+        return self._build_game_data(file, type, with_content, data, self._load_checksums(type, with_content))
 
-        # Try retrieve metadata
-        data = json.loads(self.data_filepath.read_text())
-        md5 = LocalMemory._get_md5(content)
-        metadata = data.get(md5, None)
+    def export(self, name: str, type: GameDataType, target_filepath: Path) -> bool:
+        """Export game data into a file, using the cheapest copy method supported by the filesystem.
+        Games are exported from the staging folder (see `prepare_export`) as hardlinks when possible: staged games are
+        never modified in place, unlike games which are overwritten when installed again.
+        """
+        file = self._scan(self._get_path(type)).get(name, None)
+        if file is None:
+            return False
+
+        if type == GameDataType.GAME:
+            try:
+                file = self._stage(file)
+            except Exception as e:
+                logger.info(f"Unable to stage game, exporting it directly ({name=}): {e}", exc_info=True)
+
+        try:
+            method = copy_file(file, target_filepath, allow_hardlink=file.parent == self.staging_path)
+        except Exception as e:
+            raise RuntimeError(f"An error occured when exporting game data ({name=}, {target_filepath=}).") from e
+
+        logger.debug(f"Game data exported ({name=}, {target_filepath=}, {method=})")
+        return True
+
+    def prepare_export(self, name: str, type: GameDataType):
+        """Stage a game into the staging folder, so that exporting it later is immediate.
+
+        Staged games are named after their md5 and kept across sessions. A game is staged again only when its file
+        has changed (size or modification time). Other types of game data are small enough not to be staged.
 
-        extension = file.suffix
-        return GameData(name=name, date=date, content=content, type=type, extension=extension, metadata=metadata)
+        Raises:
+            RuntimeError: If unable to stage game.
+        """
+        if type != GameDataType.GAME:
+            return
+
+        file = self._scan(self._get_path(type)).get(name, None)
+        if file is None:
+            return
+
+        try:
+            self._stage(file)
+        except Exception as e:
+            raise RuntimeError(f"An error occured when staging game ({name=}).") from e
+
+    def get_version(self, name: str, type: GameDataType) -> Optional[str]:
+        """Return a token built from the size and modification time of the file."""
+        file = self._find_file(name, type)
+        if file is None:
+            return None
+
+        stat = file.stat()
+        return f"{stat.st_mtime_ns}:{stat.st_size}"
+
+    def get_many_by_name(
+        self,
+        names: List[str],
+        type: GameDataType,
+        with_content: bool = False,
+    ) -> Dict[str, Optional[GameData]]:
+        files_by_name = self._scan(self._get_path(type))
+        data = self._load_data()
+        checksums = self._load_checksums(type, with_content)
+        return {
+            name: self._build_game_data(files_by_name[name], type, with_content, data, checksums)
+            if name in files_by_name
+            else None
+            for name in names
+        }
+
+    def list_carts(self) -> List[CartSummary]:
+        """Return a summary of every cart known by memory.
+
+        Carts are read from cart files, then matched against game and save files, each folder being browsed once.
+        Support 'GAMEBOY_OR_GAMEBOY_COLOR' cannot be told apart from 'GAMEBOY_COLOR' as they share the same folder:
+        'GAMEBOY_COLOR' is returned for both.
+        """
+        game_files_by_name = self._scan(self.game_path)
+        save_dates_by_base_name: Dict[str, List[datetime]] = defaultdict(list)
+        for name, file in self._scan(self.save_path).items():
+            match = re.match(SAVE_FILE_REGEX, name)
+            if match:
+                save_dates_by_base_name[match.group(1)].append(datetime.fromtimestamp(file.stat().st_mtime))
+
+        cart_summaries = []
+        for name, file in self._scan(self.cart_path).items():
+            try:
+                cart_info = self._load_cart_info(file)
+            except Exception as e:
+                logger.info(f"Unable to load cart file ({file=}): {e}", exc_info=True)
+                continue
+
+            save_dates = save_dates_by_base_name.get(cart_info.base_save_filename, [])
+            cart_summaries.append(
+                CartSummary(
+                    cart_info=cart_info,
+                    game_installed=cart_info.game_filename in game_files_by_name,
+                    n_saves=len(save_dates),
+                    last_save_date=max(save_dates, default=None),
+                )
+            )
+
+        return cart_summaries
 
     def get_all(
         self,
@@ -219,32 +439,25 @@ class LocalMemory(Memory):
         ]
 
         # Build list of GameData
-        data = json.loads(self.data_filepath.read_text())
-        game_data_list = []
-        for f in files:
-            # Retrieve metadata
-            content = (
-                pickle.dumps(json.loads(f.read_text()))
-                if type in [GameDataType.CART, GameDataType.METADATA]
-                else f.read_bytes()
-            )
-            md5 = LocalMemory._get_md5(content)
-            metadata = data.get(md5, None)
-
-            # Add GameData to list
-            extension = f.suffix
-            game_data_list.append(
-                GameData(
-                    name=f.name,
-                    date=datetime.fromtimestamp(f.stat().st_mtime),
-                    content=content if with_content else None,
-                    type=type,
-                    extension=extension,
-                    metadata=metadata,
-                )
-            )
+        data = self._load_data()
+        checksums = self._load_checksums(type, with_content)
+        return [self._build_game_data(f, type, with_content, data, checksums) for f in files]
 
-        return game_data_list
+    def open(self, name: str, type: GameDataType) -> Optional[BinaryIO]:
+        file = self._scan(self._get_path(type)).get(name, None)
+        return open(file, "rb") if file is not None else None
+
+    def get_checksums(self, type: GameDataType) -> Dict[str, Optional[str]]:
+        """Return the checksum recorded when saving each game data of the provided type, by name.
+        Checksums are only recorded for games and saves.
+        """
+        with self._checksums_lock:
+            checksums = json.loads(self.checksums_filepath.read_text())
+        return {
+            name: checksums.get(file.relative_to(self._root_path).as_posix(), None)
+            for name, file in self._scan(self._get_path(type)).items()
+            if LocalMemory._is_file_of_type(name, type)
+        }
 
     def update_configuration(self, dto: LocalMemoryConfiguration):
         """Update memory configuration.
@@ -430,6 +643,239 @@ class LocalMemory(Memory):
 
         raise NotImplementedError
 
+    def _find_file(self, name: str, type: GameDataType) -> Optional[Path]:
+        """Find a file by name, looking into support folders first (without browsing the whole memory folder).
+
+        Args:
+            name: Name of the file.
+            type: Type of game data.
+
+        Returns:
+            Path to the file, None if it does not exist.
+        """
+        path = self._get_path(type)
+        for support in [GameSupport.GAMEBOY, GameSupport.GAMEBOY_COLOR, GameSupport.GAMEBOY_ADVANCE]:
+            file = path / LocalMemory._get_support_subpath(support) / name
+            if file.is_file():
+                return file
+
+        return self._scan(path).get(name, None)
+
+    def _load_data(self) -> Dict[str, dict]:
+        """Load metadata of files from file 'data', by md5."""
+        with self._data_lock:
+            return json.loads(self.data_filepath.read_text())
+
+    def _record_data(self, md5: str, metadata: dict):
+        """Record the metadata of a file in file 'data'."""
+        with self._data_lock:
+            data = json.loads(self.data_filepath.read_text())
+            data[md5] = metadata
+            self.data_filepath.write_text(json.dumps(data))
+
+    def _record_checksum(self, filepath: Path, md5: str):
+        """Record the checksum of a file in file 'checksums'."""
+        with self._checksums_lock:
+            checksums = json.loads(self.checksums_filepath.read_text())
+            checksums[filepath.relative_to(self._root_path).as_posix()] = md5
+            self.checksums_filepath.write_text(json.dumps(checksums))
+
+    def _move_checksum(self, filepath: Path, new_filepath: Path):
+        """Move the recorded checksum of a file which has been renamed (if any) in file 'checksums'."""
+        with self._checksums_lock:
+            checksums = json.loads(self.checksums_filepath.read_text())
+            md5 = checksums.pop(filepath.relative_to(self._root_path).as_posix(), None)
+            if md5 is not None:
+                checksums[new_filepath.relative_to(self._root_path).as_posix()] = md5
+            self.checksums_filepath.write_text(json.dumps(checksums))
+
+    def _stage(self, file: Path) -> Path:
+        """Stage a file into the staging folder (if not already staged) and return the path to the staged file.
+
+        The staging index maps each source file to the md5 of its content, along with the size and modification time
+        of the source file and of the staged file when it has been staged. Staged files are exported as hardlinks, so
+        a staged file is staged again if it has been modified since (e.g. through an exported file). Entries of source
+        files which no longer exist are removed, then staged files which are no longer referenced are deleted.
+
+        Args:
+            file: Path to the file to stage.
+
+        Returns:
+            Path to the staged file.
+        """
+        with self._staging_lock:
+            self.staging_path.mkdir(parents=True, exist_ok=True)
+            index_filepath = self.staging_path / STAGING_INDEX_FILENAME
+            index = json.loads(index_filepath.read_text()) if index_filepath.exists() else {}
+
+            # Remove entries of source files which no longer exist
+            n_entries = len(index)
+            index = {key: entry for key, entry in index.items() if (self._root_path / key).is_file()}
+            index_changed = len(index) != n_entries
+
+            key = str(file.relative_to(self._root_path))
+            stat = file.stat()
+            entry = index.get(key, None)
+            staged_file = self.staging_path / (entry["md5"] + file.suffix) if entry else None
+            if (
+                entry
+                and entry["size"] == stat.st_size
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and LocalMemory._is_staged_file_unchanged(staged_file, entry)
+            ):
+                if index_changed:
+                    self._write_staging_index(index)
+                return staged_file
+
+            md5 = LocalMemory._get_file_md5(file)
+            staged_file = self.staging_path / (md5 + file.suffix)
+            staged_entry = next((e for e in index.values() if e["md5"] == md5 and "staged_size" in e), None)
+            if staged_entry is None or not LocalMemory._is_staged_file_unchanged(staged_file, staged_entry):
+                tmp_staged_file = staged_file.with_suffix(".tmp")
+                tmp_staged_file.unlink(missing_ok=True)
+                method = copy_file(file, tmp_staged_file)
+                os.replace(tmp_staged_file, staged_file)  # a modified staged file is replaced, not overwritten
+                logger.debug(f"Game staged ({file=}, {staged_file=}, {method=})")
+
+            # Staged files of same content are shared by entries
+            staged_stat = staged_file.stat()
+            index[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "md5": md5}
+            for _entry in index.values():
+                if _entry["md5"] == md5:
+                    _entry.update(staged_size=staged_stat.st_size, staged_mtime_ns=staged_stat.st_mtime_ns)
+            self._write_staging_index(index)
+
+            return staged_file
+
+    def _write_staging_index(self, index: Dict[str, dict]):
+        """Write the staging index, then delete staged files which are no longer referenced."""
+        index_filepath = self.staging_path / STAGING_INDEX_FILENAME
+        tmp_index_filepath = index_filepath.with_suffix(".tmp")
+        tmp_index_filepath.write_text(json.dumps(index))
+        os.replace(tmp_index_filepath, index_filepath)
+
+        staged_filenames = {entry["md5"] + Path(key).suffix for key, entry in index.items()}
+        for _file in self.staging_path.iterdir():
+            if _file.name != STAGING_INDEX_FILENAME and _file.name not in staged_filenames:
+                _file.unlink(missing_ok=True)
+
+    @staticmethod
+    def _is_staged_file_unchanged(staged_file: Path, entry: dict) -> bool:
+        """Return True if a staged file exists and has not been modified since it has been staged."""
+        if not staged_file.is_file() or "staged_size" not in entry:
+            return False
+
+        stat = staged_file.stat()
+        return stat.st_size == entry["staged_size"] and stat.st_mtime_ns == entry["staged_mtime_ns"]
+
+    def _load_cart_info(self, filepath: Path) -> CartInfo:
+        """Load the cart info stored in a cart file (<title>_<code>@<header_checksum>.json).
+
+        Args:
+            filepath: Path to the cart file.
+
+        Returns:
+            Cart info stored in the cart file.
+        """
+        title_and_code, header_checksum = filepath.stem.rsplit("@", 1)
+        title, code = title_and_code.rsplit("_", 1)
+        support = {
+            LocalMemory._get_support_subpath(support).name: support
+            for support in [GameSupport.GAMEBOY, GameSupport.GAMEBOY_COLOR, GameSupport.GAMEBOY_ADVANCE]
+        }[filepath.parent.name]
+
+        cart_info = CartInfo(
+            title=None if title == "None" else title,
+            code=None if code == "None" else code,
+            header_checksum=None if header_checksum == "None" else header_checksum,
+            support=support,
+        )
+        cart_info.load_from_bytes(pickle.dumps(json.loads(filepath.read_text())))
+        return cart_info
+
+    @staticmethod
+    def _scan(path: Path) -> Dict[str, Path]:
+        """Browse a memory folder once and return all its files by name.
+
+        Args:
+            path: Path to the memory folder to browse.
+
+        Returns:
+            All files within the memory folder by name.
+        """
+        files_by_name = {}
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                files_by_name.setdefault(filename, Path(dirpath) / filename)
+        return files_by_name
+
+    @staticmethod
+    def _is_file_of_type(name: str, type: GameDataType) -> bool:
+        """Return True if the file name matches the type of game data (games and saves share the same folder)."""
+        if type == GameDataType.GAME:
+            return not re.match(SAVE_FILE_REGEX, name)
+        if type == GameDataType.SAVE:
+            return bool(re.match(SAVE_FILE_REGEX, name))
+        return True
+
+    def _load_checksums(self, type: GameDataType, with_content: bool) -> Optional[Dict[str, str]]:
+        """Return the checksums recorded in file 'checksums' if they are needed to build game data without reading
+        files (i.e. for games and saves, when content is not retrieved), None otherwise."""
+        if with_content or type not in [GameDataType.GAME, GameDataType.SAVE]:
+            return None
+
+        with self._checksums_lock:
+            return json.loads(self.checksums_filepath.read_text())
+
+    def _build_game_data(
+        self,
+        file: Path,
+        type: GameDataType,
+        with_content: bool,
+        data: dict,
+        checksums: Optional[Dict[str, str]] = None,
+    ) -> GameData:
+        """Build the game data corresponding to a file.
+
+        Games and saves are not read when content is not retrieved: their metadata is found from their recorded
+        checksum. A save whose checksum has not been recorded is hashed (games are not, they have no metadata).
+
+        Args:
+            file: Path to the file.
+            type: Type of game data.
+            with_content: True if content must be retrieved, False else.
+            data: Content of file 'data', where metadata is stored.
+            checksums: Checksums recorded in file 'checksums' (see `_load_checksums`).
+
+        Returns:
+            Game data corresponding to the file.
+        """
+        content = None
+        if checksums is not None:
+            md5 = checksums.get(file.relative_to(self._root_path).as_posix(), None)
+            if md5 is None and type == GameDataType.SAVE:
+                md5 = LocalMemory._get_file_md5(file)
+        else:
+            if type in [GameDataType.CART, GameDataType.METADATA]:
+                content = pickle.dumps(json.loads(file.read_text()))
+            elif type == GameDataType.IMAGE:
+                content = base64.b64encode(file.read_bytes())
+            else:
+                content = file.read_bytes()
+            md5 = LocalMemory._get_md5(content)
+
+        # Try retrieve metadata
+        metadata = data.get(md5, None) if md5 is not None else None
+
+        return GameData(
+            name=file.name,
+            date=datetime.fromtimestamp(file.stat().st_mtime),
+            content=content if with_content else None,
+            type=type,
+            extension=file.suffix,
+            metadata=metadata,
+        )
+
     @staticmethod
     def _get_support_subpath(support: GameSupport) -> str:
         return {
@@ -515,3 +961,12 @@ class LocalMemory(Memory):
             content = json.dumps(content).encode()
 
         return hashlib.md5(content).hexdigest()
+
+    @staticmethod
+    def _get_file_md5(filepath: Path) -> str:
+        """Return the md5 of a file content, read by chunks."""
+        md5 = hashlib.md5()
+        with open(filepath, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                md5.update(chunk)
+        return md5.hexdigest()
@@ -0,0 +1,502 @@
+import hashlib
+import io
+import itertools
+import logging
+import os
+import pickle
+import queue
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional, Union
+from uuid import uuid4
+
+from cart_player.backend.domain.dtos import MemoryConfiguration
+from cart_player.backend.domain.models import CartInfo, CartSummary, GameData
+from cart_player.backend.domain.ports import Memory
+from cart_player.backend.utils.models import GameDataType
+from cart_player.core import config
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::WriteBehindMemory")
+
+JOURNAL_ENTRY_EXTENSION = ".pending"
+FAILED_JOURNAL_ENTRY_EXTENSION = ".failed"
+RETRY_DELAYS = [0.5, 2.0, 5.0, 30.0]  # delays in seconds between attempts to apply a pending write (last one repeated)
+SAVE_FILE_TIMEOUT = 60.0  # maximal time in seconds to wait for pending writes before saving a file
+CLOSE_TIMEOUT = 10.0  # maximal time in seconds to wait for pending writes on close (they are replayed on next start)
+
+
+class PendingWrite:
+    """Write operation which has been journaled but not applied yet.
+
+    Args:
+        id: Identifier of the write operation (sortable by submission order).
+        cart_info: Information about the cart whose content has to be saved.
+        content: Content to save.
+        type: Type of game data.
+        metadata: Metadata of the file to save.
+        date: Date at which the write operation has been submitted.
+
+    Attributes:
+        id: Identifier of the write operation (sortable by submission order).
+        cart_info: Information about the cart whose content has to be saved.
+        content: Content to save.
+        type: Type of game data.
+        metadata: Metadata of the file to save.
+        date: Date at which the write operation has been submitted.
+
+    Properties:
+        name: Name of the game data once written (<filename>.<extension>).
+    """
+
+    def __init__(
+        self,
+        id: str,
+        cart_info: CartInfo,
+        content: bytes,
+        type: GameDataType,
+        metadata: dict,
+        date: datetime,
+    ):
+        self.id = id
+        self.cart_info = cart_info
+        self.content = content
+        self.type = type
+        self.metadata = metadata
+        self.date = date
+
+    @property
+    def name(self) -> str:
+        """Name of the game data once written (<filename>.<extension>)."""
+        if self.type == GameDataType.CART:
+            return self.cart_info.cart_filename
+        if self.type == GameDataType.GAME:
+            return self.cart_info.game_filename
+        if self.type == GameDataType.SAVE:
+            return self.cart_info.base_save_filename
+        if self.type == GameDataType.METADATA:
+            return self.cart_info.metadata_filename
+        if self.type == GameDataType.IMAGE:
+            return self.cart_info.image_filename
+        if self.type == GameDataType.ANALOGUE_POCKET_IMAGE:
+            return f"{self.metadata.get('crc', None)}.{self.cart_info.pocket_image_file_extension}"
+
+        raise NotImplementedError
+
+    def to_game_data(self, with_content: bool) -> GameData:
+        """Return the game data this write operation will produce."""
+        return GameData(
+            name=self.name,
+            date=self.date,
+            content=self.content if with_content else None,
+            type=self.type,
+            extension=Path(self.name).suffix,
+            metadata=self.metadata or None,
+        )
+
+    def bytes(self) -> bytes:
+        return pickle.dumps(
+            {
+                "id": self.id,
+                "cart_info": self.cart_info,
+                "content": self.content,
+                "type": self.type,
+                "metadata": self.metadata,
+                "date": self.date,
+            }
+        )
+
+    @staticmethod
+    def create_from_bytes(data: bytes):
+        """Create a PendingWrite from the provided data."""
+        return PendingWrite(**pickle.loads(data))
+
+
+class WriteBehindMemory(Memory):
+    """Memory decorator acknowledging writes as soon as they are journaled.
+
+    Writes are journaled on disk, then applied to the decorated memory by a background worker, in submission order.
+    Reads are consistent with pending writes: they are served from the journal until the write has been applied.
+    Journal entries left by a previous run are replayed on creation.
+
+    A write failing to be applied is retried with backoff until it succeeds (an error is reported once the first retries
+    have failed): it stays pending meanwhile, so that reads still see it, and later writes wait for it to keep
+    submission order. Its journal entry is kept, so that it is replayed on next creation if it is never applied.
+
+    Args:
+        memory: Decorated memory, where writes are eventually applied.
+        journal_path: Path to the folder where pending writes are journaled.
+
+    Properties:
+        n_pending_writes: Number of writes not applied yet.
+    """
+
+    def __init__(self, memory: Memory, journal_path: Union[Path, str]):
+        self._memory = memory
+        self._journal_path = Path(journal_path)
+        self._journal_path.mkdir(parents=True, exist_ok=True)
+
+        self._pending: List[PendingWrite] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._lock = threading.RLock()
+        self._flushed = threading.Condition(self._lock)
+        self._apply_lock = threading.Lock()  # writes into decorated memory (pending writes and files) run one at a time
+
+        self._replay_journal()
+
+        self._worker = threading.Thread(target=self._apply_pending_writes, daemon=True)
+        self._worker.start()
+
+    @property
+    def n_pending_writes(self) -> int:
+        """Number of writes not applied yet."""
+        with self._lock:
+            return len(self._pending)
+
+    def save(self, cart_info: CartInfo, content: bytes, type: GameDataType, metadata: dict = {}):
+        """Journal game data and return. Game data is saved into decorated memory in background.
+
+        Raises:
+            RuntimeError: If unable to journal content.
+            ValueError: If type == GameDataType.ANALOGUE_POCKET_IMAGE and 'crc' key is missing in metadata.
+        """
+        if type == GameDataType.ANALOGUE_POCKET_IMAGE and not metadata.get("crc", None):
+            raise ValueError(f"Unable to save Analogue Pocket image without a crc (cart_info={cart_info}).")
+
+        pending_write = PendingWrite(
+            id=f"{time.time_ns():020d}-{uuid4().hex}",
+            cart_info=cart_info,
+            content=content,
+            type=type,
+            metadata=dict(metadata),
+            date=datetime.now(),
+        )
+
+        try:
+            self._write_journal_entry(pending_write)
+        except Exception as e:
+            raise RuntimeError(f"An error occured when journaling content ({cart_info=}, {type=}).") from e
+
+        with self._lock:
+            self._pending.append(pending_write)
+        self._queue.put(pending_write)
+
+    def save_file(
+        self,
+        cart_info: CartInfo,
+        filepath: Path,
+        type: GameDataType,
+        metadata: dict = {},
+    ) -> Dict[str, str]:
+        """Save the content of a file into decorated memory, once all pending writes have been applied.
+        The file is already durably written, so it is not journaled. Reads are not blocked while the file is saved.
+
+        Raises:
+            RuntimeError: If pending writes have not been applied within 'SAVE_FILE_TIMEOUT' seconds, or if an error
+                happens when saving the file.
+        """
+        if not self.flush(timeout=SAVE_FILE_TIMEOUT):
+            raise RuntimeError(f"Unable to save file, pending writes have not been applied ({cart_info=}, {type=}).")
+
+        with self._apply_lock:
+            return self._memory.save_file(cart_info, filepath, type, metadata)
+
+    def get_temporary_filepath(self) -> Path:
+        return self._memory.get_temporary_filepath()
+
+    def get_by_name(self, name: str, type: GameDataType, with_content: bool = False) -> Optional[GameData]:
+        with self._lock:
+            pending_write = next(
+                (pw for pw in reversed(self._pending) if pw.type == type and pw.name == name),
+                None,
+            )
+            if pending_write is not None:
+                return pending_write.to_game_data(with_content)
+
+            return self._memory.get_by_name(name, type, with_content)
+
+    def export(self, name: str, type: GameDataType, target_filepath: Path) -> bool:
+        with self._lock:
+            pending_write = next(
+                (pw for pw in reversed(self._pending) if pw.type == type and pw.name == name),
+                None,
+            )
+            if pending_write is None:
+                return self._memory.export(name, type, target_filepath)
+
+            try:
+                with open(target_filepath, "xb") as f:
+                    f.write(pending_write.content)
+            except Exception as e:
+                raise RuntimeError(f"An error occured when exporting game data ({name=}, {target_filepath=}).") from e
+            return True
+
+    def prepare_export(self, name: str, type: GameDataType):
+        with self._lock:
+            if any(pw.type == type and pw.name == name for pw in self._pending):
+                return
+
+        self._memory.prepare_export(name, type)
+
+    def get_version(self, name: str, type: GameDataType) -> Optional[str]:
+        with self._lock:
+            pending_write = next(
+                (pw for pw in reversed(self._pending) if pw.type == type and pw.name == name),
+                None,
+            )
+            if pending_write is not None:
+                return f"pending:{pending_write.id}"
+
+            return self._memory.get_version(name, type)
+
+    def get_all(
+        self,
+        cart_info: CartInfo,
+        type: Optional[GameDataType] = None,
+        with_content: bool = False,
+    ) -> List[GameData]:
+        # Call method with all GameDataTypes and concat all results
+        if type is None:
+            return list(
+                itertools.chain(
+                    *[
+                        self.get_all(cart_info, type, with_content)
+                        for type in GameDataType
+                        if type != GameDataType.ANALOGUE_POCKET_IMAGE
+                    ],
+                ),
+            )
+
+        with self._lock:
+            game_data_list = self._memory.get_all(cart_info, type, with_content)
+            current_contents = {}
+            for pending_write in self._pending:
+                if pending_write.type == type and pending_write.cart_info.id == cart_info.id:
+                    current_content = None
+                    if type == GameDataType.SAVE:
+                        current_content = self._get_current_content(pending_write, current_contents)
+                    game_data_list = WriteBehindMemory._apply_to(
+                        game_data_list,
+                        pending_write,
+                        with_content,
+                        current_content,
+                    )
+            return game_data_list
+
+    def get_many_by_name(
+        self,
+        names: List[str],
+        type: GameDataType,
+        with_content: bool = False,
+    ) -> Dict[str, Optional[GameData]]:
+        with self._lock:
+            pending_writes_by_name = {pw.name: pw for pw in self._pending if pw.type == type}
+            game_data_by_name = self._memory.get_many_by_name(
+                [name for name in names if name not in pending_writes_by_name],
+                type,
+                with_content,
+            )
+            game_data_by_name.update(
+                {
+                    name: pending_writes_by_name[name].to_game_data(with_content)
+                    for name in names
+                    if name in pending_writes_by_name
+                }
+            )
+            return game_data_by_name
+
+    def list_carts(self) -> List[CartSummary]:
+        with self._lock:
+            cart_summaries_by_id = {
+                cart_summary.cart_info.id: cart_summary for cart_summary in self._memory.list_carts()
+            }
+            current_contents = {}
+            for pending_write in self._pending:
+                cart_id = pending_write.cart_info.id
+                if pending_write.type == GameDataType.CART and cart_id not in cart_summaries_by_id:
+                    cart_summaries_by_id[cart_id] = CartSummary(cart_info=pending_write.cart_info)
+                if cart_id not in cart_summaries_by_id:
+                    continue
+
+                cart_summary = cart_summaries_by_id[cart_id]
+                if pending_write.type == GameDataType.GAME:
+                    cart_summary.game_installed = True
+                if pending_write.type == GameDataType.SAVE:
+                    if self._get_current_content(pending_write, current_contents) == pending_write.content:
+                        continue  # identical save, not historized
+                    cart_summary.n_saves += 1
+                    cart_summary.last_save_date = pending_write.date
+            return list(cart_summaries_by_id.values())
+
+    def open(self, name: str, type: GameDataType) -> Optional[BinaryIO]:
+        with self._lock:
+            pending_write = next(
+                (pw for pw in reversed(self._pending) if pw.type == type and pw.name == name),
+                None,
+            )
+            if pending_write is not None:
+                return io.BytesIO(pending_write.content)
+
+            return self._memory.open(name, type)
+
+    def get_checksums(self, type: GameDataType) -> Dict[str, Optional[str]]:
+        with self._lock:
+            checksums = self._memory.get_checksums(type)
+            for pending_write in self._pending:
+                if pending_write.type == type:
+                    checksums[pending_write.name] = hashlib.md5(pending_write.content).hexdigest()
+            return checksums
+
+    def update_configuration(self, dto: MemoryConfiguration):
+        """Update memory configuration, once all pending writes have been applied.
+
+        Args:
+            dto: Memory configuration.
+        """
+        self.flush()
+        self._memory.update_configuration(dto)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all pending writes have been applied.
+
+        Args:
+            timeout: Maximal time in seconds to wait. If None, wait until all pending writes have been applied.
+
+        Returns:
+            True if all pending writes have been applied, False if timeout has been reached.
+        """
+        with self._flushed:
+            return self._flushed.wait_for(lambda: not self._pending, timeout=timeout)
+
+    def close(self):
+        if not self.flush(timeout=CLOSE_TIMEOUT):
+            logger.info(f"Closing with pending writes, they will be saved on next start ({self.n_pending_writes=})")
+        self._memory.close()
+
+    def _apply_pending_writes(self):
+        """Apply pending writes to decorated memory, in submission order (executed by worker thread).
+
+        The lock is not held while saving into decorated memory, so that reads are not blocked by writes: until the
+        write is removed from pending writes, reads overlay it on decorated memory, whether it has been saved yet or not
+        (overlaying a save already saved has no effect, see `_apply_to`). A failing write is retried until it succeeds.
+        """
+        while True:
+            pending_write: PendingWrite = self._queue.get()
+            for attempt in itertools.count():
+                try:
+                    with self._apply_lock:
+                        self._memory.save(
+                            pending_write.cart_info,
+                            pending_write.content,
+                            pending_write.type,
+                            pending_write.metadata,
+                        )
+                except Exception as e:
+                    delay = RETRY_DELAYS[min(attempt, len(RETRY_DELAYS) - 1)]
+                    if attempt == len(RETRY_DELAYS) - 1:
+                        logger.error(
+                            f"Unable to save '{pending_write.name}', it is kept pending and will be retried "
+                            f"({pending_write.id=}): {e}",
+                            exc_info=True,
+                        )
+                    else:
+                        logger.info(f"Unable to apply a pending write, retrying ({pending_write.id=}, {attempt=}): {e}")
+                    time.sleep(delay)
+                else:
+                    break
+
+            self._discard_journal_entry(pending_write)
+            with self._lock:
+                self._pending.remove(pending_write)
+                self._flushed.notify_all()
+
+    def _replay_journal(self):
+        """Queue journal entries left by a previous run."""
+        for filepath in sorted(self._journal_path.glob(f"*{JOURNAL_ENTRY_EXTENSION}")):
+            try:
+                pending_write = PendingWrite.create_from_bytes(filepath.read_bytes())
+            except Exception as e:
+                logger.error(f"Unable to read journal entry ({filepath=}): {e}", exc_info=True)
+                filepath.rename(filepath.with_suffix(FAILED_JOURNAL_ENTRY_EXTENSION))
+                continue
+
+            logger.debug(f"Replaying journal entry ({pending_write.id=})")
+            self._pending.append(pending_write)
+            self._queue.put(pending_write)
+
+    def _get_journal_entry_filepath(self, pending_write: PendingWrite) -> Path:
+        return self._journal_path / f"{pending_write.id}{JOURNAL_ENTRY_EXTENSION}"
+
+    def _write_journal_entry(self, pending_write: PendingWrite):
+        """Durably write a journal entry (written to a temporary file, synced, then renamed)."""
+        filepath = self._get_journal_entry_filepath(pending_write)
+        tmp_filepath = filepath.with_suffix(".tmp")
+        with open(tmp_filepath, "wb") as f:
+            f.write(pending_write.bytes())
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filepath, filepath)
+
+        # Persist the rename itself (not supported on Windows)
+        if os.name == 'posix':
+            fd = os.open(str(self._journal_path), os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def _discard_journal_entry(self, pending_write: PendingWrite):
+        self._get_journal_entry_filepath(pending_write).unlink(missing_ok=True)
+
+    def _get_current_content(
+        self, pending_write: PendingWrite, current_contents: Dict[str, Optional[bytes]]
+    ) -> Optional[bytes]:
+        """Return the content of the game data a pending save replaces, i.e. the content of the previous pending write
+        of the same save, or else of the save in decorated memory (None if there is none).
+
+        Args:
+            pending_write: Pending write of a save, pending writes being browsed in submission order.
+            current_contents: Content of each save once the previous pending writes have been applied, by name (updated
+                with the pending write).
+        """
+        name = pending_write.name
+        if name not in current_contents:
+            game_data = self._memory.get_by_name(name, pending_write.type, True)
+            current_contents[name] = game_data.content if game_data is not None else None
+        current_content = current_contents[name]
+        current_contents[name] = pending_write.content
+        return current_content
+
+    @staticmethod
+    def _apply_to(
+        game_data_list: List[GameData],
+        pending_write: PendingWrite,
+        with_content: bool,
+        current_content: Optional[bytes] = None,
+    ) -> List[GameData]:
+        """Return the list of game data as it will be once the pending write has been applied.
+
+        Saves are historized the same way as LocalMemory does: current save gets the next free increment as a suffix,
+        unless its content is identical to the new one (current save is kept then). Other game data are overwritten.
+        """
+        name = pending_write.name
+        game_data_list = list(game_data_list)
+        current = next((game_data for game_data in game_data_list if game_data.name == name), None)
+        if current is not None:
+            if pending_write.type == GameDataType.SAVE and current_content == pending_write.content:
+                return game_data_list
+
+            game_data_list.remove(current)
+            if pending_write.type == GameDataType.SAVE:
+                increments = [
+                    int(m.group(1))
+                    for m in (re.match(rf"^{re.escape(name)}\.([1-9][0-9]*)$", gd.name) for gd in game_data_list)
+                    if m
+                ]
+                current.name = f"{name}.{max(increments, default=0) + 1}"
+                game_data_list.append(current)
+
+        game_data_list.append(pending_write.to_game_data(with_content))
+        return game_data_list
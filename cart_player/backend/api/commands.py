@@ -1,9 +1,11 @@
 from cart_player.backend.domain.commands import (
     BackupCartSaveCommand,
+    DumpCartBatchCommand,
     EraseCartSaveCommand,
     ExportToAnaloguePocketLibraryCommand,
     InstallCartGameCommand,
     ReadCartDataCommand,
     UpdateLocalMemoryConfigurationCommand,
+    VerifyMemoryCommand,
     WriteCartSaveCommand,
 )
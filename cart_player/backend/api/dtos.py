@@ -1 +1,8 @@
-from cart_player.backend.domain.dtos import CartInfo, GameData, GameImage, GameMetadata, LocalMemoryConfiguration
+from cart_player.backend.domain.dtos import (
+    CartInfo,
+    GameData,
+    GameDataVerification,
+    GameImage,
+    GameMetadata,
+    LocalMemoryConfiguration,
+)
@@ -1,12 +1,18 @@
 from cart_player.backend.domain.events import (
     BackupCartSaveProgressEvent,
+    CartBatchDumpedEvent,
     CartDataReadEvent,
+    CartDumpedEvent,
+    CartGameMetadataCompletedEvent,
     CartGameInstalledEvent,
     CartSaveBackupEvent,
     CartSaveErasedEvent,
     CartSaveWrittenEvent,
+    DumpCartBatchProgressEvent,
     EraseCartSaveProgressEvent,
     InstallCartGameProgressEvent,
     LocalMemoryConfigurationUpdatedEvent,
+    MemoryVerifiedEvent,
+    VerifyMemoryProgressEvent,
     WriteCartSaveProgressEvent,
 )
@@ -1,12 +1,12 @@
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from cart_player.backend.domain.dtos import CartInfo, GameImage, GameMetadata, LocalMemoryConfiguration
 from cart_player.core.domain.messages import BaseMessage
 
 
 class BackupCartSaveCommand(BaseMessage):
-    pass
+    device_id: Optional[str] = None
 
 
 class BackupSaveFileAfterPlayingCommand(BaseMessage):
@@ -14,8 +14,17 @@ class BackupSaveFileAfterPlayingCommand(BaseMessage):
     target_path: Path
 
 
+class DumpCartBatchCommand(BaseMessage):
+    device_ids: Optional[List[str]] = None
+    max_carts: Optional[int] = None
+    cart_timeout: float = 120
+    poll_interval: float = 1
+    backup_saves: bool = True
+    n_workers: int = 2
+
+
 class EraseCartSaveCommand(BaseMessage):
-    pass
+    device_id: Optional[str] = None
 
 
 class ExportToAnaloguePocketLibraryCommand(BaseMessage):
@@ -25,7 +34,11 @@ class ExportToAnaloguePocketLibraryCommand(BaseMessage):
 
 
 class InstallCartGameCommand(BaseMessage):
-    pass
+    device_id: Optional[str] = None
+
+
+class PrepareGameFileForPlayingCommand(BaseMessage):
+    game_name: str
 
 
 class ReadCartDataCommand(BaseMessage):
@@ -34,6 +47,7 @@ class ReadCartDataCommand(BaseMessage):
     skip_game_metadata: bool = False
     skip_game_image: bool = False
     raise_error: bool = True
+    device_id: Optional[str] = None
 
 
 class SetupGameFileAndSaveFileForPlayingCommand(BaseMessage):
@@ -46,5 +60,11 @@ class UpdateLocalMemoryConfigurationCommand(LocalMemoryConfiguration, BaseMessag
     pass
 
 
+class VerifyMemoryCommand(BaseMessage):
+    n_workers: int = 2
+    max_bytes_per_second: Optional[int] = 16 * 1024 * 1024
+
+
 class WriteCartSaveCommand(BaseMessage):
     save_name: str
+    device_id: Optional[str] = None
@@ -1,5 +1,6 @@
 from .cart_info import CartInfo
 from .game_data import GameData
+from .game_data_verification import GameDataVerification
 from .game_image import GameImage
 from .game_metadata import GameMetadata
 from .memory_configuration import LocalMemoryConfiguration, MemoryConfiguration
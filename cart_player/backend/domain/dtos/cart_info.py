@@ -15,6 +15,7 @@ class CartInfo(BaseModel):
     image_ratio_override: Optional[float] = None
     save_supported: bool = False
     sgb_supported: bool = False
+    rom_size: Optional[int] = None
 
     @property
     def id(self) -> Optional[str]:
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from cart_player.backend.utils.models import GameDataIntegrity, GameDataType
+
+
+class GameDataVerification(BaseModel):
+    name: str
+    type: GameDataType
+    integrity: GameDataIntegrity
+    md5: Optional[str]
+    crc: Optional[str]
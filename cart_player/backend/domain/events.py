@@ -2,7 +2,14 @@ from typing import List, Optional
 
 from pydantic import root_validator
 
-from cart_player.backend.domain.dtos import CartInfo, GameData, GameImage, GameMetadata, LocalMemoryConfiguration
+from cart_player.backend.domain.dtos import (
+    CartInfo,
+    GameData,
+    GameDataVerification,
+    GameImage,
+    GameMetadata,
+    LocalMemoryConfiguration,
+)
 from cart_player.core.domain.events import ProgressEvent
 from cart_player.core.domain.messages import BaseMessage
 
@@ -10,6 +17,7 @@ from cart_player.core.domain.messages import BaseMessage
 class CartOperationStatusEvent(BaseMessage):
     success: bool
     cart_info: Optional[CartInfo] = None
+    device_id: Optional[str] = None
 
     @root_validator
     def success_without_cart_info(cls, values):
@@ -25,12 +33,13 @@ class CartOperationStatusEvent(BaseMessage):
 
 
 class InstallCartGameProgressEvent(ProgressEvent):
-    pass
+    device_id: Optional[str] = None
 
 
 class CartGameInstalledEvent(BaseMessage):
     success: bool
     cart_info: Optional[CartInfo] = None
+    device_id: Optional[str] = None
 
     @root_validator
     def success_without_cart_info(cls, values):
@@ -46,7 +55,7 @@ class CartGameInstalledEvent(BaseMessage):
 
 
 class BackupCartSaveProgressEvent(ProgressEvent):
-    pass
+    device_id: Optional[str] = None
 
 
 class CartSaveBackupEvent(CartOperationStatusEvent):
@@ -54,7 +63,7 @@ class CartSaveBackupEvent(CartOperationStatusEvent):
 
 
 class EraseCartSaveProgressEvent(ProgressEvent):
-    pass
+    device_id: Optional[str] = None
 
 
 class CartSaveErasedEvent(CartOperationStatusEvent):
@@ -62,7 +71,7 @@ class CartSaveErasedEvent(CartOperationStatusEvent):
 
 
 class WriteCartSaveProgressEvent(ProgressEvent):
-    pass
+    device_id: Optional[str] = None
 
 
 class CartSaveWrittenEvent(CartOperationStatusEvent):
@@ -93,5 +102,33 @@ class CartDataReadEvent(CartOperationStatusEvent):
         return values
 
 
+class CartGameMetadataCompletedEvent(BaseMessage):
+    cart_info: CartInfo
+    device_id: Optional[str] = None
+
+
+class DumpCartBatchProgressEvent(ProgressEvent):
+    device_id: Optional[str] = None
+
+
+class CartDumpedEvent(CartOperationStatusEvent):
+    save_backed_up: bool = False
+
+
+class CartBatchDumpedEvent(BaseMessage):
+    success: bool
+    cart_infos: List[CartInfo] = []
+    n_failures: int = 0
+
+
 class LocalMemoryConfigurationUpdatedEvent(BaseMessage):
     new_memory_configuration: LocalMemoryConfiguration
+
+
+class VerifyMemoryProgressEvent(ProgressEvent):
+    pass
+
+
+class MemoryVerifiedEvent(BaseMessage):
+    success: bool
+    verifications: List[GameDataVerification] = []
@@ -1,4 +1,5 @@
 from .cart_info import CartInfo
+from .cart_summary import CartSummary
 from .game_data import GameData
 from .game_image import GameImage
 from .game_metadata import GameMetadata
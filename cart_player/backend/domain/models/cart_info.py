@@ -23,6 +23,8 @@ class CartInfo:
         id_override: Override for the identifier of a cart.
         image_ratio_override: Override for the image ratio.
         save_supported: True if cart support saving, False otherwise.
+        sgb_supported: True if cart support SGB mode, False otherwise.
+        rom_size: ROM size in bytes, as declared by the cart header (None if unknown).
 
     Attributes:
         title: Cart title.
@@ -34,6 +36,7 @@ class CartInfo:
         image_ratio_override: Override for the image ratio.
         save_supported: True if cart support saving, False otherwise.
         sgb_supported: True if cart support SGB mode, False otherwise.
+        rom_size: ROM size in bytes, as declared by the cart header (None if unknown).
 
     Properties:
         id: Identifier of a cart.
@@ -51,6 +54,7 @@ class CartInfo:
         image_ratio_override: Optional[float] = None,
         save_supported: bool = False,
         sgb_supported: bool = False,
+        rom_size: Optional[int] = None,
     ):
         self.title = title
         self.code = code
@@ -61,6 +65,7 @@ class CartInfo:
         self.image_ratio_override = image_ratio_override
         self.save_supported = save_supported
         self.sgb_supported = sgb_supported
+        self.rom_size = rom_size
 
     @property
     def id(self) -> str:
@@ -180,4 +185,5 @@ class CartInfo:
             image_ratio_override=dto.image_ratio_override,
             save_supported=dto.save_supported,
             sgb_supported=dto.sgb_supported,
+            rom_size=dto.rom_size,
         )
@@ -0,0 +1,36 @@
+from datetime import datetime
+from typing import Optional
+
+from .cart_info import CartInfo
+
+
+class CartSummary:
+    """Summary of the game data stored for a cart.
+
+    Args:
+        cart_info: Cart info.
+        game_installed: True if game is installed, False otherwise.
+        n_saves: Number of saves (including historized ones).
+        last_save_date: Date of the most recent save, None if there is no save.
+
+    Attributes:
+        cart_info: Cart info.
+        game_installed: True if game is installed, False otherwise.
+        n_saves: Number of saves (including historized ones).
+        last_save_date: Date of the most recent save, None if there is no save.
+    """
+
+    def __init__(
+        self,
+        cart_info: CartInfo,
+        game_installed: bool = False,
+        n_saves: int = 0,
+        last_save_date: Optional[datetime] = None,
+    ):
+        self.cart_info = cart_info
+        self.game_installed = game_installed
+        self.n_saves = n_saves
+        self.last_save_date = last_save_date
+
+    def __str__(self):
+        return f"CartSummary({self.cart_info.id=}, {self.game_installed=}, {self.n_saves=}, {self.last_save_date=})"
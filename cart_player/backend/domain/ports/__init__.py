@@ -1,5 +1,7 @@
-from .cart_flasher import CartFlasher
+from .cart_flasher import CartFlasher, JobPriority
+from .cart_flasher_pool import CartFlasherPool
 from .game_image_library import GameImageLibrary
 from .game_library import GameLibrary
+from .game_library_cache import GameLibraryCache
 from .game_metadata_library import GameMetadataLibrary
 from .memory import Memory
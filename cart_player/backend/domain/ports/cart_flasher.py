@@ -1,31 +1,51 @@
 import abc
+import threading
+import time
 from contextlib import contextmanager
-from typing import Callable
+from datetime import timedelta
+from enum import IntEnum
+from pathlib import Path
+from typing import Callable, Optional
 
 from cart_player.backend.domain.models import CartInfo
+from cart_player.core import metrics
 from cart_player.core.exceptions import NoCartInCartFlasherException
-from cart_player.core.utils import lockedclass, lockedmethod
 
 
-@lockedclass
+class JobPriority(IntEnum):
+    """Priority of sequences of cart flasher operations waiting for a device (lowest value first, see
+    `CartFlasherPool.acquire`): quick probes are not stuck behind bulk transfers."""
+
+    CART_INFO = 0
+    SAVE = 1
+    GAME = 2
+
+
 class CartFlasher(abc.ABC):
     """Cart flasher, allowing to interact with real carts.
 
+    Operations run one at a time: an operation requested while cart flasher is busy waits for it. Operations are usually
+    requested through `CartFlasherPool.acquire`, which reserves the cart flasher and queues requests by priority, so
+    this only guards direct uses of a cart flasher.
+
     Properties:
         cart_inserted: True if a cart is inserted.
-        is_busy: True if cart flasher is not available.
+        is_busy: True if cart flasher is running an operation.
     """
 
     def __init__(self):
         self._busy = False
+        self._lock = threading.Lock()
 
     @contextmanager
     def use_flasher(self):
-        self._busy = True
-        try:
-            yield
-        finally:
-            self._busy = False
+        """Wait for the running operation (if any), then keep cart flasher busy until the end of the context."""
+        with self._lock:
+            self._busy = True
+            try:
+                yield
+            finally:
+                self._busy = False
 
     @property
     @abc.abstractmethod
@@ -35,27 +55,60 @@ class CartFlasher(abc.ABC):
 
     @property
     def is_busy(self) -> bool:
-        """True if cart flasher is busy."""
+        """True if cart flasher is running an operation."""
         return self._busy
 
-    @lockedmethod
-    def read_cart_info(self) -> CartInfo:
+    def close(self):
+        """Release resources held by cart flasher."""
+        pass
+
+    def estimate_duration(self, cart_info: CartInfo, operation: str) -> Optional[timedelta]:
+        """Predict the duration of an operation before it starts (e.g. from past operations), so that the ETA of a
+        sequence of operations can include the operations not started yet. Durations are not predicted by default.
+
+        Args:
+            cart_info: Cart info of the inserted cartridge.
+            operation: Name of the operation (name of the method performing it, e.g. 'dump_game').
+
+        Returns:
+            Predicted duration, None if it cannot be predicted.
+        """
+        return None
+
+    def read_cart_info(self, use_cache: bool = False) -> CartInfo:
         """Read the info from the cart connected to the cart flasher.
 
+        Durations of cached and uncached reads are available through `cart_player.core.metrics`
+        ('cart_flasher.read_cart_info.*').
+
+        Args:
+            use_cache: If True, cart info read previously may be returned if cart flasher still considers it valid.
+
         Raises:
             NoCartInCartFlasherException: If no cart in cart flasher.
-            RuntimeError: If cart flasher is busy.
             RuntimeError: If unexpected error occured.
         """
         if not self.cart_inserted:
             raise NoCartInCartFlasherException
-        if self.is_busy:
-            raise RuntimeError("Cannot read cart info when cart flasher is busy.")
+
+        if use_cache:
+            start_time = time.perf_counter()
+            cart_info = self._get_cached_cart_info()
+            if cart_info is not None:
+                metrics.record("cart_flasher.read_cart_info.cached", time.perf_counter() - start_time)
+                return cart_info
 
         with self.use_flasher():
-            cart_info = self._read_cart_info()
+            with metrics.timer("cart_flasher.read_cart_info.uncached"):
+                cart_info = self._read_cart_info()
         return cart_info
 
+    def _get_cached_cart_info(self) -> Optional[CartInfo]:
+        """Return the info of the inserted cart if already read and still valid, None otherwise.
+        Cart info is not cached by default.
+        """
+        return None
+
     @abc.abstractmethod
     def _read_cart_info(self) -> CartInfo:
         """Read the info from the cart connected to the cart flasher.
@@ -66,7 +119,6 @@ class CartFlasher(abc.ABC):
         """
         pass
 
-    @lockedmethod
     def read_game(self, cart_info: CartInfo, report_progress_callback: Callable[[float], None]) -> bytes:
         """Read game from the cart connected to the cart flasher.
 
@@ -76,7 +128,6 @@ class CartFlasher(abc.ABC):
 
         Raises:
             NoCartInCartFlasherException: If no cart in cart flasher.
-            RuntimeError: If cart flasher is busy.
             RuntimeError: If unexpected error occured.
 
         Returns:
@@ -84,8 +135,6 @@ class CartFlasher(abc.ABC):
         """
         if not self.cart_inserted:
             raise NoCartInCartFlasherException
-        if self.is_busy:
-            raise RuntimeError("Cannot install a game when cart flasher is busy.")
 
         with self.use_flasher():
             file_content = self._read_game(cart_info, report_progress_callback)
@@ -108,30 +157,57 @@ class CartFlasher(abc.ABC):
         """
         pass
 
-    @lockedmethod
-    def read_save(self, cart_info: CartInfo, report_progress_callback: Callable[[float], None]) -> bytes:
-        """Read save from the cart connected to the cart flasher.
+    def dump_game(self, cart_info: CartInfo, filepath: Path, report_progress_callback: Callable[[float], None]):
+        """Dump game from the cart connected to the cart flasher into a file, without loading it in memory when
+        possible.
 
         Args:
             cart_info: Cart info of the inserted cartridge.
+            filepath: Path to the file to create. It must not exist.
             report_progress_callback: Method to be called to report current progress of the process (in [0; 1]).
 
         Raises:
-            NoCartInCartFlasherException: No cart in cart flasher.
-            RuntimeError: Cart flasher is busy.
+            NoCartInCartFlasherException: If no cart in cart flasher.
+            RuntimeError: If unexpected error occured.
+        """
+        if not self.cart_inserted:
+            raise NoCartInCartFlasherException
+
+        with self.use_flasher():
+            self._dump_game(cart_info, filepath, report_progress_callback)
+
+    def _dump_game(self, cart_info: CartInfo, filepath: Path, report_progress_callback: Callable[[float], None]):
+        """Dump game from the cart connected to the cart flasher into a file.
+        Perform the actual operations with the cart flasher. By default, game is read with `_read_game`, then written.
+
+        Args:
+            cart_info: Cart info of the inserted cartridge.
+            filepath: Path to the file to create. It must not exist.
+            report_progress_callback: Method to be called to report current progress of the process (in [0; 1]).
+
+        Raises:
+            RuntimeError: If unexpected error occured.
+        """
+        content = self._read_game(cart_info, report_progress_callback)
+        with open(filepath, "xb") as f:
+            f.write(content)
+
+    def read_save(self, cart_info: CartInfo, report_progress_callback: Callable[[float], None]) -> bytes:
+        """Read save from the cart connected to the cart flasher.
+
+        Args:
+            cart_info: Cart info of the inserted cartridge.
+            report_progress_callback: Method to be called to report current progress of the process (in [0; 1]).
 
         Returns:
             Bytes read.
 
         Raises:
             NoCartInCartFlasherException: No cart in cart flasher.
-            RuntimeError: If cart flasher is busy.
             RuntimeError: If unexpected error occured.
         """
         if not self.cart_inserted:
             raise NoCartInCartFlasherException
-        if self.is_busy:
-            raise RuntimeError("Cannot install a game when cart flasher is busy.")
 
         with self.use_flasher():
             file_content = self._read_save(cart_info, report_progress_callback)
@@ -154,7 +230,6 @@ class CartFlasher(abc.ABC):
         """
         pass
 
-    @lockedmethod
     def erase_save(self, cart_info: CartInfo, report_progress_callback: Callable[[float], None]):
         """Erase save from the cart connected to the cart flasher.
 
@@ -164,17 +239,10 @@ class CartFlasher(abc.ABC):
 
         Raises:
             NoCartInCartFlasherException: No cart in cart flasher.
-            RuntimeError: Cart flasher is busy.
-
-        Raises:
-            NoCartInCartFlasherException: No cart in cart flasher.
-            RuntimeError: If cart flasher is busy.
             RuntimeError: If unexpected error occured.
         """
         if not self.cart_inserted:
             raise NoCartInCartFlasherException
-        if self.is_busy:
-            raise RuntimeError("Cannot install a game when cart flasher is busy.")
 
         with self.use_flasher():
             file_content = self._erase_save(cart_info, report_progress_callback)
@@ -194,7 +262,6 @@ class CartFlasher(abc.ABC):
         """
         pass
 
-    @lockedmethod
     def write_save(self, cart_info: CartInfo, data: bytes, report_progress_callback: Callable[[float], None]):
         """Write save from the cart connected to the cart flasher.
 
@@ -205,17 +272,10 @@ class CartFlasher(abc.ABC):
 
         Raises:
             NoCartInCartFlasherException: No cart in cart flasher.
-            RuntimeError: Cart flasher is busy.
-
-        Raises:
-            NoCartInCartFlasherException: No cart in cart flasher.
-            RuntimeError: If cart flasher is busy.
             RuntimeError: If unexpected error occured.
         """
         if not self.cart_inserted:
             raise NoCartInCartFlasherException
-        if self.is_busy:
-            raise RuntimeError("Cannot write a save when cart flasher is busy.")
 
         with self.use_flasher():
             file_content = self._write_save(cart_info, data, report_progress_callback)
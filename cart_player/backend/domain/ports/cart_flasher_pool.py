@@ -0,0 +1,98 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from cart_player.core import metrics
+from cart_player.core.scheduler import Job, JobScheduler
+
+from .cart_flasher import CartFlasher, JobPriority
+
+DEFAULT_DEVICE_ID = "default"
+
+
+class CartFlasherPool:
+    """Pool of cart flashers (one per device), so that several carts can be handled in parallel.
+
+    Each cart flasher is reserved by a single sequence of operations at a time (see `acquire`): sequences on different
+    devices run in parallel, sequences on the same device are queued by priority (see `JobPriority`), so that a handler
+    reading cart info then transferring data is never interleaved with another one. Queues are available through
+    `get_queue`, and waiting times through `cart_player.core.metrics` ('cart_flasher_pool.queue.wait').
+
+    Args:
+        cart_flashers: Cart flashers by device identifier (e.g. port or serial number of the device).
+
+    Properties:
+        device_ids: Identifiers of all devices, in their order of preference.
+    """
+
+    def __init__(self, cart_flashers: Dict[str, CartFlasher]):
+        if not cart_flashers:
+            raise ValueError("A cart flasher pool requires at least one cart flasher.")
+
+        self._cart_flashers = dict(cart_flashers)
+        self._schedulers = {device_id: JobScheduler() for device_id in self._cart_flashers}
+        self._n_users: Dict[str, int] = {device_id: 0 for device_id in self._cart_flashers}
+        self._lock = threading.Lock()
+
+    @property
+    def device_ids(self) -> List[str]:
+        """Identifiers of all devices, in their order of preference."""
+        return list(self._cart_flashers)
+
+    def get(self, device_id: str) -> CartFlasher:
+        """Return the cart flasher of a device.
+
+        Raises:
+            KeyError: If device is unknown.
+        """
+        return self._cart_flashers[device_id]
+
+    def get_queue(self, device_id: str) -> List[Job]:
+        """Return the sequence of operations reserving a device (if any) followed by those waiting for it, in the order
+        they would reserve it now: the index of a job is its position in the queue (0 if running), and its waiting time
+        is available through `Job.wait_time`.
+
+        Raises:
+            KeyError: If device is unknown.
+        """
+        return self._schedulers[device_id].jobs
+
+    @contextmanager
+    def acquire(
+        self,
+        device_id: Optional[str] = None,
+        priority: JobPriority = JobPriority.GAME,
+    ) -> Iterator[Tuple[str, CartFlasher]]:
+        """Reserve a cart flasher until the end of the context, waiting for its turn if it is already reserved.
+
+        Args:
+            device_id: Identifier of the device to reserve. If None, the device with the fewest users (reserving or
+                waiting for it) is reserved.
+            priority: Priority of the sequence of operations, usually the priority of its main operation.
+
+        Yields:
+            Identifier of the reserved device and its cart flasher.
+
+        Raises:
+            KeyError: If device is unknown.
+        """
+        if device_id is not None and device_id not in self._cart_flashers:
+            raise KeyError(f"Unknown cart flasher device ({device_id=}).")
+
+        with self._lock:
+            if device_id is None:
+                device_id = min(self._cart_flashers, key=lambda _device_id: self._n_users[_device_id])
+            self._n_users[device_id] += 1
+
+        try:
+            with self._schedulers[device_id].schedule(priority.name.lower(), priority) as job:
+                metrics.record("cart_flasher_pool.queue.wait", job.wait_time)
+                yield device_id, self._cart_flashers[device_id]
+        finally:
+            with self._lock:
+                self._n_users[device_id] -= 1
+
+    def close(self):
+        """Release resources held by all cart flashers."""
+        for cart_flasher in self._cart_flashers.values():
+            cart_flasher.close()
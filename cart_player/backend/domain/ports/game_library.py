@@ -1,22 +1,63 @@
-from typing import List
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Tuple
 
+from cart_player.backend import config
 from cart_player.backend.domain.models import CartInfo, GameImage, GameMetadata
 from cart_player.core.exceptions import GameImageNotFoundException, GameMetadataNotFoundException
 
 from .game_image_library import GameImageLibrary
+from .game_library_cache import GameLibraryCache
 from .game_metadata_library import GameMetadataLibrary
 
+logger = logging.getLogger(f"{config.LOGGER_NAME}::GameLibrary")
+
+DEFAULT_METADATA_LIBRARY_TIMEOUT = 1.0  # per library, from the start of its lookup
+DEFAULT_METADATA_TIMEOUT = 2.0  # overall, from the start of the lookup
+DEFAULT_MAX_WORKERS = 8
+POLL_INTERVAL = 0.05  # while waiting for a library to start its lookup
+LATE_METADATA_MAX_ENTRIES = 64  # completed game metadata kept for the next lookup (without cache)
+LATE_METADATA_TTL = 10 * 60.0
+
 
 class GameLibrary:
-    """Game library, providing information and images based on cart info."""
+    """Game library, providing information and images based on cart info.
+
+    Metadata libraries are queried concurrently, on an executor shared by all lookups, and their results are merged by
+    order of priority (as if they were queried one after another).
+
+    Args:
+        metadata_libraries: Game metadata libraries, by order of priority.
+        image_libraries: Game image libraries, by order of priority.
+        cache: Cache of lookups (hits and misses). If None, libraries are queried on each lookup.
+        executor: Executor querying metadata libraries. If None, a thread pool is created.
+        metadata_library_timeout: Deadline of each metadata library (see `get_metadata_within_deadline`), in seconds.
+        metadata_timeout: Deadline of all metadata libraries (see `get_metadata_within_deadline`), in seconds.
+    """
 
     def __init__(
         self,
         metadata_libraries: List[GameMetadataLibrary],
         image_libraries: List[GameImageLibrary],
+        cache: Optional[GameLibraryCache] = None,
+        executor: Optional[Executor] = None,
+        metadata_library_timeout: float = DEFAULT_METADATA_LIBRARY_TIMEOUT,
+        metadata_timeout: float = DEFAULT_METADATA_TIMEOUT,
     ):
         self._metadata_libraries = metadata_libraries
         self._image_libraries = image_libraries
+        self._cache = cache
+        self._executor = executor or ThreadPoolExecutor(
+            max_workers=DEFAULT_MAX_WORKERS,
+            thread_name_prefix="GameLibrary",
+        )
+        self._metadata_library_timeout = metadata_library_timeout
+        self._metadata_timeout = metadata_timeout
+        self._lock = threading.Lock()
+        self._late_metadata: OrderedDict[Tuple[str, str], Tuple[GameMetadata, float]] = OrderedDict()  # with expiry
 
     def get_image(self, cart_info: CartInfo) -> GameImage:
         """Return the game image corresponding to the provided cart info.
@@ -29,16 +70,19 @@ class GameLibrary:
             Game image corresponding to the provided cart info.
             If it cannot be found, an empty game image is returned instead.
         """
-        for image_library in self._image_libraries:
-            try:
-                return image_library.get_image(cart_info)
-            except GameImageNotFoundException:
-                continue
+        if self._cache is not None:
+            game_image = self._cache.get_image(cart_info)
+            if game_image is not None:
+                return game_image
 
-        return GameImage()
+        game_image = self._get_image(cart_info)
+        if self._cache is not None:
+            self._cache.save_image(cart_info, game_image)
+
+        return game_image
 
     def get_metadata(self, cart_info: CartInfo) -> GameMetadata:
-        """Return the game metadata corresponding to the provided cart info.
+        """Return the game metadata corresponding to the provided cart info, once all metadata libraries answered.
 
         Args:
             cart_info: Cart info.
@@ -47,15 +91,175 @@ class GameLibrary:
             Game metadata corresponding to the provided cart info.
             If it cannot be found, an empty game metadata is returned instead.
         """
-        game_metadata = GameMetadata()
-        for metadata_library in self._metadata_libraries:
+        game_metadata, _ = self._get_metadata(cart_info, None)
+        return game_metadata
+
+    def get_metadata_within_deadline(
+        self,
+        cart_info: CartInfo,
+        on_late_metadata: Optional[Callable[[GameMetadata], None]] = None,
+    ) -> Tuple[GameMetadata, bool]:
+        """Return the game metadata corresponding to the provided cart info, without waiting for metadata libraries
+        beyond their deadline.
+
+        A metadata library is late once it has run for longer than its own deadline, or once the lookup has run for
+        longer than the overall deadline. Game metadata of the libraries that answered in time is then returned, and
+        the complete game metadata is provided to `on_late_metadata` once late libraries answered.
+
+        Args:
+            cart_info: Cart info.
+            on_late_metadata: Called (from another thread) with the complete game metadata if it differs from the game
+                metadata returned.
+
+        Returns:
+            Game metadata corresponding to the provided cart info (empty if it cannot be found), and True if it is
+            complete, False if some libraries are late.
+        """
+        return self._get_metadata(cart_info, time.monotonic() + self._metadata_timeout, on_late_metadata)
+
+    def _get_image(self, cart_info: CartInfo) -> GameImage:
+        for image_library in self._image_libraries:
             try:
-                new_game_metadata = metadata_library.get_metadata(cart_info)
-            except GameMetadataNotFoundException:
+                return image_library.get_image(cart_info)
+            except GameImageNotFoundException:
                 continue
 
-            game_metadata.add_from(new_game_metadata)
-            if game_metadata.is_complete():
+        return GameImage()
+
+    def _get_metadata(
+        self,
+        cart_info: CartInfo,
+        deadline: Optional[float],
+        on_late_metadata: Optional[Callable[[GameMetadata], None]] = None,
+    ) -> Tuple[GameMetadata, bool]:
+        """Look up game metadata, waiting for libraries until the deadline (monotonic time, no deadline if None)."""
+        key = (cart_info.support.value, cart_info.id)
+        with self._lock:
+            game_metadata, expires = self._late_metadata.pop(key, (None, 0.0))
+        if game_metadata is not None and expires > time.monotonic():  # completed after a previous lookup
+            return game_metadata, True
+
+        if self._cache is not None:
+            game_metadata = self._cache.get_metadata(cart_info)
+            if game_metadata is not None:
+                return game_metadata, True
+
+        # Query all libraries at once
+        start_times: Dict[int, float] = {}
+        futures = [
+            self._executor.submit(self._query_metadata_library, metadata_library, cart_info, start_times, i)
+            for i, metadata_library in enumerate(self._metadata_libraries)
+        ]
+        for i, future in enumerate(futures):
+            if not self._wait_metadata_library(future, start_times, i, deadline):
                 break
 
-        return game_metadata
+        # All libraries answered in time (or the game metadata of those answering first is complete)
+        game_metadata, complete = self._merge_metadata(futures)
+        if complete:
+            for future in futures:
+                future.cancel()
+            if self._cache is not None:
+                self._cache.save_metadata(cart_info, game_metadata)
+            return game_metadata, True
+
+        # Some libraries are late: complete game metadata once they answer
+        logger.debug(f"Metadata libraries are late, game metadata is partial ({cart_info.id=})")
+        n_pending = len(futures)
+
+        def on_done(_: Future):
+            nonlocal n_pending
+            with self._lock:
+                n_pending -= 1
+                if n_pending > 0:
+                    return
+            self._complete_metadata(cart_info, futures, game_metadata, on_late_metadata)
+
+        for future in futures:
+            future.add_done_callback(on_done)
+
+        return game_metadata, False
+
+    def _complete_metadata(
+        self,
+        cart_info: CartInfo,
+        futures: List[Future],
+        partial_game_metadata: GameMetadata,
+        on_late_metadata: Optional[Callable[[GameMetadata], None]],
+    ):
+        """Merge game metadata once all libraries answered, and provide it to the next lookup and to the callback."""
+        try:
+            game_metadata, _ = self._merge_metadata(futures)
+        except Exception as e:
+            logger.error(f"An error occurred while looking up game metadata: {e}", exc_info=True)
+            return
+
+        if self._cache is not None:
+            self._cache.save_metadata(cart_info, game_metadata)
+        else:
+            with self._lock:
+                key = (cart_info.support.value, cart_info.id)
+                self._late_metadata[key] = (game_metadata, time.monotonic() + LATE_METADATA_TTL)
+                self._late_metadata.move_to_end(key)
+                while len(self._late_metadata) > LATE_METADATA_MAX_ENTRIES:
+                    self._late_metadata.popitem(last=False)
+
+        if on_late_metadata is not None and game_metadata != partial_game_metadata:
+            on_late_metadata(game_metadata)
+
+    def _wait_metadata_library(
+        self,
+        future: Future,
+        start_times: Dict[int, float],
+        i: int,
+        deadline: Optional[float],
+    ) -> bool:
+        """Wait for a library until its deadline or the overall deadline. Return True if it answered in time."""
+        while not future.done():
+            if deadline is None:
+                wait([future])
+                break
+
+            start_time = start_times.get(i, None)
+            library_deadline = start_time + self._metadata_library_timeout if start_time is not None else deadline
+            timeout = min(deadline, library_deadline) - time.monotonic()
+            if timeout <= 0:
+                return False
+            wait([future], timeout=timeout if start_time is not None else min(timeout, POLL_INTERVAL))
+
+        return True
+
+    @staticmethod
+    def _query_metadata_library(
+        metadata_library: GameMetadataLibrary,
+        cart_info: CartInfo,
+        start_times: Dict[int, float],
+        i: int,
+    ) -> Optional[GameMetadata]:
+        start_times[i] = time.monotonic()
+        try:
+            return metadata_library.get_metadata(cart_info)
+        except GameMetadataNotFoundException:
+            return None
+
+    @staticmethod
+    def _merge_metadata(futures: List[Future]) -> Tuple[GameMetadata, bool]:
+        """Merge the game metadata of the libraries that answered, by order of priority.
+
+        Returns:
+            Merged game metadata, and True if it does not depend on libraries that did not answer (all answered, or
+            those answering first provided complete game metadata), False otherwise.
+        """
+        game_metadata, complete = GameMetadata(), True
+        for future in futures:
+            if game_metadata.is_complete() and complete:
+                break
+            if not future.done():
+                complete = False
+                continue
+
+            new_game_metadata = future.result()
+            if new_game_metadata is not None:
+                game_metadata.add_from(new_game_metadata)
+
+        return game_metadata, complete
@@ -0,0 +1,53 @@
+import abc
+from typing import Optional
+
+from cart_player.backend.domain.models import CartInfo, GameImage, GameMetadata
+
+
+class GameLibraryCache(abc.ABC):
+    """Cache of game library lookups, storing both found results (hits) and results that could not be found (misses),
+    so that a cart is not looked up again until its entry expires."""
+
+    @abc.abstractmethod
+    def get_metadata(self, cart_info: CartInfo) -> Optional[GameMetadata]:
+        """Return the cached game metadata of a cart.
+
+        Args:
+            cart_info: Cart info.
+
+        Returns:
+            Cached game metadata (empty if cached as not found), None if not cached or expired.
+        """
+        pass
+
+    @abc.abstractmethod
+    def save_metadata(self, cart_info: CartInfo, game_metadata: GameMetadata):
+        """Cache the game metadata of a cart (as not found if it is empty).
+
+        Args:
+            cart_info: Cart info.
+            game_metadata: Game metadata returned by the game library.
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_image(self, cart_info: CartInfo) -> Optional[GameImage]:
+        """Return the cached game image of a cart.
+
+        Args:
+            cart_info: Cart info.
+
+        Returns:
+            Cached game image (without data if cached as not found), None if not cached or expired.
+        """
+        pass
+
+    @abc.abstractmethod
+    def save_image(self, cart_info: CartInfo, game_image: GameImage):
+        """Cache the game image of a cart (as not found if it has no data).
+
+        Args:
+            cart_info: Cart info.
+            game_image: Game image returned by the game library.
+        """
+        pass
@@ -1,8 +1,12 @@
 import abc
-from typing import List, Optional
+import tempfile
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional
+from uuid import uuid4
 
 from cart_player.backend.domain.dtos import MemoryConfiguration
-from cart_player.backend.domain.models import CartInfo, GameData
+from cart_player.backend.domain.models import CartInfo, CartSummary, GameData
+from cart_player.backend.utils.files import hash_file
 from cart_player.backend.utils.models import GameDataType
 
 
@@ -25,6 +29,46 @@ class Memory(abc.ABC):
         """
         pass
 
+    def save_file(
+        self,
+        cart_info: CartInfo,
+        filepath: Path,
+        type: GameDataType,
+        metadata: dict = {},
+    ) -> Dict[str, str]:
+        """Save the content of a file into memory, without loading it in memory when possible.
+        The file is moved into memory: it no longer exists once saved.
+
+        By default, file content is read, then saved with `save`.
+
+        Args:
+            cart_info: Information about the cart whose content has to be saved.
+            filepath: Path to the file to save (e.g. provided by `get_temporary_filepath`).
+            type: Type of game data.
+            metadata: Metadata of the file to save (see `save`).
+
+        Returns:
+            Checksums of the file content ('md5', 'sha1' and 'crc').
+
+        Raises:
+            RuntimeError: If unable to save content into memory.
+            ValueError: If mandatory data is missing in metadata (see concrete implementation).
+        """
+        checksums = hash_file(filepath)
+        self.save(cart_info, filepath.read_bytes(), type, metadata)
+        filepath.unlink()
+        return checksums
+
+    def get_temporary_filepath(self) -> Path:
+        """Return a path to a new temporary file (not created yet), where game data can be written before being saved
+        with `save_file`. Temporary files are located so that saving them is as cheap as possible.
+        The caller is responsible for deleting the file if it is not saved.
+
+        Returns:
+            Path to a temporary file, which does not exist.
+        """
+        return Path(tempfile.gettempdir()) / f"cart_player_{uuid4().hex}.tmp"
+
     @abc.abstractmethod
     def get_by_name(self, name: str, type: GameDataType, with_content: bool = False) -> Optional[GameData]:
         """Return the requested game data associated with the provided name (<filename>.<extension>).
@@ -39,6 +83,51 @@ class Memory(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def export(self, name: str, type: GameDataType, target_filepath: Path) -> bool:
+        """Export the requested game data associated with the provided name (<filename>.<extension>) into a file,
+        without loading its content.
+
+        Args:
+            name: Name of the game data to be exported.
+            type: Type of game data to export. If SAVE, exports the most recent one.
+            target_filepath: Path to the file to create. It must not exist.
+
+        Returns:
+            True if game data has been exported, False if no game data has been found.
+
+        Raises:
+            RuntimeError: If unable to export game data.
+        """
+        pass
+
+    def prepare_export(self, name: str, type: GameDataType):
+        """Prepare the export of the requested game data associated with the provided name (<filename>.<extension>),
+        so that a following call to `export` is as cheap as possible. Does nothing by default.
+
+        Args:
+            name: Name of the game data to be exported.
+            type: Type of game data to export.
+
+        Raises:
+            RuntimeError: If unable to prepare the export of game data.
+        """
+        pass
+
+    def get_version(self, name: str, type: GameDataType) -> Optional[str]:
+        """Return a token identifying the current version of the requested game data associated with the provided name
+        (<filename>.<extension>). Token changes whenever game data is modified, and is cheap to compute.
+
+        Args:
+            name: Name of the game data.
+            type: Type of game data. If SAVE, refers to the most recent one.
+
+        Returns:
+            Token identifying the current version of game data, None if no game data has been found or if versions
+            are not supported.
+        """
+        return None
+
     @abc.abstractmethod
     def get_all(
         self,
@@ -58,6 +147,63 @@ class Memory(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def get_many_by_name(
+        self,
+        names: List[str],
+        type: GameDataType,
+        with_content: bool = False,
+    ) -> Dict[str, Optional[GameData]]:
+        """Return the requested game data associated with each provided name (<filename>.<extension>).
+        Equivalent to calling `get_by_name` for each name, in a single pass over memory.
+
+        Args:
+            names: Names of the game data to be retrieved.
+            type: Type of game data to retrieve.
+            with_content: True if content must be retrieved, False else.
+
+        Returns:
+            Game data associated to each provided name, None for names whose game data has not been found.
+        """
+        pass
+
+    @abc.abstractmethod
+    def list_carts(self) -> List[CartSummary]:
+        """Return a summary of every cart known by memory, in a single pass over memory.
+
+        Returns:
+            The list of summaries of all carts known by memory.
+        """
+        pass
+
+    @abc.abstractmethod
+    def open(self, name: str, type: GameDataType) -> Optional[BinaryIO]:
+        """Open the requested game data associated with the provided name (<filename>.<extension>) for reading,
+        without loading its content.
+
+        Args:
+            name: Name of the game data to be opened.
+            type: Type of game data to open.
+
+        Returns:
+            Binary stream over the content of game data (to be closed by the caller), None if no game data has been
+            found.
+        """
+        pass
+
+    @abc.abstractmethod
+    def get_checksums(self, type: GameDataType) -> Dict[str, Optional[str]]:
+        """Return the checksum (md5) recorded when saving each game data of the provided type, by name.
+
+        Args:
+            type: Type of game data.
+
+        Returns:
+            Recorded checksum of all game data of the provided type by name, None for game data whose checksum has not
+            been recorded.
+        """
+        pass
+
     @abc.abstractmethod
     def update_configuration(self, dto: MemoryConfiguration):
         """Update memory configuration.
@@ -66,3 +212,7 @@ class Memory(abc.ABC):
             dto: Memory configuration.
         """
         pass
+
+    def close(self):
+        """Release resources held by memory. Pending operations are completed before returning."""
+        pass
@@ -1,4 +1,7 @@
 from pathlib import Path
 
+LAUNCHBOX_FOLDER_PATH = Path("cart_player/backend/resources/launchbox")
+LIBRETRO_METADAT_FOLDER_PATH = Path("cart_player/backend/resources/libretro/libretro-database/metadat")
 MD5_FOLDER_PATH = Path("cart_player/backend/resources/md5")
 NOINTRO_FOLDER_PATH = Path("cart_player/backend/resources/no-intro")
+RESOURCE_DATABASE_FILEPATH = Path("cart_player/backend/resources/resources.db")
@@ -1,11 +1,15 @@
+from .event_handlers import CartDataReadEventHandler
 from .handlers import (
     BackupCartSaveHandler,
     BackupSaveFileAfterPlayingHandler,
+    DumpCartBatchHandler,
     EraseCartSaveHandler,
     ExportToAnaloguePocketLibraryHandler,
     InstallCartGameHandler,
+    PrepareGameFileForPlayingHandler,
     ReadCartDataHandler,
     SetupGameFileAndSaveFileForPlayingHandler,
     UpdateLocalMemoryConfigurationHandler,
+    VerifyMemoryHandler,
     WriteCartSaveHandler,
 )
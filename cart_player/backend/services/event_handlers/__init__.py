@@ -0,0 +1 @@
+from .cart_data_read import CartDataReadEventHandler
@@ -0,0 +1,28 @@
+from typing import Type
+
+from cart_player.backend.domain.commands import PrepareGameFileForPlayingCommand
+from cart_player.backend.domain.events import CartDataReadEvent
+from cart_player.backend.utils.models import GameDataType
+from cart_player.core import Broker, Handler
+
+
+class CartDataReadEventHandler(Handler):
+    """Handle event 'CartDataReadEvent'.
+
+    Game file is prepared for playing as soon as the game is known to be installed, so that launching it is immediate.
+    """
+
+    def __init__(self, broker: Broker):
+        super().__init__(broker)
+
+    @property
+    def message_type(self) -> Type:
+        return CartDataReadEvent
+
+    def _handle(self, evt: CartDataReadEvent):
+        if not evt.success:
+            return
+
+        game_data = next((gd for gd in evt.game_data_list or [] if gd.type == GameDataType.GAME), None)
+        if game_data is not None:
+            self._publish(PrepareGameFileForPlayingCommand(game_name=game_data.name))
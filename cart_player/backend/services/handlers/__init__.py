@@ -1,9 +1,12 @@
 from .backup_cart_save import BackupCartSaveHandler
 from .backup_save_file_after_playing import BackupSaveFileAfterPlayingHandler
+from .dump_cart_batch import DumpCartBatchHandler
 from .erase_cart_save import EraseCartSaveHandler
 from .export_to_analogue_pocket_library import ExportToAnaloguePocketLibraryHandler
 from .install_cart_game import InstallCartGameHandler
+from .prepare_game_file_for_playing import PrepareGameFileForPlayingHandler
 from .read_cart_data import ReadCartDataHandler
 from .setup_game_file_and_save_file_for_playing import SetupGameFileAndSaveFileForPlayingHandler
 from .update_local_memory_configuration import UpdateLocalMemoryConfigurationHandler
+from .verify_memory import VerifyMemoryHandler
 from .write_cart_save import WriteCartSaveHandler
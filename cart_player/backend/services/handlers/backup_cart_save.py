@@ -1,12 +1,13 @@
 import logging
 from datetime import timedelta
+from functools import partial
 from typing import Optional, Type
 
 from cart_player.backend.domain.commands import BackupCartSaveCommand
 from cart_player.backend.domain.dtos import CartInfo as CartInfoDTO
 from cart_player.backend.domain.events import BackupCartSaveProgressEvent, CartSaveBackupEvent
 from cart_player.backend.domain.models import CartInfo
-from cart_player.backend.domain.ports import CartFlasher, Memory
+from cart_player.backend.domain.ports import CartFlasherPool, JobPriority, Memory
 from cart_player.backend.utils.models import GameDataType, SaveDataOrigin
 from cart_player.core import Broker, Handler, config
 from cart_player.core.exceptions import NoCartInCartFlasherException
@@ -17,22 +18,24 @@ logger = logging.getLogger(f"{config.LOGGER_NAME}::BackupCartSaveHandler")
 class BackupCartSaveHandler(Handler):
     """Handle event 'BackupCartSaveCommand'."""
 
-    def __init__(self, broker: Broker, memory: Memory, cart_flasher: CartFlasher):
+    def __init__(self, broker: Broker, memory: Memory, cart_flasher_pool: CartFlasherPool):
         super().__init__(broker)
         self._memory = memory
-        self._cart_flasher = cart_flasher
+        self._cart_flasher_pool = cart_flasher_pool
 
     @property
     def message_type(self) -> Type:
         return BackupCartSaveCommand
 
     def _handle(self, cmd: BackupCartSaveCommand):
+        device_id = cmd.device_id
         try:
-            cart_info: CartInfo = self._cart_flasher.read_cart_info()
-            content = self._cart_flasher.read_save(cart_info, self._report_progress)
-        except (NoCartInCartFlasherException, RuntimeError) as e:
+            with self._cart_flasher_pool.acquire(cmd.device_id, JobPriority.SAVE) as (device_id, cart_flasher):
+                cart_info: CartInfo = cart_flasher.read_cart_info(use_cache=True)
+                content = cart_flasher.read_save(cart_info, partial(self._report_progress, device_id))
+        except (NoCartInCartFlasherException, RuntimeError, KeyError) as e:
             logger.error(f"An error occurred when backing up save: {e}", exc_info=True)
-            self._publish(CartSaveBackupEvent(success=False))
+            self._publish(CartSaveBackupEvent(success=False, device_id=device_id))
         else:
             self._memory.save(cart_info, content, GameDataType.SAVE, metadata={"tag": SaveDataOrigin.CARTRIDGE})
             self._publish(
@@ -47,8 +50,9 @@ class BackupCartSaveHandler(Handler):
                         save_supported=cart_info.save_supported,
                         sgb_supported=cart_info.sgb_supported,
                     ),
+                    device_id=device_id,
                 ),
             )
 
-    def _report_progress(self, current: float, eta: Optional[timedelta]):
-        self._publish(BackupCartSaveProgressEvent(current=current, eta=eta))
+    def _report_progress(self, device_id: str, current: float, eta: Optional[timedelta]):
+        self._publish(BackupCartSaveProgressEvent(current=current, eta=eta, device_id=device_id))
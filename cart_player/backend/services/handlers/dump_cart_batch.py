@@ -0,0 +1,282 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import timedelta
+from pathlib import Path
+from typing import List, Optional, Set, Type
+
+from cart_player.backend.domain.commands import DumpCartBatchCommand
+from cart_player.backend.domain.dtos import CartInfo as CartInfoDTO
+from cart_player.backend.domain.events import CartBatchDumpedEvent, CartDumpedEvent, DumpCartBatchProgressEvent
+from cart_player.backend.domain.models import CartInfo, GameImage
+from cart_player.backend.domain.ports import CartFlasher, CartFlasherPool, GameLibrary, JobPriority, Memory
+from cart_player.backend.utils.models import GameDataType, SaveDataOrigin
+from cart_player.backend.utils.nointro import check_nointro_rom
+from cart_player.core import Broker, Handler, config, metrics
+from cart_player.core.exceptions import NoCartInCartFlasherException
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::DumpCartBatchHandler")
+
+GAME_PROGRESS_WEIGHT = 0.9  # share of game dump in the progress of a cart (the rest being save backup)
+
+
+class CartBatch:
+    """Carts of a batch dump session, shared by the threads dumping carts on each device.
+
+    Args:
+        max_carts: Maximal number of carts to dump. If None, the number of carts is not limited.
+
+    Properties:
+        n_failures: Number of carts that could not be dumped.
+    """
+
+    def __init__(self, max_carts: Optional[int]):
+        self._max_carts = max_carts
+        self._reserved: Set[str] = set()
+        self._n_failures = 0
+        self._lock = threading.Lock()
+
+    @property
+    def n_failures(self) -> int:
+        """Number of carts that could not be dumped."""
+        return self._n_failures
+
+    def reserve(self, cart_info: CartInfo) -> bool:
+        """Reserve a cart to be dumped, return False if it has already been dumped or if the batch is complete."""
+        with self._lock:
+            if cart_info.cart_filename in self._reserved or self._is_complete():
+                return False
+            self._reserved.add(cart_info.cart_filename)
+            return True
+
+    def release(self, cart_info: CartInfo):
+        """Release a cart that could not be dumped, so that it can be dumped again once reinserted."""
+        with self._lock:
+            self._reserved.discard(cart_info.cart_filename)
+            self._n_failures += 1
+
+    def is_complete(self) -> bool:
+        """True if the maximal number of carts has been reached."""
+        with self._lock:
+            return self._is_complete()
+
+    def _is_complete(self) -> bool:
+        return self._max_carts is not None and len(self._reserved) >= self._max_carts
+
+
+class DumpCartBatchHandler(Handler):
+    """Handle event 'DumpCartBatchCommand'.
+
+    Carts inserted one after the other are dumped (game, then save) as a pipeline, so that cart flashers are only kept
+    busy by reads: as soon as the info of a cart is read, its metadata and image are looked up by worker threads while
+    its game is dumped; then the dump is hashed, verified and stored in memory by worker threads while the next cart is
+    dumped. Devices of the pool are used in parallel (one cart at a time per device).
+
+    A cart is dumped once it differs from the cart previously read on its device. The session ends once the maximal
+    number of carts has been dumped, or when no new cart has been inserted for 'cart_timeout' seconds.
+    Durations of dumps and of their storage are available through `cart_player.core.metrics` ('dump_cart_batch.*').
+    """
+
+    def __init__(
+        self,
+        broker: Broker,
+        memory: Memory,
+        cart_flasher_pool: CartFlasherPool,
+        game_library: GameLibrary,
+    ):
+        super().__init__(broker)
+        self._memory = memory
+        self._cart_flasher_pool = cart_flasher_pool
+        self._game_library = game_library
+
+    @property
+    def message_type(self) -> Type:
+        return DumpCartBatchCommand
+
+    def _handle(self, cmd: DumpCartBatchCommand):
+        device_ids = cmd.device_ids or self._cart_flasher_pool.device_ids
+        unknown_device_ids = [
+            device_id for device_id in device_ids if device_id not in self._cart_flasher_pool.device_ids
+        ]
+        if unknown_device_ids:
+            logger.error(f"Cannot dump carts, unknown cart flasher devices: {', '.join(unknown_device_ids)}")
+            self._publish(CartBatchDumpedEvent(success=False))
+            return
+
+        batch = CartBatch(cmd.max_carts)
+        store_futures: List[Future] = []
+        n_device_failures = 0
+        with ThreadPoolExecutor(max_workers=max(1, cmd.n_workers)) as executor:
+            with ThreadPoolExecutor(max_workers=len(device_ids)) as device_executor:
+                device_futures = {
+                    device_id: device_executor.submit(self._dump_carts, cmd, device_id, batch, executor, store_futures)
+                    for device_id in device_ids
+                }
+                for device_id, device_future in device_futures.items():
+                    try:
+                        device_future.result()
+                    except Exception as e:  # other devices keep dumping carts
+                        logger.error(f"An error occurred when dumping carts ({device_id=}): {e}", exc_info=True)
+                        n_device_failures += 1
+                        self._publish(CartDumpedEvent(success=False, device_id=device_id))
+            results = [future.result() for future in store_futures]
+
+        cart_infos = [cart_info for cart_info in results if cart_info is not None]
+        n_failures = batch.n_failures + n_device_failures + len(results) - len(cart_infos)
+        logger.info(f"Batch dump completed ({len(cart_infos)} carts dumped, {n_failures} failures)")
+        self._publish(CartBatchDumpedEvent(success=True, cart_infos=cart_infos, n_failures=n_failures))
+
+    def _dump_carts(
+        self,
+        cmd: DumpCartBatchCommand,
+        device_id: str,
+        batch: CartBatch,
+        executor: ThreadPoolExecutor,
+        store_futures: List[Future],
+    ):
+        """Dump carts inserted in a device until the end of the session (executed by a thread per device).
+
+        Futures of the storage of dumped carts (resolved with their cart info DTO, None on failure) are appended to
+        'store_futures' as soon as carts are dumped, so that they are waited for even if the device fails later on.
+        """
+        previous_cart_filename = None
+        last_cart_time = time.monotonic()
+        while not batch.is_complete() and time.monotonic() - last_cart_time < cmd.cart_timeout:
+            filepath = self._memory.get_temporary_filepath()
+            cart_info = save = None
+            try:
+                with self._cart_flasher_pool.acquire(device_id, JobPriority.GAME) as (device_id, cart_flasher):
+                    cart_info = cart_flasher.read_cart_info()
+                    if cart_info.cart_filename == previous_cart_filename or not batch.reserve(cart_info):
+                        cart_info = None
+                    else:
+                        lookup_future = executor.submit(self._look_up, cart_info)
+                        save = self._dump_cart(cmd, device_id, cart_flasher, cart_info, filepath)
+            except (NoCartInCartFlasherException, RuntimeError, KeyError) as e:
+                filepath.unlink(missing_ok=True)
+                if cart_info is None:  # no (readable) cart inserted
+                    previous_cart_filename = None
+                    time.sleep(cmd.poll_interval)
+                    continue
+
+                logger.info(f"Unable to dump cart ({device_id=}, {cart_info.id=}): {e}", exc_info=True)
+                batch.release(cart_info)
+                previous_cart_filename = cart_info.cart_filename
+                last_cart_time = time.monotonic()
+                self._publish(CartDumpedEvent(success=False, device_id=device_id))
+                continue
+
+            if cart_info is None:  # same cart as before
+                filepath.unlink(missing_ok=True)
+                time.sleep(cmd.poll_interval)
+                continue
+
+            previous_cart_filename = cart_info.cart_filename
+            last_cart_time = time.monotonic()
+            store_futures.append(executor.submit(self._store, device_id, cart_info, filepath, save, lookup_future))
+
+    def _dump_cart(
+        self,
+        cmd: DumpCartBatchCommand,
+        device_id: str,
+        cart_flasher: CartFlasher,
+        cart_info: CartInfo,
+        filepath: Path,
+    ) -> Optional[bytes]:
+        """Dump the game of a cart into a file, and return its save (None if not backed up).
+
+        While the game is dumped, the ETA includes the predicted duration of the save backup (if it can be predicted),
+        so that the ETA of the cart does not drop once the save backup starts.
+        """
+        backup_save = cmd.backup_saves and cart_info.save_supported
+        save_duration = cart_flasher.estimate_duration(cart_info, "read_save") if backup_save else None
+        with metrics.timer("dump_cart_batch.dump"):
+            cart_flasher.dump_game(
+                cart_info,
+                filepath,
+                lambda current, eta: self._report_progress(
+                    device_id,
+                    current * GAME_PROGRESS_WEIGHT,
+                    eta + save_duration if eta is not None and save_duration is not None else eta,
+                ),
+            )
+            if not backup_save:
+                self._report_progress(device_id, 1.0, None)
+                return None
+
+            return cart_flasher.read_save(
+                cart_info,
+                lambda current, eta: self._report_progress(
+                    device_id, GAME_PROGRESS_WEIGHT + current * (1 - GAME_PROGRESS_WEIGHT), eta
+                ),
+            )
+
+    def _look_up(self, cart_info: CartInfo):
+        """Store cart info, and look up game metadata and image if not in memory yet (executed by worker threads)."""
+        if self._memory.get_by_name(cart_info.cart_filename, GameDataType.CART) is None:
+            self._memory.save(cart_info, cart_info.bytes(), GameDataType.CART)
+
+        if self._memory.get_by_name(cart_info.metadata_filename, GameDataType.METADATA) is None:
+            game_metadata = self._game_library.get_metadata(cart_info)
+            if not game_metadata.is_empty():
+                self._memory.save(cart_info, game_metadata.bytes(), GameDataType.METADATA)
+
+        if self._memory.get_by_name(cart_info.image_filename, GameDataType.IMAGE) is None:
+            game_image: GameImage = self._game_library.get_image(cart_info)
+            if game_image.data:
+                self._memory.save(cart_info, game_image.data, GameDataType.IMAGE)
+
+    def _store(
+        self,
+        device_id: str,
+        cart_info: CartInfo,
+        filepath: Path,
+        save: Optional[bytes],
+        lookup_future: Future,
+    ) -> Optional[CartInfoDTO]:
+        """Hash, verify and store a dumped cart into memory (executed by worker threads).
+
+        Returns:
+            Cart info DTO of the dumped cart, None on failure.
+        """
+        try:
+            with metrics.timer("dump_cart_batch.store"):
+                checksums = self._memory.save_file(cart_info, filepath, GameDataType.GAME)
+                check_nointro_rom(cart_info.game_filename, cart_info.support, checksums)
+                if save is not None:
+                    self._memory.save(cart_info, save, GameDataType.SAVE, metadata={"tag": SaveDataOrigin.CARTRIDGE})
+        except Exception as e:
+            logger.info(f"Unable to store dumped cart ({device_id=}, {cart_info.id=}): {e}", exc_info=True)
+            self._publish(CartDumpedEvent(success=False, device_id=device_id))
+            return None
+        finally:
+            filepath.unlink(missing_ok=True)
+
+        # Cart is dumped even if its metadata or image could not be looked up
+        try:
+            lookup_future.result()
+        except Exception as e:
+            logger.info(f"Unable to look up dumped cart ({device_id=}, {cart_info.id=}): {e}", exc_info=True)
+
+        cart_info_dto = CartInfoDTO(
+            title=cart_info.title,
+            header_checksum=cart_info.header_checksum,
+            support=cart_info.support,
+            region=cart_info.region,
+            id_override=cart_info.id_override,
+            save_supported=cart_info.save_supported,
+            sgb_supported=cart_info.sgb_supported,
+        )
+        self._publish(
+            CartDumpedEvent(
+                success=True,
+                cart_info=cart_info_dto,
+                device_id=device_id,
+                save_backed_up=save is not None,
+            ),
+        )
+        return cart_info_dto
+
+    def _report_progress(self, device_id: str, current: float, eta: Optional[timedelta]):
+        self._publish(DumpCartBatchProgressEvent(current=current, eta=eta, device_id=device_id))
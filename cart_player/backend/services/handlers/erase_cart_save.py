@@ -1,12 +1,13 @@
 import logging
 from datetime import timedelta
+from functools import partial
 from typing import Optional, Type
 
 from cart_player.backend.domain.commands import EraseCartSaveCommand
 from cart_player.backend.domain.dtos import CartInfo as CartInfoDTO
 from cart_player.backend.domain.events import CartSaveErasedEvent, EraseCartSaveProgressEvent
 from cart_player.backend.domain.models import CartInfo
-from cart_player.backend.domain.ports import CartFlasher, Memory
+from cart_player.backend.domain.ports import CartFlasherPool, JobPriority, Memory
 from cart_player.core import Broker, Handler, config
 from cart_player.core.exceptions import NoCartInCartFlasherException
 
@@ -16,22 +17,24 @@ logger = logging.getLogger(f"{config.LOGGER_NAME}::EraseCartSaveHandler")
 class EraseCartSaveHandler(Handler):
     """Handle event 'EraseCartSaveCommand'."""
 
-    def __init__(self, broker: Broker, memory: Memory, cart_flasher: CartFlasher):
+    def __init__(self, broker: Broker, memory: Memory, cart_flasher_pool: CartFlasherPool):
         super().__init__(broker)
         self._memory = memory
-        self._cart_flasher = cart_flasher
+        self._cart_flasher_pool = cart_flasher_pool
 
     @property
     def message_type(self) -> Type:
         return EraseCartSaveCommand
 
     def _handle(self, cmd: EraseCartSaveCommand):
+        device_id = cmd.device_id
         try:
-            cart_info: CartInfo = self._cart_flasher.read_cart_info()
-            self._cart_flasher.erase_save(cart_info, self._report_progress)
-        except (NoCartInCartFlasherException, RuntimeError) as e:
+            with self._cart_flasher_pool.acquire(cmd.device_id, JobPriority.SAVE) as (device_id, cart_flasher):
+                cart_info: CartInfo = cart_flasher.read_cart_info()
+                cart_flasher.erase_save(cart_info, partial(self._report_progress, device_id))
+        except (NoCartInCartFlasherException, RuntimeError, KeyError) as e:
             logger.error(f"An error occurred when erasing save: {e}", exc_info=True)
-            self._publish(CartSaveErasedEvent(success=False))
+            self._publish(CartSaveErasedEvent(success=False, device_id=device_id))
         else:
             self._publish(
                 CartSaveErasedEvent(
@@ -45,8 +48,9 @@ class EraseCartSaveHandler(Handler):
                         save_supported=cart_info.save_supported,
                         sgb_supported=cart_info.sgb_supported,
                     ),
+                    device_id=device_id,
                 ),
             )
 
-    def _report_progress(self, current: float, eta: Optional[timedelta]):
-        self._publish(EraseCartSaveProgressEvent(current=current, eta=eta))
+    def _report_progress(self, device_id: str, current: float, eta: Optional[timedelta]):
+        self._publish(EraseCartSaveProgressEvent(current=current, eta=eta, device_id=device_id))
@@ -1,13 +1,16 @@
 import logging
 from datetime import timedelta
+from functools import partial
+from pathlib import Path
 from typing import Optional, Type
 
 from cart_player.backend.domain.commands import InstallCartGameCommand
 from cart_player.backend.domain.dtos import CartInfo as CartInfoDTO
 from cart_player.backend.domain.events import CartGameInstalledEvent, InstallCartGameProgressEvent
 from cart_player.backend.domain.models import CartInfo
-from cart_player.backend.domain.ports import CartFlasher, Memory
+from cart_player.backend.domain.ports import CartFlasherPool, JobPriority, Memory
 from cart_player.backend.utils.models import GameDataType
+from cart_player.backend.utils.nointro import check_nointro_rom
 from cart_player.core import Broker, Handler, config
 from cart_player.core.exceptions import NoCartInCartFlasherException
 
@@ -15,26 +18,39 @@ logger = logging.getLogger(f"{config.LOGGER_NAME}::BackupCartSaveHandler")
 
 
 class InstallCartGameHandler(Handler):
-    """Handle event 'InstallCartGameCommand'."""
+    """Handle event 'InstallCartGameCommand'.
 
-    def __init__(self, broker: Broker, memory: Memory, cart_flasher: CartFlasher):
+    Game is dumped into a temporary file provided by memory, then moved into memory: it is never loaded in memory.
+    """
+
+    def __init__(self, broker: Broker, memory: Memory, cart_flasher_pool: CartFlasherPool):
         super().__init__(broker)
         self._memory = memory
-        self._cart_flasher = cart_flasher
+        self._cart_flasher_pool = cart_flasher_pool
 
     @property
     def message_type(self) -> Type:
         return InstallCartGameCommand
 
     def _handle(self, cmd: InstallCartGameCommand):
+        filepath = self._memory.get_temporary_filepath()
+        try:
+            self._install_game(cmd, filepath)
+        finally:
+            filepath.unlink(missing_ok=True)
+
+    def _install_game(self, cmd: InstallCartGameCommand, filepath: Path):
+        device_id = cmd.device_id
         try:
-            cart_info: CartInfo = self._cart_flasher.read_cart_info()
-            content = self._cart_flasher.read_game(cart_info, self._report_progress)
-        except (NoCartInCartFlasherException, RuntimeError) as e:
+            with self._cart_flasher_pool.acquire(cmd.device_id, JobPriority.GAME) as (device_id, cart_flasher):
+                cart_info: CartInfo = cart_flasher.read_cart_info(use_cache=True)
+                cart_flasher.dump_game(cart_info, filepath, partial(self._report_progress, device_id))
+        except (NoCartInCartFlasherException, RuntimeError, KeyError) as e:
             logger.error(f"An error occurred when installing game: {e}", exc_info=True)
-            self._publish(CartGameInstalledEvent(success=False))
+            self._publish(CartGameInstalledEvent(success=False, device_id=device_id))
         else:
-            self._memory.save(cart_info, content, GameDataType.GAME)
+            checksums = self._memory.save_file(cart_info, filepath, GameDataType.GAME)
+            check_nointro_rom(cart_info.game_filename, cart_info.support, checksums)
             self._publish(
                 CartGameInstalledEvent(
                     success=True,
@@ -47,8 +63,9 @@ class InstallCartGameHandler(Handler):
                         save_supported=cart_info.save_supported,
                         sgb_supported=cart_info.sgb_supported,
                     ),
+                    device_id=device_id,
                 ),
             )
 
-    def _report_progress(self, current: float, eta: Optional[timedelta]):
-        self._publish(InstallCartGameProgressEvent(current=current, eta=eta))
+    def _report_progress(self, device_id: str, current: float, eta: Optional[timedelta]):
+        self._publish(InstallCartGameProgressEvent(current=current, eta=eta, device_id=device_id))
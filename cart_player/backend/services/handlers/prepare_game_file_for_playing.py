@@ -0,0 +1,30 @@
+import logging
+from typing import Type
+
+from cart_player.backend.domain.commands import PrepareGameFileForPlayingCommand
+from cart_player.backend.domain.ports import Memory
+from cart_player.backend.utils.models import GameDataType
+from cart_player.core import Broker, Handler, config
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::PrepareGameFileForPlayingHandler")
+
+
+class PrepareGameFileForPlayingHandler(Handler):
+    """Handle event 'PrepareGameFileForPlayingCommand'.
+
+    Preparing a game file is only an optimization (exporting it later is immediate): failures are logged and ignored.
+    """
+
+    def __init__(self, broker: Broker, memory: Memory):
+        super().__init__(broker)
+        self._memory = memory
+
+    @property
+    def message_type(self) -> Type:
+        return PrepareGameFileForPlayingCommand
+
+    def _handle(self, cmd: PrepareGameFileForPlayingCommand):
+        try:
+            self._memory.prepare_export(cmd.game_name, GameDataType.GAME)
+        except RuntimeError as e:
+            logger.info(f"Unable to prepare game file for playing ({cmd.game_name=}): {e}", exc_info=True)
@@ -1,14 +1,15 @@
 import logging
-from typing import List, Type
+import threading
+from typing import Callable, Dict, List, Optional, Type
 
 from cart_player.backend.domain.commands import ReadCartDataCommand
 from cart_player.backend.domain.dtos import CartInfo as CartInfoDTO
 from cart_player.backend.domain.dtos import GameData as GameDataDTO
 from cart_player.backend.domain.dtos import GameImage as GameImageDTO
 from cart_player.backend.domain.dtos import GameMetadata as GameMetadataDTO
-from cart_player.backend.domain.events import CartDataReadEvent
+from cart_player.backend.domain.events import CartDataReadEvent, CartGameMetadataCompletedEvent
 from cart_player.backend.domain.models import CartInfo, GameData, GameImage, GameMetadata
-from cart_player.backend.domain.ports import CartFlasher, GameLibrary, Memory
+from cart_player.backend.domain.ports import CartFlasherPool, GameLibrary, JobPriority, Memory
 from cart_player.backend.utils.models import GameDataType
 from cart_player.core import Broker, Handler, config
 from cart_player.core.exceptions import NoCartInCartFlasherException
@@ -16,20 +17,52 @@ from cart_player.core.exceptions import NoCartInCartFlasherException
 logger = logging.getLogger(f"{config.LOGGER_NAME}::ReadCartDataHandler")
 
 
+class CartDataPublication:
+    """Publication of the cart data read by a command, so that follow-up events are published after it, without
+    waiting for it."""
+
+    def __init__(self):
+        self._published = False
+        self._pending: List[Callable[[], None]] = []
+        self._lock = threading.Lock()
+
+    def set_published(self):
+        """Mark cart data as published, and run the follow-ups requested in the meantime."""
+        with self._lock:
+            self._published = True
+            pending, self._pending = self._pending, []
+        for follow_up in pending:
+            follow_up()
+
+    def run_after(self, follow_up: Callable[[], None]):
+        """Run a follow-up now if cart data has been published, once it is published otherwise."""
+        with self._lock:
+            if not self._published:
+                self._pending.append(follow_up)
+                return
+        follow_up()
+
+
 class ReadCartDataHandler(Handler):
-    """Handle event 'ReadCartDataCommand'."""
+    """Handle event 'ReadCartDataCommand'.
+
+    Game metadata is looked up within the deadline of the game library: if some metadata libraries are late, cart data
+    is read with partial game metadata, then 'CartGameMetadataCompletedEvent' is published once game metadata is
+    complete (and saved), unless another cart has been read from the device in the meantime.
+    """
 
     def __init__(
         self,
         broker: Broker,
         memory: Memory,
-        cart_flasher: CartFlasher,
+        cart_flasher_pool: CartFlasherPool,
         game_library: GameLibrary,
     ):
         super().__init__(broker)
         self._memory = memory
-        self._cart_flasher = cart_flasher
+        self._cart_flasher_pool = cart_flasher_pool
         self._game_library = game_library
+        self._last_cart_ids: Dict[Optional[str], str] = {}  # by device
 
     @property
     def message_type(self) -> Type:
@@ -50,6 +83,7 @@ class ReadCartDataHandler(Handler):
                 game_data_list=None,
                 game_metadata=None,
                 game_image=None,
+                device_id=cmd.device_id,
             )
             self._publish(evt)
 
@@ -57,12 +91,14 @@ class ReadCartDataHandler(Handler):
 
     def _handle_command(self, cmd: ReadCartDataCommand):
         # CartInfo
+        device_id = cmd.device_id
         if cmd.cart_info:
             cart_info = CartInfo.create(cmd.cart_info)
         else:
             try:
-                cart_info: CartInfo = self._cart_flasher.read_cart_info()
-            except (NoCartInCartFlasherException, RuntimeError) as e:
+                with self._cart_flasher_pool.acquire(cmd.device_id, JobPriority.CART_INFO) as (device_id, cart_flasher):
+                    cart_info: CartInfo = cart_flasher.read_cart_info()
+            except (NoCartInCartFlasherException, RuntimeError, KeyError) as e:
                 if cmd.raise_error:
                     raise e
                 cart_info = None
@@ -75,13 +111,16 @@ class ReadCartDataHandler(Handler):
 
         # Failure case
         if cart_info is None:
-            self._publish(CartDataReadEvent(success=False))
+            self._publish(CartDataReadEvent(success=False, device_id=device_id))
             return
 
+        self._last_cart_ids[device_id] = cart_info.id
+
         # GameData list
         game_data_list = self._memory.get_all(cart_info) if not cmd.skip_game_data else None
 
         # GameMetadata
+        publication = CartDataPublication()
         if cmd.skip_game_metadata:
             game_metadata = None
         else:
@@ -89,8 +128,13 @@ class ReadCartDataHandler(Handler):
             if game_metadata_data:
                 game_metadata = GameMetadata.create_from_bytes(game_metadata_data.content)
             else:
-                game_metadata = self._game_library.get_metadata(cart_info)
-                if not game_metadata.is_empty():
+                game_metadata, complete = self._game_library.get_metadata_within_deadline(
+                    cart_info,
+                    on_late_metadata=lambda late_game_metadata: self._on_late_game_metadata(
+                        cart_info, device_id, late_game_metadata, publication
+                    ),
+                )
+                if complete and not game_metadata.is_empty():
                     self._memory.save(cart_info, game_metadata.bytes(), GameDataType.METADATA)
 
         # GameImage
@@ -106,16 +150,7 @@ class ReadCartDataHandler(Handler):
                     self._memory.save(cart_info, game_image.data, GameDataType.IMAGE)
 
         # Build DTOs
-        cart_info_dto = CartInfoDTO(
-            title=cart_info.title,
-            header_checksum=cart_info.header_checksum,
-            support=cart_info.support,
-            region=cart_info.region,
-            id_override=cart_info.id_override,
-            image_ratio_override=cart_info.image_ratio_override,
-            save_supported=cart_info.save_supported,
-            sgb_supported=cart_info.sgb_supported,
-        )
+        cart_info_dto = self._cart_info_to_dto(cart_info)
         game_data_dto_list = self._game_data_list_to_dto(game_data_list)
         game_metadata_dto = self._game_metadata_to_dto(game_metadata)
         game_image_dto = self._game_image_to_dto(game_image)
@@ -128,8 +163,47 @@ class ReadCartDataHandler(Handler):
             game_data_list=game_data_dto_list,
             game_metadata=game_metadata_dto,
             game_image=game_image_dto,
+            device_id=device_id,
         )
         self._publish(evt)
+        publication.set_published()
+
+    def _on_late_game_metadata(
+        self,
+        cart_info: CartInfo,
+        device_id: Optional[str],
+        game_metadata: GameMetadata,
+        publication: CartDataPublication,
+    ):
+        """Save game metadata completed by late metadata libraries, and notify it once cart data has been published."""
+        try:
+            if not game_metadata.is_empty():
+                self._memory.save(cart_info, game_metadata.bytes(), GameDataType.METADATA)
+        except Exception as e:
+            logger.error(f"An exception has occurred: {e}", exc_info=True)
+            return
+
+        publication.run_after(lambda: self._notify_completed_game_metadata(cart_info, device_id))
+
+    def _notify_completed_game_metadata(self, cart_info: CartInfo, device_id: Optional[str]):
+        if self._last_cart_ids.get(device_id, None) != cart_info.id:
+            logger.debug(f"Another cart has been read, completed game metadata is not notified ({cart_info.id=})")
+            return
+
+        self._publish(CartGameMetadataCompletedEvent(cart_info=self._cart_info_to_dto(cart_info), device_id=device_id))
+
+    @staticmethod
+    def _cart_info_to_dto(cart_info: CartInfo) -> CartInfoDTO:
+        return CartInfoDTO(
+            title=cart_info.title,
+            header_checksum=cart_info.header_checksum,
+            support=cart_info.support,
+            region=cart_info.region,
+            id_override=cart_info.id_override,
+            image_ratio_override=cart_info.image_ratio_override,
+            save_supported=cart_info.save_supported,
+            sgb_supported=cart_info.sgb_supported,
+        )
 
     @staticmethod
     def _game_data_list_to_dto(game_data_list: List[GameData]) -> List[GameDataDTO]:
@@ -176,6 +250,7 @@ class ReadCartDataHandler(Handler):
         game_data_list: List[GameDataDTO],
         game_metadata: GameMetadataDTO(),
         game_image: GameImageDTO(),
+        device_id: Optional[str] = None,
     ) -> CartDataReadEvent:
         return CartDataReadEvent(
             success=success,
@@ -183,4 +258,5 @@ class ReadCartDataHandler(Handler):
             game_data_list=game_data_list if not cmd.skip_game_data else None,
             game_metadata=game_metadata if not cmd.skip_game_metadata else None,
             game_image=game_image if not cmd.skip_game_image else None,
+            device_id=device_id,
         )
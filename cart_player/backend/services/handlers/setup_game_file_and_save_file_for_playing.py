@@ -31,18 +31,13 @@ class SetupGameFileAndSaveFileForPlayingHandler(Handler):
         if not game_data_name:
             return
 
-        game_data = self._memory.get_by_name(game_data_name, game_data_type, with_content=True)
-        if not game_data or not game_data.content:
-            return
-
         target_path.mkdir(parents=True, exist_ok=True)
-        extension = ".sav" if game_data_type == GameDataType.SAVE else game_data.extension
+        extension = ".sav" if game_data_type == GameDataType.SAVE else Path(game_data_name).suffix
         target_filepath = target_path / ("GAME" + extension)
         self._try_delete(target_filepath)
 
-        if game_data and game_data.content:
-            with open(str(target_filepath), "wb") as f:
-                f.write(game_data.content)
+        if not self._memory.export(game_data_name, game_data_type, target_filepath):
+            logger.info(f"No game data to set up ({game_data_name=}, {game_data_type=})")
 
     def _try_delete(self, filepath: Path):
         if filepath.exists() and filepath.is_file():
@@ -0,0 +1,168 @@
+import hashlib
+import logging
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
+from pathlib import Path
+from typing import Optional, Type
+
+from cart_player.backend.domain.commands import VerifyMemoryCommand
+from cart_player.backend.domain.dtos import GameDataVerification
+from cart_player.backend.domain.events import MemoryVerifiedEvent, VerifyMemoryProgressEvent
+from cart_player.backend.domain.ports import Memory
+from cart_player.backend.utils.models import GameDataIntegrity, GameDataType, GameSupport
+from cart_player.backend.utils.nointro import get_nointro_rom
+from cart_player.core import Broker, Handler, config
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::VerifyMemoryHandler")
+
+HASH_CHUNK_SIZE = 1024 * 1024
+GAME_SUPPORT_BY_EXTENSION = {
+    ".gb": GameSupport.GAMEBOY,
+    ".gbc": GameSupport.GAMEBOY_COLOR,
+    ".gba": GameSupport.GAMEBOY_ADVANCE,
+}
+
+
+class ReadThrottle:
+    """Limit the read throughput shared by several threads.
+
+    Args:
+        max_bytes_per_second: Maximal number of bytes read per second. If None, reads are not throttled.
+    """
+
+    def __init__(self, max_bytes_per_second: Optional[int]):
+        self._max_bytes_per_second = max_bytes_per_second
+        self._lock = threading.Lock()
+        self._next_read_time = time.monotonic()
+
+    def wait(self, n_bytes: int):
+        """Wait until n_bytes can be read without exceeding the maximal throughput."""
+        if not self._max_bytes_per_second:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            read_time = max(now, self._next_read_time)
+            self._next_read_time = read_time + n_bytes / self._max_bytes_per_second
+
+        if read_time > now:
+            time.sleep(read_time - now)
+
+
+class VerifyMemoryHandler(Handler):
+    """Handle event 'VerifyMemoryCommand'.
+
+    Every game and save stored in memory is hashed (md5, crc32), then compared with the checksum recorded when it has
+    been saved and, for games, with its No-Intro reference. Files are hashed by chunks in a thread pool (hashlib and
+    zlib release the GIL), with a throttled read throughput so that play sessions are not affected.
+    """
+
+    def __init__(self, broker: Broker, memory: Memory):
+        super().__init__(broker)
+        self._memory = memory
+
+    @property
+    def message_type(self) -> Type:
+        return VerifyMemoryCommand
+
+    def _handle(self, cmd: VerifyMemoryCommand):
+        try:
+            checksums_by_type = {
+                type: self._memory.get_checksums(type) for type in [GameDataType.GAME, GameDataType.SAVE]
+            }
+        except Exception as e:
+            logger.error(f"An error occurred when retrieving recorded checksums: {e}", exc_info=True)
+            self._publish(MemoryVerifiedEvent(success=False))
+            return
+
+        game_data_list = [
+            (name, type, recorded_md5)
+            for type, checksums in checksums_by_type.items()
+            for name, recorded_md5 in checksums.items()
+        ]
+        self._report_progress(0.0, None)
+
+        throttle = ReadThrottle(cmd.max_bytes_per_second)
+        verifications = []
+        start_time = time.monotonic()
+        with ThreadPoolExecutor(max_workers=max(1, cmd.n_workers)) as executor:
+            futures = [
+                executor.submit(self._verify, name, type, recorded_md5, throttle)
+                for name, type, recorded_md5 in game_data_list
+            ]
+            for i, future in enumerate(as_completed(futures)):
+                verifications.append(future.result())
+
+                current = (i + 1) / len(futures)
+                elapsed_time = time.monotonic() - start_time
+                self._report_progress(current, timedelta(seconds=elapsed_time * (1 - current) / current))
+
+        failures = [
+            v.name
+            for v in verifications
+            if v.integrity not in [GameDataIntegrity.VALID, GameDataIntegrity.UNVERIFIABLE]
+        ]
+        if failures:
+            logger.warning(f"Memory verified, some game data may be corrupted: {', '.join(sorted(failures))}")
+        else:
+            logger.info(f"Memory verified ({len(verifications)} game data)")
+        self._publish(MemoryVerifiedEvent(success=True, verifications=verifications))
+
+    def _verify(
+        self,
+        name: str,
+        type: GameDataType,
+        recorded_md5: Optional[str],
+        throttle: ReadThrottle,
+    ) -> GameDataVerification:
+        """Hash a game data and check its integrity (executed by worker threads)."""
+        md5 = hashlib.md5()
+        crc = 0
+        try:
+            stream = self._memory.open(name, type)
+            if stream is None:
+                raise FileNotFoundError(f"Game data not found ({name=}, {type=}).")
+
+            with stream:
+                while True:
+                    throttle.wait(HASH_CHUNK_SIZE)
+                    chunk = stream.read(HASH_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    md5.update(chunk)
+                    crc = zlib.crc32(chunk, crc)
+        except Exception as e:
+            logger.info(f"Unable to read game data ({name=}, {type=}): {e}", exc_info=True)
+            return GameDataVerification(name=name, type=type, integrity=GameDataIntegrity.UNREADABLE)
+
+        md5 = md5.hexdigest()
+        crc = f"{crc:08x}"
+
+        # No-Intro checksums available for the game (md5 and/or crc)
+        references = {}
+        if type == GameDataType.GAME and Path(name).suffix in GAME_SUPPORT_BY_EXTENSION:
+            nointro_rom = get_nointro_rom(name, GAME_SUPPORT_BY_EXTENSION[Path(name).suffix]) or {}
+            references = {key: nointro_rom[key].lower() for key in ["md5", "crc"] if nointro_rom.get(key, None)}
+        checksums = {"md5": md5, "crc": crc}
+
+        if recorded_md5 and recorded_md5.lower() != md5:
+            integrity = GameDataIntegrity.CORRUPTED
+        elif any(reference != checksums[key] for key, reference in references.items()):
+            integrity = GameDataIntegrity.NOT_MATCHING_REFERENCE
+        elif recorded_md5 or references:
+            integrity = GameDataIntegrity.VALID
+        else:
+            integrity = GameDataIntegrity.UNVERIFIABLE
+
+        if integrity != GameDataIntegrity.VALID:
+            logger.info(
+                f"Game data is not valid ({name=}, {type=}, {integrity=}, {checksums=}, {recorded_md5=}, {references=})"
+            )
+
+        return GameDataVerification(name=name, type=type, integrity=integrity, md5=md5, crc=crc)
+
+    def _report_progress(self, current: float, eta: Optional[timedelta]):
+        self._publish(VerifyMemoryProgressEvent(current=current, eta=eta))
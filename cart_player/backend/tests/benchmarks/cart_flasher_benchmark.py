@@ -0,0 +1,146 @@
+"""Benchmark of GBXFlasher against a fake FlashGBX command line (no hardware required).
+
+Usage:
+    python -m cart_player.backend.tests.benchmarks.cart_flasher_benchmark --rom-sizes 262144 1048576 \
+        --throughput 262144 --output results.json
+
+For each ROM size, GBXFlasher is pointed at `cart_player.backend.tests.mocks.fake_flashgbx`, so that the real
+subprocess, output parsing and progress reporting path is exercised. Every operation is timed and compared with the
+time the emulated USB transfer should take; injected failures are checked to be reported as errors. Results are
+emitted as JSON.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from cart_player.backend.adapters.cart_flasher.gbx_flasher import GBXFlasher
+from cart_player.backend.domain.models import CartInfo
+from cart_player.backend.tests.mocks import fake_flashgbx
+from cart_player.core.exceptions import NoCartInCartFlasherException
+
+# Run as a script rather than as a module, so that cart_player packages are not imported by each action
+FAKE_FLASHGBX_COMMAND = [sys.executable, fake_flashgbx.__file__]
+FAILURES = ["no-device", "bad-header", "abort", "crash"]
+
+
+def create_flasher(rom_size: int, save_size: int, throughput: float, failure: str = "none") -> GBXFlasher:
+    """Return a GBXFlasher driving a fake FlashGBX with the given emulation parameters."""
+    return GBXFlasher(
+        flashgbx_command=FAKE_FLASHGBX_COMMAND
+        + [
+            f"--fake-rom-size={rom_size}",
+            f"--fake-save-size={save_size}",
+            f"--fake-throughput={throughput}",
+            f"--fake-failure={failure}",
+        ]
+    )
+
+
+def measure(operation: Callable[[], None], n_runs: int) -> Dict[str, float]:
+    """Time an operation several times and return statistics (in milliseconds)."""
+    timings = []
+    for _ in range(n_runs):
+        t = time.perf_counter()
+        operation()
+        timings.append((time.perf_counter() - t) * 1000)
+
+    return {
+        "n": len(timings),
+        "mean_ms": statistics.mean(timings),
+        "median_ms": statistics.median(timings),
+        "min_ms": min(timings),
+        "max_ms": max(timings),
+    }
+
+
+def run(rom_size: int, save_size: int, throughput: float, n_runs: int, work_path: Path) -> dict:
+    """Benchmark GBXFlasher operations against a fake FlashGBX emulating a cart with the given ROM size.
+
+    Args:
+        rom_size: ROM size in bytes.
+        save_size: Save size in bytes.
+        throughput: Emulated USB throughput in bytes per second.
+        n_runs: Number of times each operation is timed.
+        work_path: Path to the folder where dumps are written.
+
+    Returns:
+        Benchmark results.
+    """
+    flasher = create_flasher(rom_size, save_size, throughput)
+    cart_info: CartInfo = flasher.read_cart_info()
+    progress_reports = []
+
+    def report_progress(current, eta):
+        progress_reports.append(current)
+
+    def dump_game():
+        with tempfile.TemporaryDirectory(dir=work_path) as dirpath:
+            flasher.dump_game(cart_info, Path(dirpath) / "game.gb", report_progress)
+
+    results = {
+        "read_cart_info": measure(lambda: flasher.read_cart_info(), n_runs),
+        "dump_game": measure(dump_game, n_runs),
+        "read_save": measure(lambda: flasher.read_save(cart_info, report_progress), n_runs),
+    }
+    transfer_ms = rom_size / throughput * 1000
+    results["dump_game"]["transfer_ms"] = transfer_ms
+    results["dump_game"]["overhead_ms"] = results["dump_game"]["median_ms"] - transfer_ms
+    results["progress_reports_per_operation"] = len(progress_reports) / (2 * n_runs)
+
+    failures = {}
+    for failure in FAILURES:
+        failing_flasher = create_flasher(rom_size, save_size, throughput, failure)
+        try:
+            with tempfile.TemporaryDirectory(dir=work_path) as dirpath:
+                failing_flasher.dump_game(cart_info, Path(dirpath) / "game.gb", report_progress)
+        except (NoCartInCartFlasherException, RuntimeError):
+            failures[failure] = "reported"
+        else:
+            failures[failure] = "not reported"
+
+    return {
+        "rom_size": rom_size,
+        "save_size": save_size,
+        "throughput": throughput,
+        "operations": results,
+        "failures": failures,
+    }
+
+
+def main(args: List[str]):
+    parser = argparse.ArgumentParser(description="Benchmark GBXFlasher against a fake FlashGBX command line.")
+    parser.add_argument("--rom-sizes", type=int, nargs="+", default=[256 * 1024, 1024 * 1024], help="ROM sizes.")
+    parser.add_argument("--save-size", type=int, default=32 * 1024, help="Save size in bytes.")
+    parser.add_argument("--throughput", type=float, default=1024 * 1024, help="USB throughput in bytes/s.")
+    parser.add_argument("--runs", type=int, default=3, help="Number of times each operation is timed.")
+    parser.add_argument("--work-path", type=Path, default=None, help="Folder where dumps are written.")
+    parser.add_argument("--output", type=Path, default=None, help="JSON output file (default: stdout).")
+    options = parser.parse_args(args)
+
+    report = {
+        "benchmark": "cart_flasher",
+        "date": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "runs": [
+            run(rom_size, options.save_size, options.throughput, options.runs, options.work_path)
+            for rom_size in options.rom_sizes
+        ],
+    }
+
+    output = json.dumps(report, indent=2)
+    if options.output:
+        options.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
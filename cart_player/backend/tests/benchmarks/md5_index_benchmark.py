@@ -0,0 +1,142 @@
+"""Benchmark of md5 lookups from cart headers, across every key of the md5 tables.
+
+Usage:
+    python -m cart_player.backend.tests.benchmarks.md5_index_benchmark --output results.json
+
+For each platform, every key of the md5 table is looked up from the header it encodes (title, code and header
+checksum), with the former linear scan (md5 table already loaded), the md5 index and the compiled resource database (if
+compiled). Results of each method are checked against the linear scan. Results are emitted as JSON.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from cart_player.backend.resources import MD5_FOLDER_PATH
+from cart_player.backend.utils.md5_index import Md5Index
+from cart_player.backend.utils.models import GameSupport
+from cart_player.backend.utils.resource_database import get_resource_database
+
+SUPPORTS = {
+    "Nintendo - Game Boy": GameSupport.GAMEBOY,
+    "Nintendo - Game Boy Color": GameSupport.GAMEBOY_COLOR,
+    "Nintendo - Game Boy Advance": GameSupport.GAMEBOY_ADVANCE,
+}
+
+Header = Tuple[str, Optional[str], str]
+
+
+def find_md5_linear(references: Dict[str, str], title: str, code: Optional[str], header_checksum: str) -> Optional[str]:
+    """Former md5 lookup: linear scan of the md5 table, then again without code if nothing is found."""
+    key = next(
+        (
+            k
+            for k in references.keys()
+            if k.startswith(title) and (not code or code in k) and k.endswith(header_checksum)
+        ),
+        None,
+    )
+    md5 = references.get(key, None)
+    if code and not md5:
+        return find_md5_linear(references, title, None, header_checksum)
+    return md5
+
+
+def get_headers(references: Dict[str, str]) -> List[Header]:
+    """Return the header encoded by each key of an md5 table ('<title>_<code>_<header checksum>')."""
+    headers = []
+    for key in references.keys():
+        title, code, header_checksum = key.rsplit("_", 2)
+        headers.append((title, code if code != "-" else None, header_checksum))
+    return headers
+
+
+def measure(lookup: Callable[[str, Optional[str], str], Optional[str]], headers: List[Header]) -> Tuple[dict, list]:
+    """Time a lookup method on every header, and return statistics (in microseconds) along with its results."""
+    timings, results = [], []
+    for header in headers:
+        t = time.perf_counter()
+        results.append(lookup(*header))
+        timings.append((time.perf_counter() - t) * 1_000_000)
+
+    timings.sort()
+    return {
+        "n": len(timings),
+        "total_ms": sum(timings) / 1000,
+        "mean_us": statistics.mean(timings),
+        "median_us": statistics.median(timings),
+        "p99_us": timings[int(len(timings) * 0.99)],
+        "max_us": timings[-1],
+    }, results
+
+
+def run(filename: str) -> dict:
+    """Benchmark md5 lookups of every key of an md5 table.
+
+    Args:
+        filename: Name of the md5 table (platform name).
+
+    Returns:
+        Benchmark results.
+    """
+    filepath = MD5_FOLDER_PATH / Path(f"{filename}.json")
+    t = time.perf_counter()
+    with open(filepath, "r") as file:
+        references = json.load(file)
+    load_ms = (time.perf_counter() - t) * 1000
+
+    t = time.perf_counter()
+    index = Md5Index(references)
+    index_build_ms = (time.perf_counter() - t) * 1000
+
+    headers = get_headers(references)
+    lookups = {
+        "linear": lambda *header: find_md5_linear(references, *header),
+        "index": index.find,
+    }
+    resource_database = get_resource_database()
+    if resource_database is not None:
+        lookups["database"] = lambda *header: resource_database.find_md5(*header, SUPPORTS[filename])
+
+    results, expected = {}, None
+    for name, lookup in lookups.items():
+        results[name], md5s = measure(lookup, headers)
+        expected = expected if expected is not None else md5s
+        results[name]["mismatches"] = sum(md5 != expected_md5 for md5, expected_md5 in zip(md5s, expected))
+
+    return {
+        "platform": filename,
+        "n_keys": len(references),
+        "json_load_ms": load_ms,
+        "index_build_ms": index_build_ms,
+        "lookups": results,
+    }
+
+
+def main(args: List[str]):
+    parser = argparse.ArgumentParser(description="Benchmark md5 lookups across every key of the md5 tables.")
+    parser.add_argument("--output", type=Path, default=None, help="JSON output file (default: stdout).")
+    options = parser.parse_args(args)
+
+    report = {
+        "benchmark": "md5_index",
+        "date": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "runs": [run(filename) for filename in SUPPORTS],
+    }
+
+    output = json.dumps(report, indent=2)
+    if options.output:
+        options.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,238 @@
+"""Benchmark of the memory subsystem against synthetic memory folders.
+
+Usage:
+    python -m cart_player.backend.tests.benchmarks.memory_benchmark --carts 10 100 1000 --max-saves 200 \
+        --output results.json
+
+For each library size, a synthetic memory folder is generated (carts, games, historized saves, metadata and images),
+then every operation is timed on a random sample of carts. Results are emitted as JSON.
+"""
+import argparse
+import base64
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from cart_player.backend.adapters.memory import LocalMemory
+from cart_player.backend.domain.commands import ReadCartDataCommand
+from cart_player.backend.domain.models import CartInfo, GameMetadata
+from cart_player.backend.domain.ports import CartFlasherPool, GameLibrary
+from cart_player.backend.domain.ports.cart_flasher_pool import DEFAULT_DEVICE_ID
+from cart_player.backend.resources.mock import mock_gb_boxart_filepath, mock_gb_metadata
+from cart_player.backend.services import ReadCartDataHandler
+from cart_player.backend.tests.mocks import MockCartFlasher, MockGameImageLibrary, MockGameMetadataLibrary
+from cart_player.backend.utils.models import GameDataType, GameRegion, GameSupport, SaveDataOrigin
+from cart_player.core import Broker, Channel
+
+SUPPORTS = [GameSupport.GAMEBOY, GameSupport.GAMEBOY_COLOR, GameSupport.GAMEBOY_ADVANCE]
+
+
+def generate_library(
+    root_path: Path,
+    n_carts: int,
+    max_saves: int,
+    game_size: int,
+    save_size: int,
+    seed: int,
+) -> List[CartInfo]:
+    """Generate a synthetic memory folder.
+
+    Every cart has a game, metadata, an image and between 0 and `max_saves` saves (current save + historized ones).
+    Historized saves are written directly on disk, as if they had been saved one after the other.
+
+    Args:
+        root_path: Path to the memory folder to generate.
+        n_carts: Number of carts.
+        max_saves: Maximal number of saves per cart.
+        game_size: Size of each game in bytes.
+        save_size: Size of each save in bytes.
+        seed: Seed of the random generator.
+
+    Returns:
+        Information about the generated carts.
+    """
+    rng = random.Random(seed)
+    memory = LocalMemory(root_path)
+    memory.configure()
+
+    image_content = base64.b64encode(Path(mock_gb_boxart_filepath).read_bytes())
+    data = {}
+    cart_info_list = []
+    for i in range(n_carts):
+        cart_info = CartInfo(
+            title=f"GAME{i:05d}",
+            code=f"{i % 100:02d}",
+            header_checksum=f"{rng.getrandbits(16):04X}",
+            support=SUPPORTS[i % len(SUPPORTS)],
+            region=GameRegion.EUROPE,
+        )
+        cart_info_list.append(cart_info)
+
+        memory.save(cart_info, cart_info.bytes(), GameDataType.CART)
+        memory.save(cart_info, rng.randbytes(game_size), GameDataType.GAME)
+        memory.save(cart_info, GameMetadata(**mock_gb_metadata).bytes(), GameDataType.METADATA)
+        memory.save(cart_info, image_content, GameDataType.IMAGE)
+
+        n_saves = rng.randint(0, max_saves)
+        save_filepath = memory._get_base_save_filepath(cart_info)
+        for increment in range(1, n_saves + 1):
+            content = rng.randbytes(save_size)
+            filepath = (
+                save_filepath
+                if increment == n_saves
+                else save_filepath.with_suffix(save_filepath.suffix + f".{increment}")
+            )
+            filepath.write_bytes(content)
+            data[LocalMemory._get_md5(content)] = {"tag": SaveDataOrigin.CARTRIDGE.value}
+
+    memory.data_filepath.write_text(json.dumps(data))
+    return cart_info_list
+
+
+def measure(operation: Callable[[CartInfo], None], cart_info_list: List[CartInfo]) -> Dict[str, float]:
+    """Time an operation on each provided cart and return statistics (in milliseconds)."""
+    timings = []
+    for cart_info in cart_info_list:
+        t = time.perf_counter()
+        operation(cart_info)
+        timings.append((time.perf_counter() - t) * 1000)
+
+    timings.sort()
+    return {
+        "n": len(timings),
+        "mean_ms": statistics.mean(timings),
+        "median_ms": statistics.median(timings),
+        "p95_ms": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        "min_ms": timings[0],
+        "max_ms": timings[-1],
+    }
+
+
+def run(
+    n_carts: int,
+    max_saves: int,
+    n_samples: int,
+    game_size: int,
+    save_size: int,
+    seed: int,
+    work_path: Path,
+) -> dict:
+    """Generate a synthetic memory folder and benchmark memory operations against it.
+
+    Args:
+        n_carts: Number of carts of the synthetic memory folder.
+        max_saves: Maximal number of saves per cart.
+        n_samples: Number of carts on which each operation is timed.
+        game_size: Size of each game in bytes.
+        save_size: Size of each save in bytes.
+        seed: Seed of the random generator.
+        work_path: Path to the folder where the synthetic memory folder is generated.
+
+    Returns:
+        Benchmark results.
+    """
+    root_path = Path(tempfile.mkdtemp(prefix=f"memory_{n_carts}_", dir=work_path))
+    try:
+        t = time.perf_counter()
+        cart_info_list = generate_library(root_path, n_carts, max_saves, game_size, save_size, seed)
+        generation_duration = time.perf_counter() - t
+
+        memory = LocalMemory(root_path)
+        sample = random.Random(seed).choices(cart_info_list, k=n_samples)
+
+        # ReadCartDataHandler end-to-end: cart is read from a mock flasher, then all its data from memory
+        channel = Channel()
+        broker = Broker(channel=channel)
+        game_library = GameLibrary([MockGameMetadataLibrary()], [MockGameImageLibrary()])
+
+        def read_cart_data(cart_info: CartInfo):
+            handler = ReadCartDataHandler(
+                broker, memory, CartFlasherPool({DEFAULT_DEVICE_ID: MockCartFlasher([cart_info])}), game_library
+            )
+            handler.handle(ReadCartDataCommand(cart_info=None))
+
+        results = {
+            "get_all": measure(lambda cart_info: memory.get_all(cart_info), sample),
+            "get_by_name_game": measure(
+                lambda cart_info: memory.get_by_name(cart_info.game_filename, GameDataType.GAME),
+                sample,
+            ),
+            "get_by_name_save": measure(
+                lambda cart_info: memory.get_by_name(cart_info.base_save_filename, GameDataType.SAVE),
+                sample,
+            ),
+            "get_metadata": measure(
+                lambda cart_info: memory.get_by_name(cart_info.metadata_filename, GameDataType.METADATA, True),
+                sample,
+            ),
+            "read_cart_data": measure(read_cart_data, sample),
+            "save_with_historization": measure(
+                lambda cart_info: memory.save(
+                    cart_info,
+                    os.urandom(save_size),
+                    GameDataType.SAVE,
+                    metadata={"tag": SaveDataOrigin.EMULATOR},
+                ),
+                sample,
+            ),
+        }
+    finally:
+        shutil.rmtree(root_path, ignore_errors=True)
+
+    return {
+        "n_carts": n_carts,
+        "max_saves": max_saves,
+        "generation_duration_s": generation_duration,
+        "operations": results,
+    }
+
+
+def main(args: List[str]):
+    parser = argparse.ArgumentParser(description="Benchmark the memory subsystem against synthetic memory folders.")
+    parser.add_argument("--carts", type=int, nargs="+", default=[10, 100, 1000], help="Library sizes to benchmark.")
+    parser.add_argument("--max-saves", type=int, default=20, help="Maximal number of saves per cart.")
+    parser.add_argument("--samples", type=int, default=20, help="Number of carts on which each operation is timed.")
+    parser.add_argument("--game-size", type=int, default=32 * 1024, help="Size of each game in bytes.")
+    parser.add_argument("--save-size", type=int, default=8 * 1024, help="Size of each save in bytes.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random generator.")
+    parser.add_argument("--work-path", type=Path, default=None, help="Folder where memory folders are generated.")
+    parser.add_argument("--output", type=Path, default=None, help="JSON output file (default: stdout).")
+    options = parser.parse_args(args)
+
+    report = {
+        "benchmark": "memory",
+        "date": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "runs": [
+            run(
+                n_carts,
+                options.max_saves,
+                options.samples,
+                options.game_size,
+                options.save_size,
+                options.seed,
+                options.work_path,
+            )
+            for n_carts in options.carts
+        ],
+    }
+
+    output = json.dumps(report, indent=2)
+    if options.output:
+        options.output.write_text(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
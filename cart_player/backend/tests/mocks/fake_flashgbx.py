@@ -0,0 +1,231 @@
+"""Fake FlashGBX command line, emulating a GBxCart device with a cart inserted.
+
+Usage:
+    python -m cart_player.backend.tests.mocks.fake_flashgbx [--fake-* options] --mode dmg --action info
+    python -m cart_player.backend.tests.mocks.fake_flashgbx --fake-rom-size 1048576 --mode dmg --action backup-rom a.gb
+
+It accepts the FlashGBX arguments used by `GBXFlasher` (actions 'info', 'backup-rom', 'backup-save', 'restore-save' and
+'erase-save') and mimics FlashGBX 3.27 console output: banner, cart header, pv-style progress lines ended by carriage
+returns, ANSI colors and success messages. Transfers are paced to emulate the USB throughput of the device, and failure
+modes can be injected. `GBXFlasher` can be pointed at it with its `flashgbx_command` argument (e.g.
+`[sys.executable, fake_flashgbx.__file__, '--fake-rom-size=1048576']`), so that the real subprocess and parsing path is
+exercised without hardware.
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+VERSION = "3.27"
+DEVICE_NAME = "GBxCart RW v1.4 Pro (Fake)"
+
+# ANSI codes printed by FlashGBX
+RED = "\033[91m"
+GREEN = "\033[92m"
+YELLOW = "\033[33m"
+RESET = "\033[0m"
+CLEAR_LINE = "\033[2K"
+
+FAILURES = ["none", "no-device", "bad-header", "abort", "crash", "hang"]
+GAMEBOY_COLOR_VALUES = ["No support", "Supported", "Required"]
+PROGRESS_BAR_WIDTH = 30
+
+
+class FakeDevice:
+    """Fake GBxCart device, printing FlashGBX output for each action.
+
+    Args:
+        options: Parsed command line options.
+    """
+
+    def __init__(self, options: argparse.Namespace):
+        self._options = options
+        self._rng = random.Random(f"{options.fake_seed}{options.fake_title}{options.fake_header_checksum}")
+
+    def run(self) -> int:
+        """Run the requested action and return the exit code."""
+        options = self._options
+        self._print(f"FlashGBX v{VERSION} by Lesserkuma\n")
+        time.sleep(options.fake_connect_delay)
+        if options.fake_failure == "no-device":
+            self._print("No devices found.")
+            return 1
+        self._print(f"Connected to {DEVICE_NAME}\n")
+
+        if not self._print_header():
+            self._print(
+                self._color(
+                    "\nInvalid data was detected which usually means that the cartridge couldn’t be read correctly. "
+                    "Please make sure you selected the correct mode and that the cartridge contacts are clean.",
+                    RED,
+                )
+            )
+            return 1
+
+        if options.action == "info":
+            return 0
+        if options.action == "backup-rom":
+            self._transfer(options.fake_rom_size, Path(options.path))
+            self._print(self._color("The ROM backup is complete and the checksum was verified successfully!", GREEN))
+        elif options.action == "backup-save":
+            self._transfer(options.fake_save_size, Path(options.path))
+            self._print("The save data backup is complete!")
+        elif options.action == "restore-save":
+            size = Path(options.path).stat().st_size
+            self._transfer(size, None)
+            self._print("The save data was restored!")
+        elif options.action == "erase-save":
+            self._transfer(options.fake_save_size, None)
+            self._print("The save data was erased.")
+        return 0
+
+    def _print_header(self) -> bool:
+        """Print cart header as FlashGBX does before each action, return False if it is not valid in current mode."""
+        options = self._options
+        valid = options.mode == options.fake_mode and options.fake_failure != "bad-header"
+        title = options.fake_title if valid else self._rng.randbytes(8).hex().upper()
+        header_checksum = (
+            f"Valid (0x{int(options.fake_header_checksum, 16):02X})" if valid else self._color("Invalid (0x00)", RED)
+        )
+        invalid = self._color("Invalid", RED)
+
+        if options.mode == "dmg":
+            lines = [
+                f"Game Title:      {title}",
+                "Revision:        0",
+                f"Super Game Boy:  {'Supported' if options.fake_sgb else 'No support'}",
+                f"Game Boy Color:  {options.fake_cgb}",
+                "Real Time Clock: None",
+                f"Nintendo Logo:   {'OK' if valid else invalid}",
+                f"Header Checksum: {header_checksum}",
+                f"ROM Checksum:    0x{self._rng.getrandbits(16):04X}",
+                f"ROM Size:        {options.fake_rom_size // 1024} KiB",
+                f"Save Type:       {self._format_save_type()}",
+            ]
+        else:
+            lines = [
+                f"Game Title:           {title}",
+                f"Game Code:            {options.fake_code}",
+                "Revision:             0",
+                "Real Time Clock:      None",
+                f"Nintendo Logo:        {'OK' if valid else invalid}",
+                f"Cartridge Identifier: {'OK' if valid else invalid}",
+                f"Header Checksum:      {header_checksum}",
+                "ROM Checksum:         Not in database",
+                f"ROM Size:             {max(1, options.fake_rom_size // (1024 * 1024))} MB",
+                f"Save Type:            {self._format_save_type()}",
+            ]
+        self._print("\n".join(lines) + "\n")
+        return valid
+
+    def _format_save_type(self) -> str:
+        size = self._options.fake_save_size
+        return "None" if size == 0 else f"SRAM ({size // 1024} KiB)"
+
+    def _transfer(self, size: int, filepath: Optional[Path]):
+        """Emulate a transfer of the given size at the configured throughput, writing random data into a file."""
+        options = self._options
+        chunk_size = max(1, int(options.fake_throughput * options.fake_progress_interval))
+        failure_position = int(size * options.fake_failure_at)
+        start_time = time.monotonic()
+        f = open(filepath, "wb") if filepath is not None else None
+        try:
+            position = 0
+            while position < size:
+                if options.fake_failure in ["abort", "crash", "hang"] and position >= failure_position:
+                    self._fail()
+                n_bytes = min(chunk_size, size - position)
+                time.sleep(n_bytes / options.fake_throughput)
+                if f is not None:
+                    f.write(self._rng.randbytes(n_bytes))
+                position += n_bytes
+                self._print_progress(position, size, time.monotonic() - start_time)
+        finally:
+            if f is not None:
+                f.close()
+        self._print("\n")
+
+    def _print_progress(self, position: int, size: int, elapsed: float):
+        speed = position / 1024 / elapsed if elapsed > 0 else 0.0
+        left = (size - position) / (position / elapsed) if position and elapsed > 0 else 0
+        progress = position / size if size else 1.0
+        bar = "█" * int(progress * PROGRESS_BAR_WIDTH)
+        line = (
+            f"{format_size(position).rjust(8)}/{format_size(size)} {format_time(elapsed)} [{speed:6.2f}KiB/s] "
+            f"[{bar.ljust(PROGRESS_BAR_WIDTH)}] {int(progress * 100):3d}% ETA {format_time(left)} "
+        )
+        self._print((CLEAR_LINE if self._options.fake_ansi else "") + line, end="\r")
+
+    def _fail(self):
+        failure = self._options.fake_failure
+        if failure == "abort":
+            self._print("\nOperation stopped.\n")
+            self._print(self._color("The cartridge connection is unstable!", RED))
+            sys.exit(1)
+        if failure == "crash":
+            raise RuntimeError("Fake device has been disconnected.")
+        while True:  # hang
+            time.sleep(60)
+
+    def _color(self, text: str, color: str) -> str:
+        return f"{color}{text}{RESET}" if self._options.fake_ansi else text
+
+    @staticmethod
+    def _print(text: str, end: str = "\n"):
+        sys.stdout.write(text + end)
+        sys.stdout.flush()
+
+
+def format_size(size: int) -> str:
+    """Format a size as FlashGBX does in progress lines (e.g. '1.25MiB')."""
+    if size < 1024:
+        return f"{size}B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f}KiB"
+    return f"{size / 1024 / 1024:.2f}MiB"
+
+
+def format_time(seconds: float) -> str:
+    """Format a duration as FlashGBX does in progress lines (e.g. '00:01:05')."""
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(description="Fake FlashGBX command line, emulating a GBxCart device.")
+
+    # FlashGBX arguments
+    parser.add_argument("--mode", choices=["dmg", "agb"], required=True)
+    parser.add_argument("--action", choices=["info", "backup-rom", "backup-save", "restore-save", "erase-save"])
+    parser.add_argument("--device-port", default=None)
+    parser.add_argument("--overwrite", action="store_true")
+    parser.add_argument("path", nargs="?", default=None)
+
+    # Emulation arguments
+    parser.add_argument("--fake-mode", choices=["dmg", "agb"], default="dmg", help="Mode of the inserted cart.")
+    parser.add_argument("--fake-title", default="FAKEGAME", help="Title of the inserted cart.")
+    parser.add_argument("--fake-code", default="AFKE", help="Game code of the inserted cart (agb only).")
+    parser.add_argument("--fake-header-checksum", default="5A", help="Header checksum (hexadecimal).")
+    parser.add_argument("--fake-cgb", choices=GAMEBOY_COLOR_VALUES, default="No support", help="Game Boy Color.")
+    parser.add_argument("--fake-sgb", action="store_true", help="Super Game Boy supported.")
+    parser.add_argument("--fake-rom-size", type=int, default=1024 * 1024, help="ROM size in bytes.")
+    parser.add_argument("--fake-save-size", type=int, default=32 * 1024, help="Save size in bytes (0: no save).")
+    parser.add_argument("--fake-throughput", type=float, default=256 * 1024, help="USB throughput in bytes/s.")
+    parser.add_argument("--fake-progress-interval", type=float, default=0.05, help="Seconds between progress lines.")
+    parser.add_argument("--fake-connect-delay", type=float, default=0.0, help="Device connection time in seconds.")
+    parser.add_argument("--fake-no-ansi", dest="fake_ansi", action="store_false", help="Disable ANSI codes.")
+    parser.add_argument("--fake-failure", choices=FAILURES, default="none", help="Failure to inject.")
+    parser.add_argument("--fake-failure-at", type=float, default=0.5, help="Transfer progress at which it fails.")
+    parser.add_argument("--fake-seed", type=int, default=0, help="Seed of the random generator.")
+    options = parser.parse_args(args)
+
+    if options.action in ["backup-rom", "backup-save", "restore-save"] and options.path is None:
+        parser.error(f"action '{options.action}' requires a path")
+
+    return FakeDevice(options).run()
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
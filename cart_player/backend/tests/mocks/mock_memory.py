@@ -1,13 +1,15 @@
+import hashlib
+import io
 import itertools
 import os
 from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import BinaryIO, Dict, List, Optional, Union
 
 from cart_player.backend.adapters.memory import LocalMemory
-from cart_player.backend.domain.models import CartInfo, GameData
+from cart_player.backend.domain.models import CartInfo, CartSummary, GameData
 from cart_player.backend.utils.models import GameDataType
 
 
@@ -22,6 +24,8 @@ class MockMemory(LocalMemory):
     def __init__(self, root_path: Union[Path, str], entries: List[MockGameData] = []):
         super().__init__(root_path=root_path)
 
+        self._entries = entries
+
         self._memory_carts: Dict[str, List[GameData]] = defaultdict(list)
         self._memory_games: Dict[str, List[GameData]] = defaultdict(list)
         self._memory_saves: Dict[str, List[GameData]] = defaultdict(list)
@@ -133,6 +137,18 @@ class MockMemory(LocalMemory):
         entry.content = None if not with_content else entry.content
         return entry
 
+    def export(self, name: str, type: GameDataType, target_filepath: Path) -> bool:
+        entry = self.get_by_name(name, type, with_content=True)
+        if entry is None:
+            return False
+
+        with open(target_filepath, "xb") as f:
+            f.write(entry.content)
+        return True
+
+    def prepare_export(self, name: str, type: GameDataType):
+        pass
+
     def get_all(
         self,
         cart_info: CartInfo,
@@ -183,6 +199,41 @@ class MockMemory(LocalMemory):
                     image.content = None
             return images
 
+    def open(self, name: str, type: GameDataType) -> Optional[BinaryIO]:
+        entry = self.get_by_name(name, type, with_content=True)
+        return io.BytesIO(entry.content) if entry is not None else None
+
+    def get_checksums(self, type: GameDataType) -> Dict[str, Optional[str]]:
+        return {
+            entry.name: hashlib.md5(entry.content).hexdigest()
+            for entry_list in self._get_data_list(type).values()
+            for entry in entry_list
+            if entry.content is not None
+        }
+
+    def get_many_by_name(
+        self,
+        names: List[str],
+        type: GameDataType,
+        with_content: bool = False,
+    ) -> Dict[str, Optional[GameData]]:
+        return {name: self.get_by_name(name, type, with_content) for name in names}
+
+    def list_carts(self) -> List[CartSummary]:
+        cart_summaries = []
+        for entry in self._entries:
+            games = [game for game in self._memory_games[entry.cart_info.game_filename] if game]
+            saves = self._memory_saves[entry.cart_info.base_save_filename]
+            cart_summaries.append(
+                CartSummary(
+                    cart_info=entry.cart_info,
+                    game_installed=bool(games),
+                    n_saves=len(saves),
+                    last_save_date=max((save.date for save in saves), default=None),
+                )
+            )
+        return cart_summaries
+
     def _get_data_list(self, type: GameDataType) -> Dict[str, GameData]:
         if type == GameDataType.CART:
             return self._memory_carts
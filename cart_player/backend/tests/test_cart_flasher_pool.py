@@ -0,0 +1,44 @@
+import threading
+import time
+
+from cart_player.backend.domain.ports import CartFlasherPool, JobPriority
+from cart_player.backend.tests.mocks import MockCartFlasher
+
+
+def test_queue_is_ordered_by_priority():
+    pool = CartFlasherPool({"device": MockCartFlasher()})
+    started = threading.Event()
+    release = threading.Event()
+    order = []
+
+    def reserve(priority: JobPriority):
+        with pool.acquire("device", priority):
+            order.append(priority)
+            started.set()
+            release.wait()
+
+    threads = [threading.Thread(target=reserve, args=(JobPriority.GAME,))]
+    threads[0].start()
+    assert started.wait(timeout=5.0)
+    for priority in [JobPriority.GAME, JobPriority.SAVE, JobPriority.CART_INFO]:
+        threads.append(threading.Thread(target=reserve, args=(priority,)))
+        threads[-1].start()
+        while len(pool.get_queue("device")) < len(threads):
+            time.sleep(0.01)
+
+    # Sequence reserving the device first, then waiting sequences by priority
+    queue = pool.get_queue("device")
+    assert queue[0].is_running
+    assert [job.priority for job in queue] == [
+        JobPriority.GAME,
+        JobPriority.CART_INFO,
+        JobPriority.SAVE,
+        JobPriority.GAME,
+    ]
+    assert all(job.wait_time >= 0 for job in queue)
+
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert order == [JobPriority.GAME, JobPriority.CART_INFO, JobPriority.SAVE, JobPriority.GAME]
+    assert pool.get_queue("device") == []
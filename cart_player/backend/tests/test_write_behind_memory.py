@@ -0,0 +1,94 @@
+import logging
+import threading
+import time
+
+import pytest
+
+from cart_player.backend.adapters.memory import LocalMemory, WriteBehindMemory
+from cart_player.backend.adapters.memory import write_behind_memory
+from cart_player.backend.domain.models import CartInfo
+from cart_player.backend.logging_handlers import EventPublisherHandler
+from cart_player.backend.utils.models import GameDataType, GameSupport
+
+
+@pytest.fixture(autouse=True)
+def no_event_publisher(monkeypatch):
+    """Errors are only logged, not published to the app broker."""
+    for handler in logging.root.handlers:
+        if type(handler).__name__ == EventPublisherHandler.__name__:  # module may be imported under another name
+            monkeypatch.setattr(handler, "emit", lambda record: None)
+
+
+@pytest.fixture
+def cart_info() -> CartInfo:
+    return CartInfo("TETRIS", None, "0A", GameSupport.GAMEBOY, id_override="Tetris (World)")
+
+
+@pytest.fixture
+def local_memory(tmp_path, cart_info) -> LocalMemory:
+    local_memory = LocalMemory(tmp_path / "memory")
+    local_memory.configure()
+    local_memory.save(cart_info, cart_info.bytes(), GameDataType.CART)
+    return local_memory
+
+
+def test_failed_write_stays_readable(tmp_path, monkeypatch, local_memory, cart_info):
+    monkeypatch.setattr(write_behind_memory, "RETRY_DELAYS", [0.01])
+    save = local_memory.save
+    n_attempts = 0
+
+    def failing_save(*args, **kwargs):
+        nonlocal n_attempts
+        n_attempts += 1
+        raise OSError("Disk is full")
+
+    monkeypatch.setattr(local_memory, "save", failing_save)
+    memory = WriteBehindMemory(local_memory, journal_path=tmp_path / "journal")
+    memory.save(cart_info, b"save", GameDataType.SAVE)
+
+    # Write is retried, and still seen by reads
+    assert not memory.flush(timeout=0.2)
+    assert n_attempts > 1
+    assert memory.get_by_name(cart_info.base_save_filename, GameDataType.SAVE, True).content == b"save"
+    assert memory.get_version(cart_info.base_save_filename, GameDataType.SAVE).startswith("pending:")
+    assert [game_data.name for game_data in memory.get_all(cart_info, GameDataType.SAVE)] == [
+        cart_info.base_save_filename
+    ]
+    assert memory.export(cart_info.base_save_filename, GameDataType.SAVE, tmp_path / "export.sav")
+    assert (tmp_path / "export.sav").read_bytes() == b"save"
+    assert list((tmp_path / "journal").iterdir())
+
+    # Write is applied once decorated memory is writable again
+    monkeypatch.setattr(local_memory, "save", save)
+    assert memory.flush(timeout=5.0)
+    assert local_memory.get_by_name(cart_info.base_save_filename, GameDataType.SAVE, True).content == b"save"
+    assert not list((tmp_path / "journal").iterdir())
+
+
+def test_save_file_does_not_block_reads(tmp_path, monkeypatch, local_memory, cart_info):
+    save_file = local_memory.save_file
+    started, release = threading.Event(), threading.Event()
+
+    def slow_save_file(*args, **kwargs):
+        started.set()
+        release.wait()
+        return save_file(*args, **kwargs)
+
+    monkeypatch.setattr(local_memory, "save_file", slow_save_file)
+    memory = WriteBehindMemory(local_memory, journal_path=tmp_path / "journal")
+    filepath = memory.get_temporary_filepath()
+    filepath.write_bytes(b"game")
+    thread = threading.Thread(target=memory.save_file, args=(cart_info, filepath, GameDataType.GAME))
+    thread.start()
+    try:
+        assert started.wait(timeout=5.0)
+        start_time = time.monotonic()
+        assert memory.get_by_name(cart_info.cart_filename, GameDataType.CART) is not None
+        memory.save(cart_info, b"save", GameDataType.SAVE)
+        assert time.monotonic() - start_time < 1.0
+    finally:
+        release.set()
+        thread.join()
+
+    assert memory.flush(timeout=5.0)
+    assert local_memory.get_by_name(cart_info.game_filename, GameDataType.GAME) is not None
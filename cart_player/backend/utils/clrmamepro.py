@@ -0,0 +1,162 @@
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+TOKEN_REGEX = re.compile(r'"([^"]*)"|(\()|(\))|([^\s()"]+)')
+NORMALIZE_REGEX = re.compile(r"[^a-z0-9]+")
+
+Block = Dict[str, Union[str, "Block"]]
+
+
+def parse_clrmamepro(text: str) -> List[Tuple[str, Block]]:
+    """Parse a clrmamepro file (e.g. libretro .dat files) in a single pass.
+
+    Each top-level block (e.g. 'game ( comment "Tetris (World)" rom ( crc 46DF91AD ) )') is parsed into a dict of its
+    values and nested blocks. If a key is repeated within a block, its first value is kept.
+
+    Args:
+        text: Content of the file.
+
+    Returns:
+        Type and content of each top-level block, in order of the file.
+    """
+    tokens = _tokenize(text)
+    blocks = []
+    for _, block_type in tokens:
+        if next(tokens, None) != (None, "("):
+            raise ValueError(f"Expected a block after '{block_type}'.")
+        blocks.append((block_type, _parse_block(tokens)))
+
+    return blocks
+
+
+def normalize_name(name: str) -> str:
+    """Normalize a game name for lookups (case, punctuation and spacing are ignored)."""
+    return NORMALIZE_REGEX.sub(" ", name.lower()).strip()
+
+
+class GameRecordIndex:
+    """Game records (field values by game name), indexed by exact name and by normalized name.
+
+    Properties:
+        names: Names of the games, in order of insertion.
+    """
+
+    def __init__(self):
+        self._records: Dict[str, Dict[str, str]] = {}
+        self._normalized_names: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    @property
+    def names(self) -> List[str]:
+        """Names of the games, in order of insertion."""
+        return list(self._records.keys())
+
+    def add(self, name: str, values: Dict[str, str]):
+        """Merge field values into the record of a game (values already set are kept)."""
+        record = self._records.setdefault(name, {})
+        for field, value in values.items():
+            record.setdefault(field, value)
+        self._normalized_names.setdefault(normalize_name(name), name)
+
+    def get(self, name: str) -> Optional[Dict[str, str]]:
+        """Return the record of a game with the given name, None if there is none."""
+        return self._records.get(name, None)
+
+    def find(self, name: str) -> Optional[Dict[str, str]]:
+        """Find the record of a game, by exact name, then by normalized name, then by the first name containing, or
+        contained in, the given one.
+
+        Args:
+            name: Name of the game.
+
+        Returns:
+            Record of the game, None if not found.
+        """
+        if name in self._records:
+            return self._records[name]
+
+        normalized_name = self._normalized_names.get(normalize_name(name), None)
+        if normalized_name is not None:
+            return self._records[normalized_name]
+
+        return next((record for key, record in self._records.items() if key in name or name in key), None)
+
+
+def load_metadat_records(base_path: Path, filename: str, folders: Dict[str, str]) -> GameRecordIndex:
+    """Load libretro metadat files into game records, keyed by game comment. Each file is parsed once.
+
+    Args:
+        base_path: Path to the metadat folder.
+        filename: Name of the metadat file in each folder (e.g. 'Nintendo - Game Boy.dat').
+        folders: Folder of the file each field is read from, by field (e.g. {'genre': 'genre', 'crc': 'developer'}).
+            A field is read from the game block, or else from its rom block.
+
+    Returns:
+        Game records.
+    """
+    records = GameRecordIndex()
+    for folder in dict.fromkeys(folders.values()):
+        fields = [field for field, field_folder in folders.items() if field_folder == folder]
+        with open(Path(base_path) / folder / filename, "r") as f:
+            for name, values in parse_metadat_records(f.read(), fields):
+                records.add(name, values)
+
+    return records
+
+
+def parse_metadat_records(text: str, fields: List[str]) -> Iterator[Tuple[str, Dict[str, str]]]:
+    """Parse the game records of a libretro metadat file.
+
+    Args:
+        text: Content of the metadat file.
+        fields: Fields to read, from the game block or else from its rom block (e.g. 'genre' or 'crc').
+
+    Returns:
+        Comment of each game block and the values of the fields it holds, in order of the file.
+    """
+    for block_type, block in parse_clrmamepro(text):
+        comment = block.get("comment", None)
+        if block_type != "game" or not isinstance(comment, str):
+            continue
+        rom = block.get("rom", None)
+        rom = rom if isinstance(rom, dict) else {}
+        values = {field: block.get(field, rom.get(field, None)) for field in fields}
+        yield comment, {field: value for field, value in values.items() if isinstance(value, str)}
+
+
+def _tokenize(text: str) -> Iterator[Tuple[Optional[str], str]]:
+    """Yield tokens as (kind, value): kind is 'string' for quoted values, 'word' for other values and None for
+    parentheses."""
+    for match in TOKEN_REGEX.finditer(text):
+        quoted, open_parenthesis, close_parenthesis, word = match.groups()
+        if quoted is not None:
+            yield "string", quoted
+        elif open_parenthesis is not None:
+            yield None, "("
+        elif close_parenthesis is not None:
+            yield None, ")"
+        else:
+            yield "word", word
+
+
+def _parse_block(tokens: Iterator[Tuple[Optional[str], str]]) -> Block:
+    """Parse the content of a block, until its closing parenthesis."""
+    block: Block = {}
+    for kind, key in tokens:
+        if kind is None and key == ")":
+            return block
+        if kind is None:
+            raise ValueError("Expected a key, found '('.")
+
+        value_kind, value = next(tokens, (None, ")"))
+        if value_kind is None and value == "(":
+            block.setdefault(key, _parse_block(tokens))
+        elif value_kind is None:
+            raise ValueError(f"Expected a value for '{key}'.")
+        else:
+            block.setdefault(key, value)
+
+    raise ValueError("Unexpected end of file, missing ')'.")
@@ -0,0 +1,195 @@
+import ctypes
+import ctypes.util
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import sys
+import zlib
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Dict
+
+from cart_player.backend import config
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::files")
+
+FICLONE = 0x40049409  # ioctl request for cloning a file on Linux (btrfs, xfs, ...)
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Errors meaning a copy method is not supported for the given files (the next method has to be tried)
+UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EPERM,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.ENOTTY,
+    errno.EBADF,
+}
+
+
+class CopyMethod(str, Enum):
+    """Method used for copying a file."""
+
+    HARDLINK = "HARDLINK"
+    REFLINK = "REFLINK"
+    COPY_FILE_RANGE = "COPY_FILE_RANGE"
+    SENDFILE = "SENDFILE"
+    STREAM = "STREAM"
+
+
+def copy_file(source: Path, target: Path, allow_hardlink: bool = False) -> CopyMethod:
+    """Copy a file without loading its content in memory, using the cheapest method supported by the filesystem.
+
+    Methods are tried in this order: hardlink (if allowed), reflink, copy_file_range, sendfile, streamed copy.
+    Hardlinks share their content with the source file: only allow them when neither file is modified in place.
+
+    Args:
+        source: Path to the file to copy.
+        target: Path to the copy. It must not exist.
+        allow_hardlink: True if target can be a hardlink to source, False otherwise.
+
+    Returns:
+        Method used for copying the file.
+
+    Raises:
+        FileExistsError: If target already exists.
+        OSError: If file cannot be copied.
+    """
+    if target.exists():
+        raise FileExistsError(f"Target file already exists ({target=}).")
+
+    if allow_hardlink and _try(lambda: os.link(source, target)):
+        return CopyMethod.HARDLINK
+    if _try(lambda: _reflink(source, target)):
+        return CopyMethod.REFLINK
+
+    try:
+        with open(source, "rb") as fsrc, open(target, "wb") as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            if hasattr(os, "copy_file_range") and _try(lambda: _copy_file_range(fsrc, fdst, size)):
+                return CopyMethod.COPY_FILE_RANGE
+            _rewind(fsrc, fdst)
+            if sys.platform.startswith("linux") and _try(lambda: _sendfile(fsrc, fdst, size)):
+                return CopyMethod.SENDFILE
+
+            _rewind(fsrc, fdst)
+            shutil.copyfileobj(fsrc, fdst, STREAM_CHUNK_SIZE)
+            return CopyMethod.STREAM
+    except Exception:
+        target.unlink(missing_ok=True)
+        raise
+
+
+def move_file(source: Path, target: Path):
+    """Move a file, replacing target if it exists.
+
+    The move is an atomic rename when both files are on the same filesystem. Otherwise, source is first copied next to
+    target (see `copy_file`), then renamed, so that target is never partially written.
+
+    Args:
+        source: Path to the file to move.
+        target: Path to the moved file.
+
+    Raises:
+        OSError: If file cannot be moved.
+    """
+    try:
+        os.replace(source, target)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    tmp_target = target.with_name(target.name + ".tmp")
+    tmp_target.unlink(missing_ok=True)
+    try:
+        copy_file(source, tmp_target)
+        os.replace(tmp_target, target)
+    except Exception:
+        tmp_target.unlink(missing_ok=True)
+        raise
+    source.unlink()
+
+
+def hash_file(filepath: Path) -> Dict[str, str]:
+    """Return the checksums of a file content, computed in a single pass over the file read by chunks.
+
+    Args:
+        filepath: Path to the file to hash.
+
+    Returns:
+        Checksums of the file content, as hexadecimal strings ('md5', 'sha1' and 'crc' for crc32, as in No-Intro).
+    """
+    md5 = hashlib.md5()
+    sha1 = hashlib.sha1()
+    crc = 0
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), b""):
+            md5.update(chunk)
+            sha1.update(chunk)
+            crc = zlib.crc32(chunk, crc)
+    return {"md5": md5.hexdigest(), "sha1": sha1.hexdigest(), "crc": f"{crc:08x}"}
+
+
+def _rewind(fsrc, fdst):
+    """Rewind both files, discarding anything written by a copy method which has failed."""
+    fsrc.seek(0)
+    fdst.seek(0)
+    fdst.truncate()
+
+
+def _try(copy: Callable[[], None]) -> bool:
+    """Return True if the copy method succeeded, False if it is not supported."""
+    try:
+        copy()
+    except OSError as e:
+        if e.errno not in UNSUPPORTED_ERRNOS:
+            raise
+        logger.debug(f"Copy method not supported: {e}")
+        return False
+    return True
+
+
+def _reflink(source: Path, target: Path):
+    """Clone a file (copy-on-write), on filesystems supporting it (APFS, btrfs, xfs, ...)."""
+    if sys.platform == "darwin":
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        if libc.clonefile(os.fsencode(source), os.fsencode(target), 0) != 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+    elif sys.platform.startswith("linux"):
+        import fcntl
+
+        with open(source, "rb") as fsrc, open(target, "wb") as fdst:
+            try:
+                fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+            except OSError:
+                fdst.close()
+                target.unlink(missing_ok=True)
+                raise
+    else:
+        raise OSError(errno.ENOTSUP, "Reflink is not supported on this platform.")
+
+
+def _copy_file_range(fsrc, fdst, size: int):
+    """Copy a file within the kernel, using copy_file_range (Linux)."""
+    copied = 0
+    while copied < size:
+        n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), size - copied)
+        if n == 0:
+            break
+        copied += n
+
+
+def _sendfile(fsrc, fdst, size: int):
+    """Copy a file within the kernel, using sendfile (Linux)."""
+    copied = 0
+    while copied < size:
+        n = os.sendfile(fdst.fileno(), fsrc.fileno(), copied, size - copied)
+        if n == 0:
+            break
+        copied += n
@@ -0,0 +1,91 @@
+import bisect
+import functools
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cart_player.backend.resources import MD5_FOLDER_PATH
+from cart_player.backend.utils.models import GameSupport
+
+_lock = threading.Lock()
+
+
+class Md5Index:
+    """Index of the md5 references of a platform, keyed by cart header ('<title>_<code>_<header checksum>').
+
+    Keys are sorted, so that the keys starting with a title are found by a binary search.
+
+    Args:
+        references: Md5 references by key, in order of the md5 table (first references take precedence).
+    """
+
+    def __init__(self, references: Dict[str, str]):
+        entries = sorted((key, position, md5) for position, (key, md5) in enumerate(references.items()))
+        self._keys: List[str] = [key for key, _, _ in entries]
+        self._entries: List[Tuple[int, str, str]] = [(position, key, md5) for key, position, md5 in entries]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def find(self, title: str, code: Optional[str], header_checksum: str) -> Optional[str]:
+        """Return the md5 of a cart (see `select_md5`), None if not referenced."""
+        start = bisect.bisect_left(self._keys, title)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(title):
+            end += 1
+
+        return select_md5(self._entries[start:end], title, code, header_checksum)
+
+
+def select_md5(
+    candidates: Iterable[Tuple[int, str, str]],
+    title: str,
+    code: Optional[str],
+    header_checksum: str,
+) -> Optional[str]:
+    """Select the md5 of a cart among md5 references, in a single pass.
+
+    The first reference (in order of the md5 table) whose key starts with the title, contains the code and ends with the
+    header checksum is selected. If none contains the code (or if there is no code), the first one matching title and
+    header checksum is selected.
+
+    Args:
+        candidates: Md5 references (position in md5 table, key and md5), in any order.
+        title: Cart title.
+        code: Cart code (None if the cart has none).
+        header_checksum: Cart header checksum.
+
+    Returns:
+        Md5 of the cart, None if not referenced.
+    """
+    with_code = without_code = None
+    for candidate in candidates:
+        position, key, _ = candidate
+        if not key.startswith(title) or not key.endswith(header_checksum):
+            continue
+        if without_code is None or position < without_code[0]:
+            without_code = candidate
+        if code and code in key and (with_code is None or position < with_code[0]):
+            with_code = candidate
+
+    candidate = with_code or without_code
+    return candidate[2] if candidate is not None else None
+
+
+def get_md5_index(support: GameSupport) -> Md5Index:
+    """Return the md5 index of a support, loaded once and shared by threads."""
+    filename = {
+        GameSupport.GAMEBOY: "Nintendo - Game Boy",
+        GameSupport.GAMEBOY_OR_GAMEBOY_COLOR: "Nintendo - Game Boy Color",
+        GameSupport.GAMEBOY_COLOR: "Nintendo - Game Boy Color",
+        GameSupport.GAMEBOY_ADVANCE: "Nintendo - Game Boy Advance",
+    }[support]
+    with _lock:
+        return _load_md5_index(MD5_FOLDER_PATH / Path(f"{filename}.json"))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_md5_index(filepath: Path) -> Md5Index:
+    with open(filepath, "r") as file:
+        return Md5Index(json.load(file))
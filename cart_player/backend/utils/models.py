@@ -49,3 +49,13 @@ class SaveDataOrigin(str, Enum):
 
     CARTRIDGE = "CARTRIDGE"
     EMULATOR = "EMULATOR"
+
+
+class GameDataIntegrity(str, Enum):
+    """Integrity of game data stored in memory."""
+
+    VALID = "VALID"  # matches its recorded checksum and/or its No-Intro reference
+    CORRUPTED = "CORRUPTED"  # does not match its recorded checksum
+    NOT_MATCHING_REFERENCE = "NOT_MATCHING_REFERENCE"  # does not match its No-Intro reference (bad dump)
+    UNVERIFIABLE = "UNVERIFIABLE"  # neither recorded checksum nor No-Intro reference
+    UNREADABLE = "UNREADABLE"
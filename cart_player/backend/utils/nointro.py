@@ -0,0 +1,140 @@
+import functools
+import logging
+import threading
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from cart_player.backend import config
+from cart_player.backend.resources import NOINTRO_FOLDER_PATH
+from cart_player.backend.utils.models import GameSupport
+from cart_player.backend.utils.resource_database import get_resource_database
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::nointro")
+
+CHECKSUM_KEYS = ["md5", "crc", "sha1"]
+
+_lock = threading.Lock()
+
+
+class NoIntroIndex:
+    """No-Intro rom entries of a platform, indexed by name (without extension) and by checksum (md5, crc and sha1).
+
+    Entries are attribute dicts (name, size, crc, md5, sha1, ...) shared by all maps. A name refers to its last entry,
+    a checksum to its first entry (in order of the No-Intro file).
+
+    Args:
+        roms: Attributes of each rom entry, in order of the No-Intro file.
+    """
+
+    def __init__(self, roms: List[Dict[str, str]]):
+        self._by_name = {Path(rom["name"]).stem: rom for rom in roms if rom.get("name")}
+        self._by_checksum: Dict[str, Dict[str, Dict[str, str]]] = {key: {} for key in CHECKSUM_KEYS}
+        for rom in roms:
+            for key in CHECKSUM_KEYS:
+                if key in rom:
+                    self._by_checksum[key].setdefault(rom[key], rom)
+
+    def __len__(self) -> int:
+        return len(self._by_name)
+
+    def get(self, name: str) -> Optional[Dict[str, str]]:
+        """Return the rom entry with the given name (without extension), None if not referenced."""
+        return self._by_name.get(name, None)
+
+    def find(self, key: str, checksum: str) -> Optional[Dict[str, str]]:
+        """Return the first rom entry with the given checksum (key among 'md5', 'crc' and 'sha1'), None if not
+        referenced."""
+        return self._by_checksum[key].get(checksum, None)
+
+
+def get_nointro_rom(name: str, support: GameSupport) -> Optional[Dict[str, str]]:
+    """Return the No-Intro reference of a game.
+
+    Args:
+        name: Name of the game, with or without its extension (e.g. 'Tetris (World) (Rev 1).gb').
+        support: Support of the game.
+
+    Returns:
+        Attributes of the No-Intro rom entry (name, size, crc, md5, sha1, ...), None if the game is not referenced.
+    """
+    resource_database = get_resource_database()
+    if resource_database is not None:
+        return resource_database.get_nointro_rom(Path(name).stem, support)
+
+    return get_nointro_index(support).get(Path(name).stem)
+
+
+def check_nointro_rom(name: str, support: GameSupport, checksums: Dict[str, str]) -> Optional[bool]:
+    """Compare the checksums of a game with its No-Intro reference, logging the result.
+
+    Args:
+        name: Name of the game, with or without its extension (e.g. 'Tetris (World) (Rev 1).gb').
+        support: Support of the game.
+        checksums: Checksums of the game (lowercase hex), by key among 'md5', 'crc' and 'sha1'.
+
+    Returns:
+        True if the game matches its reference, False if it does not, None if the game is not referenced.
+    """
+    nointro_rom = get_nointro_rom(name, support)
+    if nointro_rom is None:
+        logger.debug(f"No reference to compare game with ({name=}, {checksums=})")
+        return None
+    if any(nointro_rom.get(key, value).lower() != value for key, value in checksums.items()):
+        logger.info(f"Game not matching its reference ({name=}, {checksums=}, {nointro_rom=})")
+        return False
+
+    logger.debug(f"Game matching its reference ({name=}, {checksums=})")
+    return True
+
+
+def get_nointro_index(support: GameSupport) -> NoIntroIndex:
+    """Return the No-Intro index of a support, loaded once (on first call or by `warm_up_nointro`) and shared by
+    threads."""
+    filename = {
+        GameSupport.GAMEBOY: "Nintendo - Game Boy",
+        GameSupport.GAMEBOY_OR_GAMEBOY_COLOR: "Nintendo - Game Boy Color",
+        GameSupport.GAMEBOY_COLOR: "Nintendo - Game Boy Color",
+        GameSupport.GAMEBOY_ADVANCE: "Nintendo - Game Boy Advance",
+    }[support]
+    with _lock:
+        return _load_nointro_index(NOINTRO_FOLDER_PATH / Path(f"{filename}.xml"))
+
+
+def warm_up_nointro() -> Optional[threading.Thread]:
+    """Load No-Intro indexes of all supports in a background thread, so that the first identification of a cart does
+    not wait for them. Nothing is loaded if compiled resources are available.
+
+    Returns:
+        Thread loading the indexes, None if there is nothing to load.
+    """
+    if get_resource_database() is not None:
+        return None
+
+    def load():
+        for support in GameSupport:
+            try:
+                get_nointro_index(support)
+            except (OSError, ET.ParseError) as e:
+                logger.info(f"Unable to load No-Intro references ({support=}): {e}", exc_info=True)
+
+    thread = threading.Thread(target=load, name="NoIntroWarmUp", daemon=True)
+    thread.start()
+    return thread
+
+
+@functools.lru_cache(maxsize=None)
+def _load_nointro_index(filepath: Path) -> NoIntroIndex:
+    """Stream a No-Intro file into an index, clearing parsed elements so that the document is never built in RAM."""
+    roms = []
+    context = ET.iterparse(filepath, events=("start", "end"))
+    _, root = next(context)
+    for event, element in context:
+        if event != "end":
+            continue
+        if element.tag == "rom":
+            roms.append(dict(element.attrib))
+        elif element.tag == "game":
+            root.clear()
+
+    return NoIntroIndex(roms)
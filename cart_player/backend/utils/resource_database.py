@@ -0,0 +1,438 @@
+"""Compiled database of game resources (No-Intro, md5, Launchbox and libretro data).
+
+Text resources are compiled into a single SQLite file, indexed for each lookup key, so that lookups do not parse any
+text. The file is opened read-only and memory-mapped: it loads in no time, and its pages are shared by all processes
+through the page cache.
+
+Carts referenced by the md5 tables are also resolved offline across all resources (md5, then No-Intro name, libretro
+record and Launchbox entry), so that identifying a cart from its header is a single indexed read (see `CartIdentity`).
+
+Usage:
+    python -m cart_player.backend.utils.resource_database [--output resources.db]
+
+Lookup functions of the app use the database if it has been compiled from the current resources, and parse text
+resources otherwise (see `get_resource_database`).
+"""
+import argparse
+import functools
+import hashlib
+import json
+import logging
+import sqlite3
+import sys
+import tempfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from cart_player.backend import config
+from cart_player.backend.domain.models import CartInfo
+from cart_player.backend.resources import (
+    LAUNCHBOX_FOLDER_PATH,
+    LIBRETRO_METADAT_FOLDER_PATH,
+    MD5_FOLDER_PATH,
+    NOINTRO_FOLDER_PATH,
+    RESOURCE_DATABASE_FILEPATH,
+)
+from cart_player.backend.utils.clrmamepro import load_metadat_records, normalize_name
+from cart_player.backend.utils.files import hash_file, move_file
+from cart_player.backend.utils.md5_index import select_md5
+from cart_player.backend.utils.models import GameSupport
+
+logger = logging.getLogger(f"{config.LOGGER_NAME}::ResourceDatabase")
+
+SCHEMA_VERSION = 4
+MMAP_SIZE = 64 * 1024 * 1024
+PLATFORMS = {
+    GameSupport.GAMEBOY: "Nintendo - Game Boy",
+    GameSupport.GAMEBOY_OR_GAMEBOY_COLOR: "Nintendo - Game Boy Color",
+    GameSupport.GAMEBOY_COLOR: "Nintendo - Game Boy Color",
+    GameSupport.GAMEBOY_ADVANCE: "Nintendo - Game Boy Advance",
+}
+
+# libretro fields, with the folder of the metadat files they are read from (a record merges all fields of a game)
+LIBRETRO_FIELDS = {
+    "genre": "genre",
+    "developer": "developer",
+    "releaseyear": "releaseyear",
+    "crc": "developer",
+}
+
+SCHEMA = """
+CREATE TABLE info (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE sources (path TEXT PRIMARY KEY, size INTEGER, sha1 TEXT);
+CREATE TABLE md5 (
+    platform TEXT, key TEXT, position INTEGER, md5 TEXT, PRIMARY KEY (platform, key)
+) WITHOUT ROWID;
+CREATE TABLE nointro (platform TEXT, position INTEGER, name TEXT, md5 TEXT, attributes TEXT);
+CREATE INDEX nointro_name ON nointro (platform, name);
+CREATE INDEX nointro_md5 ON nointro (platform, md5);
+CREATE TABLE launchbox (
+    platform TEXT, position INTEGER, name TEXT, descr TEXT, release TEXT, PRIMARY KEY (platform, position)
+) WITHOUT ROWID;
+CREATE INDEX launchbox_name ON launchbox (platform, name);
+CREATE TABLE libretro (
+    platform TEXT,
+    position INTEGER,
+    comment TEXT,
+    normalized TEXT,
+    genre TEXT,
+    developer TEXT,
+    releaseyear TEXT,
+    crc TEXT,
+    PRIMARY KEY (platform, position)
+) WITHOUT ROWID;
+CREATE INDEX libretro_comment ON libretro (platform, comment);
+CREATE INDEX libretro_normalized ON libretro (platform, normalized);
+CREATE TABLE identity (
+    platform TEXT,
+    title TEXT,
+    code TEXT,
+    header_checksum TEXT,
+    md5 TEXT,
+    name TEXT,
+    crc TEXT,
+    libretro TEXT,
+    launchbox_name TEXT,
+    launchbox_confidence REAL,
+    PRIMARY KEY (platform, title, code, header_checksum)
+) WITHOUT ROWID;
+"""
+
+
+class CartIdentity:
+    """Identity of a cart across resources, resolved offline from its header.
+
+    Links from header to md5, from md5 to No-Intro name and from No-Intro name to libretro record are exact (as
+    performed at runtime), the link to Launchbox entry is fuzzy.
+
+    Args:
+        md5: Md5 of the game (None if the cart is not referenced).
+        name: No-Intro name of the game, without extension (None if not referenced).
+        crc: CRC32 of the game from No-Intro (None if not referenced).
+        libretro: Values of libretro fields (genre, developer, releaseyear, crc), None if not found.
+        launchbox_name: Name of the best matching Launchbox entry (None if no entry is close enough).
+        launchbox_confidence: Matching ratio of the best Launchbox entry (in [0; 1], 0 if no entry is close enough).
+
+    Attributes:
+        md5: Md5 of the game.
+        name: No-Intro name of the game.
+        crc: CRC32 of the game.
+        libretro: Values of libretro fields.
+        launchbox_name: Name of the best matching Launchbox entry.
+        launchbox_confidence: Matching ratio of the best Launchbox entry.
+    """
+
+    def __init__(
+        self,
+        md5: Optional[str],
+        name: Optional[str],
+        crc: Optional[str],
+        libretro: Dict[str, Optional[str]],
+        launchbox_name: Optional[str],
+        launchbox_confidence: float,
+    ):
+        self.md5 = md5
+        self.name = name
+        self.crc = crc
+        self.libretro = libretro
+        self.launchbox_name = launchbox_name
+        self.launchbox_confidence = launchbox_confidence
+
+
+class ResourceDatabase:
+    """Read-only access to a compiled resource database.
+
+    Lookups return the same results as parsing text resources. Connection is shared by threads (read-only).
+
+    Args:
+        filepath: Path to the compiled database.
+    """
+
+    def __init__(self, filepath: Path = RESOURCE_DATABASE_FILEPATH):
+        self._filepath = Path(filepath)
+        self._connection = sqlite3.connect(
+            f"{self._filepath.resolve().as_uri()}?mode=ro&immutable=1",
+            uri=True,
+            check_same_thread=False,
+        )
+        self._connection.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+
+    def is_up_to_date(self) -> bool:
+        """True if the database has been compiled with the current schema, from the current resources (same contents,
+        whatever their modification times)."""
+        try:
+            version = self._connection.execute("SELECT value FROM info WHERE key = 'schema_version'").fetchone()
+            sources = self._connection.execute("SELECT path, size, sha1 FROM sources").fetchall()
+        except sqlite3.Error:
+            return False
+
+        if version != (str(SCHEMA_VERSION),):
+            return False
+
+        # Compare sizes first, so that resources are only hashed if they may be the same
+        filepaths = _get_source_filepaths()
+        sizes = sorted((filepath.as_posix(), filepath.stat().st_size) for filepath in filepaths)
+        if sizes != sorted((path, size) for path, size, _ in sources):
+            return False
+
+        return sorted(sources) == sorted(_get_sources())
+
+    def find_md5(self, title: str, code: Optional[str], header_checksum: str, support: GameSupport) -> Optional[str]:
+        """Return the md5 of a cart (see `select_md5`), among the keys starting with its title."""
+        rows = self._connection.execute(
+            "SELECT position, key, md5 FROM md5 WHERE platform = ? AND key BETWEEN ? AND ?",
+            (PLATFORMS[support], title, title + "\U0010ffff"),
+        )
+        return select_md5(rows, title, code, header_checksum)
+
+    def find_cart_identity(
+        self,
+        title: str,
+        code: Optional[str],
+        header_checksum: str,
+        support: GameSupport,
+    ) -> Optional[CartIdentity]:
+        """Return the identity of a cart resolved offline, None if its header is not a key of the md5 table (it has to
+        be resolved with other lookups then)."""
+        row = self._connection.execute(
+            "SELECT md5, name, crc, libretro, launchbox_name, launchbox_confidence FROM identity "
+            "WHERE platform = ? AND title = ? AND code = ? AND header_checksum = ?",
+            (PLATFORMS[support], title, code or "", header_checksum),
+        ).fetchone()
+        if row is None:
+            return None
+
+        md5, name, crc, libretro, launchbox_name, launchbox_confidence = row
+        return CartIdentity(md5, name, crc, json.loads(libretro), launchbox_name, launchbox_confidence)
+
+    def find_nointro_name(self, md5: str, support: GameSupport) -> Optional[str]:
+        """Return the No-Intro name (without extension) of the first game having the given md5."""
+        row = self._connection.execute(
+            "SELECT name FROM nointro WHERE platform = ? AND md5 = ? ORDER BY position LIMIT 1",
+            (PLATFORMS[support], md5),
+        ).fetchone()
+        return row[0] if row else None
+
+    def get_nointro_rom(self, name: str, support: GameSupport) -> Optional[Dict[str, str]]:
+        """Return the attributes of the No-Intro rom entry with the given name (without extension)."""
+        row = self._connection.execute(
+            "SELECT attributes FROM nointro WHERE platform = ? AND name = ? ORDER BY position DESC LIMIT 1",
+            (PLATFORMS[support], name),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_launchbox_entries(self, support: GameSupport) -> Dict[str, Dict[str, Optional[str]]]:
+        """Return Launchbox entries ('descr' and 'release'), by name."""
+        rows = self._connection.execute(
+            "SELECT name, descr, release FROM launchbox WHERE platform = ? ORDER BY position",
+            (PLATFORMS[support],),
+        )
+        return {name: {"descr": descr, "release": release} for name, descr, release in rows}
+
+    def get_launchbox_entry(self, name: str, support: GameSupport) -> Optional[Dict[str, Optional[str]]]:
+        """Return the Launchbox entry ('descr' and 'release') with the given name."""
+        row = self._connection.execute(
+            "SELECT descr, release FROM launchbox WHERE platform = ? AND name = ? ORDER BY position LIMIT 1",
+            (PLATFORMS[support], name),
+        ).fetchone()
+        return {"descr": row[0], "release": row[1]} if row else None
+
+    def find_libretro_record(self, cart_id: str, support: GameSupport) -> Optional[Dict[str, Optional[str]]]:
+        """Return the values of libretro fields for a game, found by exact comment, then by normalized comment, then
+        by the first comment containing, or contained in, the cart ID (see `GameRecordIndex.find`)."""
+        conditions = [
+            ("comment = ?", (cart_id,)),
+            ("normalized = ?", (normalize_name(cart_id),)),
+            ("(instr(?, comment) OR instr(comment, ?))", (cart_id, cart_id)),
+        ]
+        for condition, parameters in conditions:
+            row = self._connection.execute(
+                f"SELECT {', '.join(LIBRETRO_FIELDS)} FROM libretro WHERE platform = ? AND {condition} "
+                "ORDER BY position LIMIT 1",
+                (PLATFORMS[support], *parameters),
+            ).fetchone()
+            if row:
+                return dict(zip(LIBRETRO_FIELDS, row))
+
+        return None
+
+    def close(self):
+        self._connection.close()
+
+
+@functools.lru_cache(maxsize=None)
+def get_resource_database() -> Optional[ResourceDatabase]:
+    """Return the compiled resource database, None if it has not been compiled or if it is outdated (text resources
+    have to be parsed then)."""
+    if not RESOURCE_DATABASE_FILEPATH.is_file():
+        logger.debug(f"No compiled resource database ({RESOURCE_DATABASE_FILEPATH=})")
+        return None
+
+    try:
+        database = ResourceDatabase(RESOURCE_DATABASE_FILEPATH)
+    except sqlite3.Error as e:
+        logger.info(f"Unable to open compiled resource database: {e}", exc_info=True)
+        return None
+
+    if not database.is_up_to_date():
+        logger.info(f"Compiled resource database is outdated, ignoring it ({RESOURCE_DATABASE_FILEPATH=})")
+        database.close()
+        return None
+
+    return database
+
+
+@functools.lru_cache(maxsize=None)
+def get_resource_version() -> str:
+    """Return the version of the resources (digest of the schema version and of the paths, sizes and contents of text
+    resources), which changes whenever a resource or the way it is looked up is updated (e.g. to invalidate results
+    computed from them), but not when resources are only copied."""
+    sources = sorted(_get_sources())
+    return hashlib.sha1(json.dumps([SCHEMA_VERSION, sources]).encode()).hexdigest()
+
+
+def get_cart_identity(database: ResourceDatabase, cart_info: CartInfo) -> Optional[CartIdentity]:
+    """Return the identity of a cart resolved offline, None if it has not been resolved or if the cart is identified
+    otherwise (its identifier differs from the resolved No-Intro name)."""
+    cart_identity = database.find_cart_identity(
+        cart_info.title, cart_info.code, cart_info.header_checksum, cart_info.support
+    )
+    if cart_identity is None or cart_identity.name is None or cart_identity.name != cart_info.id:
+        return None
+
+    return cart_identity
+
+
+def compile_resource_database(filepath: Path = RESOURCE_DATABASE_FILEPATH):
+    """Compile text resources into a resource database.
+
+    Args:
+        filepath: Path to the compiled database (replaced atomically if it exists).
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=filepath.parent) as dirpath:
+        tmp_filepath = Path(dirpath) / filepath.name
+        connection = sqlite3.connect(tmp_filepath)
+        try:
+            connection.executescript(SCHEMA)
+            connection.execute("INSERT INTO info VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+            connection.executemany("INSERT INTO sources VALUES (?, ?, ?)", _get_sources())
+            for platform in sorted(set(PLATFORMS.values())):
+                connection.executemany("INSERT INTO md5 VALUES (?, ?, ?, ?)", _read_md5(platform))
+                connection.executemany("INSERT INTO nointro VALUES (?, ?, ?, ?, ?)", _read_nointro(platform))
+                connection.executemany("INSERT INTO launchbox VALUES (?, ?, ?, ?, ?)", _read_launchbox(platform))
+                connection.executemany("INSERT INTO libretro VALUES (?, ?, ?, ?, ?, ?, ?, ?)", _read_libretro(platform))
+            connection.commit()
+
+            # Resolve carts across resources, with lookups of the compiled database
+            database = ResourceDatabase(tmp_filepath)
+            try:
+                identities = [
+                    row for platform in sorted(set(PLATFORMS.values())) for row in _resolve(database, platform)
+                ]
+            finally:
+                database.close()
+            connection.executemany("INSERT INTO identity VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", identities)
+            connection.commit()
+            connection.execute("VACUUM")
+        finally:
+            connection.close()
+        move_file(tmp_filepath, filepath)
+
+
+def _get_sources() -> List[Tuple[str, int, str]]:
+    """Return the text resources the database is compiled from (path, size and sha1 of content)."""
+    return [
+        (filepath.as_posix(), filepath.stat().st_size, hash_file(filepath)["sha1"])
+        for filepath in _get_source_filepaths()
+    ]
+
+
+def _get_source_filepaths() -> List[Path]:
+    return [
+        *MD5_FOLDER_PATH.glob("*.json"),
+        *NOINTRO_FOLDER_PATH.glob("*.xml"),
+        *LAUNCHBOX_FOLDER_PATH.glob("*.json"),
+        *LIBRETRO_METADAT_FOLDER_PATH.glob("*/*.dat"),
+    ]
+
+
+def _read_md5(platform: str) -> Iterator[tuple]:
+    with open(MD5_FOLDER_PATH / f"{platform}.json", "r") as f:
+        for position, (key, md5) in enumerate(json.load(f).items()):
+            yield platform, key, position, md5
+
+
+def _read_nointro(platform: str) -> Iterator[tuple]:
+    root = ET.parse(NOINTRO_FOLDER_PATH / f"{platform}.xml").getroot()
+    for position, rom in enumerate(root.iter("rom")):
+        if rom.get("name"):
+            yield platform, position, Path(rom.get("name")).stem, rom.get("md5"), json.dumps(dict(rom.attrib))
+
+
+def _read_launchbox(platform: str) -> Iterator[tuple]:
+    with open(LAUNCHBOX_FOLDER_PATH / f"{platform}.json", "r", encoding="utf-8") as f:
+        for position, (name, entry) in enumerate(json.load(f).items()):
+            yield platform, position, name, entry["descr"], entry["release"]
+
+
+def _read_libretro(platform: str) -> Iterator[tuple]:
+    """Read the record of each game of the metadat files of a platform (values of all fields, merged by comment)."""
+    records = load_metadat_records(LIBRETRO_METADAT_FOLDER_PATH, f"{platform}.dat", LIBRETRO_FIELDS)
+    for position, comment in enumerate(records.names):
+        record = records.get(comment)
+        yield (platform, position, comment, normalize_name(comment), *(record.get(field) for field in LIBRETRO_FIELDS))
+
+
+def _resolve(database: ResourceDatabase, platform: str) -> Iterator[tuple]:
+    """Resolve each cart referenced by the md5 table of a platform (keyed by title, code and header checksum), as
+    performed at runtime by the lookups of the compiled database."""
+    # Imported here, as game libraries use the compiled database
+    from cart_player.backend.adapters.game_library.utils import LaunchboxIndex, LaunchboxMetadataParser
+
+    support = next(support for support, support_platform in PLATFORMS.items() if support_platform == platform)
+    launchbox_index = LaunchboxIndex(database.get_launchbox_entries(support))
+
+    keys = database._connection.execute("SELECT key FROM md5 WHERE platform = ? ORDER BY position", (platform,))
+    for (key,) in keys.fetchall():
+        title, code, header_checksum = key.rsplit("_", 2)
+        code = code if code != "-" else None
+        md5 = database.find_md5(title, code, header_checksum, support)
+        name = database.find_nointro_name(md5, support) if md5 else None
+        nointro_rom = database.get_nointro_rom(name, support) if name else None
+        libretro = {field: None for field in LIBRETRO_FIELDS}
+        launchbox_name, launchbox_confidence = None, 0.0
+        if name:
+            cart_info = CartInfo(title, code, header_checksum, support, id_override=name)
+            record = database.find_libretro_record(cart_info.id, support) or {}
+            libretro = {field: record.get(field, None) for field in LIBRETRO_FIELDS}
+            base_name = LaunchboxMetadataParser.preprocess_string(cart_info.base_name)
+            launchbox_name, launchbox_confidence = launchbox_index.find(base_name)
+
+        yield (
+            platform,
+            title,
+            code or "",
+            header_checksum,
+            md5,
+            name,
+            nointro_rom.get("crc") if nointro_rom else None,
+            json.dumps(libretro),
+            launchbox_name,
+            launchbox_confidence,
+        )
+
+
+def main(args: List[str]):
+    parser = argparse.ArgumentParser(description="Compile text resources into a resource database.")
+    parser.add_argument("--output", type=Path, default=RESOURCE_DATABASE_FILEPATH, help="Compiled database file.")
+    options = parser.parse_args(args)
+
+    compile_resource_database(options.output)
+    print(f"Resource database compiled into '{options.output}'.")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
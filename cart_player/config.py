@@ -6,15 +6,18 @@ import cart_player.backend.services as backend_services
 import cart_player.core.services as core_services
 import cart_player.frontend.services as frontend_services
 from cart_player.backend.adapters.cart_flasher.gbx_flasher import GBXFlasher
+from cart_player.backend.adapters.cart_flasher.stats import OperationStats
 from cart_player.backend.adapters.game_library import (
     CartMetadataLibrary,
     LaunchboxMetadataLibrary,
     LibretroImageLibrary,
     LibretroMetadataLibrary,
+    SqliteGameLibraryCache,
 )
-from cart_player.backend.adapters.memory import DummyMemory, LocalMemory
+from cart_player.backend.adapters.memory import CachedMemory, DummyMemory, LocalMemory, WriteBehindMemory
 from cart_player.backend.domain.models import CartInfo
-from cart_player.backend.domain.ports import GameLibrary
+from cart_player.backend.domain.ports import CartFlasherPool, GameLibrary
+from cart_player.backend.domain.ports.cart_flasher_pool import DEFAULT_DEVICE_ID
 from cart_player.backend.resources.mock import (
     mock_gb_boxart_filepath,
     mock_gb_gbc_boxart_filepath,
@@ -33,6 +36,8 @@ from cart_player.backend.tests.mocks import (
     MockMemory,
 )
 from cart_player.backend.utils.models import GameRegion, GameSupport
+from cart_player.backend.utils.nointro import warm_up_nointro
+from cart_player.backend.utils.resource_database import get_resource_version
 from cart_player.core import Broker, Channel
 from cart_player.frontend.adapters.sg import SgApp
 from cart_player.frontend.domain.events import WindowReadNoWindowEvent, WindowReadTimeoutEvent
@@ -41,6 +46,9 @@ from cart_player.frontend.domain.ports import LocalMemoryConfigurable
 from .logging_handlers import logging_handlers
 from .settings import (
     APP_NAME,
+    BASE_APP_PATH,
+    SETTINGS_CART_FLASHER_PORTS,
+    SETTINGS_CART_FLASHER_SERIAL_NUMBERS,
     SETTINGS_MEMORY_PATH,
     SETTINGS_NO_MEMORY,
     SETTINGS_RESET_MEMORY,
@@ -62,7 +70,24 @@ channel = Channel()
 
 # CartFlasher
 if not cli_settings.get(SETTINGS_USE_CART_FLASHER_MOCK):
-    cart_flasher = GBXFlasher()
+    # One cart flasher per device (identified by its port or serial number), auto-detected device by default
+    # Past operations of all devices are used to predict the duration of the next ones
+    cart_flasher_stats = OperationStats(BASE_APP_PATH / "cart_flasher_stats.json")
+    cart_flashers = {
+        port: GBXFlasher(device_port=port, stats=cart_flasher_stats)
+        for port in cli_settings.get(SETTINGS_CART_FLASHER_PORTS)
+    }
+    cart_flashers.update(
+        {
+            serial_number: GBXFlasher(device_serial_number=serial_number, stats=cart_flasher_stats)
+            for serial_number in cli_settings.get(SETTINGS_CART_FLASHER_SERIAL_NUMBERS)
+        }
+    )
+    if not cart_flashers:
+        cart_flashers = {DEFAULT_DEVICE_ID: GBXFlasher(stats=cart_flasher_stats)}
+
+    # Load No-Intro references in background, so that identifying the first cart does not wait for them
+    warm_up_nointro()
 else:
     carts = [
         CartInfo(
@@ -85,13 +110,15 @@ else:
         ),
         None,
     ]
-    cart_flasher = MockCartFlasher(carts)
+    cart_flashers = {DEFAULT_DEVICE_ID: MockCartFlasher(carts)}
+cart_flasher_pool = CartFlasherPool(cart_flashers)
 
 # Memory
+local_memory = None
 if cli_settings.get(SETTINGS_NO_MEMORY):
     memory = DummyMemory()
 elif cli_settings.get(SETTINGS_USE_MEMORY_MOCK):
-    memory = MockMemory(
+    memory = local_memory = MockMemory(
         app.memory_path,
         entries=[
             MockGameData(cart_info=cart_info, game_installed=i % 2 == 0, n_saves=i)
@@ -100,10 +127,11 @@ elif cli_settings.get(SETTINGS_USE_MEMORY_MOCK):
         ],
     )
 else:
-    memory = LocalMemory(app.memory_path)
+    local_memory = LocalMemory(app.memory_path)
     if cli_settings.get(SETTINGS_RESET_MEMORY):
-        shutil.rmtree(memory.root_path, ignore_errors=True)
-    memory.configure()
+        shutil.rmtree(local_memory.root_path, ignore_errors=True)
+    local_memory.configure()
+    memory = CachedMemory(WriteBehindMemory(local_memory, journal_path=BASE_APP_PATH / "journal"))
 
 # GameLibrary
 metadata_libraries = []
@@ -130,7 +158,14 @@ else:
     image_library.add_image(carts[3].id, Path(mock_gba_boxart_filepath))
     image_libraries.append(image_library)
 
-game_library = GameLibrary(metadata_libraries, image_libraries)
+# Lookups are cached (including carts not found), unless libraries are mocked
+game_library_cache = None
+if not cli_settings.get(SETTINGS_USE_METADATA_LIBRARIES_MOCK) and not cli_settings.get(
+    SETTINGS_USE_IMAGE_LIBRARIES_MOCK
+):
+    game_library_cache = SqliteGameLibraryCache(BASE_APP_PATH / "game_library_cache.db", get_resource_version())
+
+game_library = GameLibrary(metadata_libraries, image_libraries, game_library_cache)
 
 # running in main thread, used for messages that have to be handled in main thread
 main_broker = Broker(channel=channel)
@@ -171,6 +206,7 @@ main_broker.register(frontend_services.WindowCloseAttemptedEventHandler(main_bro
 broker.register(frontend_services.BackupButtonPressedEventHandler(broker))
 broker.register(frontend_services.BackupCartSaveProgressEventHandler(broker))
 broker.register(frontend_services.CartGameInstalledEventHandler(broker))
+broker.register(frontend_services.CartGameMetadataCompletedEventHandler(broker))
 broker.register(frontend_services.CartDataReadEventHandler(broker, app))
 broker.register(frontend_services.CartSaveBackupEventHandler(broker))
 broker.register(frontend_services.CartSaveErasedEventHandler(broker))
@@ -186,19 +222,25 @@ broker.register(frontend_services.OpenMemoryButtonPressedEventHandler(main_broke
 broker.register(frontend_services.RefreshButtonPressedEventHandler(broker, app))
 broker.register(frontend_services.UploadButtonPressedEventHandler(broker))
 broker.register(frontend_services.WriteCartSaveProgressEventHandler(broker))
-if isinstance(memory, LocalMemory) and isinstance(app, LocalMemoryConfigurable):
+if isinstance(local_memory, LocalMemory) and isinstance(app, LocalMemoryConfigurable):
     broker.register(frontend_services.LocalMemoryConfigurationUpdatedEventHandler(broker, app))
 
+# Backend - event handlers
+broker.register(backend_services.CartDataReadEventHandler(broker))
+
 # Backend - handlers
-broker.register(backend_services.BackupCartSaveHandler(broker, memory, cart_flasher))
+broker.register(backend_services.BackupCartSaveHandler(broker, memory, cart_flasher_pool))
 broker.register(backend_services.BackupSaveFileAfterPlayingHandler(broker, memory))
-broker.register(backend_services.EraseCartSaveHandler(broker, memory, cart_flasher))
+broker.register(backend_services.DumpCartBatchHandler(broker, memory, cart_flasher_pool, game_library))
+broker.register(backend_services.EraseCartSaveHandler(broker, memory, cart_flasher_pool))
 broker.register(backend_services.ExportToAnaloguePocketLibraryHandler(broker, memory))
-broker.register(backend_services.InstallCartGameHandler(broker, memory, cart_flasher))
-broker.register(backend_services.ReadCartDataHandler(broker, memory, cart_flasher, game_library))
+broker.register(backend_services.InstallCartGameHandler(broker, memory, cart_flasher_pool))
+broker.register(backend_services.PrepareGameFileForPlayingHandler(broker, memory))
+broker.register(backend_services.ReadCartDataHandler(broker, memory, cart_flasher_pool, game_library))
 broker.register(backend_services.SetupGameFileAndSaveFileForPlayingHandler(broker, memory))
-broker.register(backend_services.WriteCartSaveHandler(broker, memory, cart_flasher))
-if isinstance(memory, LocalMemory):
+broker.register(backend_services.VerifyMemoryHandler(broker, memory))
+broker.register(backend_services.WriteCartSaveHandler(broker, memory, cart_flasher_pool))
+if isinstance(local_memory, LocalMemory):
     broker.register(backend_services.UpdateLocalMemoryConfigurationHandler(broker, memory))
 
 # Save current memory path if none was found in settings
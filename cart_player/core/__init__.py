@@ -2,3 +2,4 @@ from . import config
 from .broker import Broker
 from .channel import Channel, ChannelSubscriber
 from .handler import Handler
+from .metrics import Metrics, metrics
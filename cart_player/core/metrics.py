@@ -0,0 +1,116 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class Timing:
+    """Statistics about the durations recorded for a timed operation.
+
+    Attributes:
+        count: Number of recorded durations.
+        total: Sum of recorded durations (in seconds).
+        min: Shortest recorded duration (in seconds).
+        max: Longest recorded duration (in seconds).
+        last: Last recorded duration (in seconds).
+
+    Properties:
+        mean: Mean of recorded durations (in seconds).
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.last: Optional[float] = None
+
+    @property
+    def mean(self) -> Optional[float]:
+        """Mean of recorded durations (in seconds)."""
+        return self.total / self.count if self.count else None
+
+    def add(self, duration: float):
+        """Record a duration (in seconds)."""
+        self.count += 1
+        self.total += duration
+        self.min = duration if self.min is None else min(self.min, duration)
+        self.max = duration if self.max is None else max(self.max, duration)
+        self.last = duration
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "last": self.last,
+        }
+
+
+class Metrics:
+    """Thread-safe registry of counters, gauges and timings, identified by name (e.g. 'memory.cache.hits')."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, int] = {}
+        self._gauges: Dict[str, float] = {}
+        self._timings: Dict[str, Timing] = {}
+
+    def increment(self, name: str, value: int = 1):
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set(self, name: str, value: float):
+        """Set the current value of a gauge."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def record(self, name: str, duration: float):
+        """Record the duration (in seconds) of a timed operation."""
+        with self._lock:
+            self._timings.setdefault(name, Timing()).add(duration)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the duration of the wrapped block of code (even if it raises an exception)."""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start_time)
+
+    def get_counter(self, name: str) -> int:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def get_gauge(self, name: str) -> Optional[float]:
+        with self._lock:
+            return self._gauges.get(name, None)
+
+    def get_timing(self, name: str) -> Optional[dict]:
+        with self._lock:
+            timing = self._timings.get(name, None)
+            return timing.to_dict() if timing is not None else None
+
+    def snapshot(self) -> dict:
+        """Return the current value of all metrics."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+                "timings": {name: timing.to_dict() for name, timing in self._timings.items()},
+            }
+
+    def reset(self):
+        """Reset all metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._timings.clear()
+
+
+# Registry shared by the whole app
+metrics = Metrics()
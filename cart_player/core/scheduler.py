@@ -0,0 +1,125 @@
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
+
+DEFAULT_AGING_INTERVAL = 10.0  # seconds of waiting raising the priority of a job by one level
+
+
+class Job:
+    """Job queued in a job scheduler.
+
+    Args:
+        name: Name of the job (e.g. name of the operation).
+        priority: Priority of the job (jobs with the lowest priority value are run first).
+        sequence: Sequence number of the job, so that jobs with the same priority are run in order of arrival.
+        aging_interval: Waiting time in seconds after which the priority value of the job is lowered by one, so that
+            jobs with a high priority value are not starved. If None, priority does not change.
+
+    Attributes:
+        name: Name of the job.
+        priority: Priority of the job.
+
+    Properties:
+        is_running: True if the job is running.
+        effective_priority: Priority of the job, lowered according to its waiting time.
+        wait_time: Time in seconds the job has been waiting to be run (until it started, if running).
+    """
+
+    def __init__(self, name: str, priority: int, sequence: int, aging_interval: Optional[float] = None):
+        self.name = name
+        self.priority = priority
+        self._sequence = sequence
+        self._aging_interval = aging_interval
+        self._queued_time = time.monotonic()
+        self._start_time: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        """True if the job is running."""
+        return self._start_time is not None
+
+    @property
+    def wait_time(self) -> float:
+        """Time in seconds the job has been waiting to be run (until it started, if running)."""
+        end_time = self._start_time if self._start_time is not None else time.monotonic()
+        return end_time - self._queued_time
+
+    @property
+    def effective_priority(self) -> float:
+        """Priority of the job, lowered according to its waiting time."""
+        if self._aging_interval is None:
+            return self.priority
+        return self.priority - self.wait_time / self._aging_interval
+
+    def __lt__(self, other: "Job") -> bool:
+        return (self.effective_priority, self._sequence) < (other.effective_priority, other._sequence)
+
+    def __repr__(self) -> str:
+        return f"Job(name={self.name!r}, priority={self.priority}, wait_time={self.wait_time:.3f})"
+
+
+class JobScheduler:
+    """Run jobs one at a time, by priority then in order of arrival.
+
+    Jobs wait for their turn instead of failing when another job is running. The priority of a queued job is raised
+    while it waits (see `Job`), so that jobs with a high priority value are eventually run even if jobs with a lower
+    priority value keep arriving.
+
+    Args:
+        aging_interval: Waiting time in seconds after which the priority value of a queued job is lowered by one. If
+            None, jobs are run by strict priority.
+
+    Properties:
+        jobs: Running job (if any) followed by queued jobs, in the order they would be run now.
+    """
+
+    def __init__(self, aging_interval: Optional[float] = DEFAULT_AGING_INTERVAL):
+        self._aging_interval = aging_interval
+        self._queue: List[Job] = []
+        self._running: Optional[Job] = None
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+
+    @property
+    def jobs(self) -> List[Job]:
+        """Running job (if any) followed by queued jobs, in the order they would be run now."""
+        with self._condition:
+            return ([self._running] if self._running is not None else []) + sorted(self._queue)
+
+    @contextmanager
+    def schedule(self, name: str, priority: int) -> Iterator[Job]:
+        """Queue a job and wait for its turn, then run it until the end of the context.
+
+        Args:
+            name: Name of the job.
+            priority: Priority of the job (jobs with the lowest priority value are run first).
+
+        Yields:
+            Running job.
+        """
+        job = Job(name, priority, next(self._sequence), self._aging_interval)
+        with self._condition:
+            self._queue.append(job)
+            self._run_next()
+            self._condition.wait_for(lambda: self._running is job)
+
+        try:
+            yield job
+        finally:
+            with self._condition:
+                self._running = None
+                self._run_next()
+
+    def _run_next(self):
+        """Start the queued job with the lowest priority value if no job is running (condition must be held).
+        The next job is elected once, so that waiting jobs never disagree on whose turn it is while priorities age."""
+        if self._running is not None or not self._queue:
+            return
+
+        job = min(self._queue)
+        self._queue.remove(job)
+        job._start_time = time.monotonic()
+        self._running = job
+        self._condition.notify_all()
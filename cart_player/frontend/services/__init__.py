@@ -3,6 +3,7 @@ from .event_handlers import (
     BackupCartSaveProgressEventHandler,
     CartDataReadEventHandler,
     CartGameInstalledEventHandler,
+    CartGameMetadataCompletedEventHandler,
     CartSaveBackupEventHandler,
     CartSaveErasedEventHandler,
     CartSaveWrittenEventHandler,
@@ -1,6 +1,7 @@
 from .backup_button_pressed import BackupButtonPressedEventHandler
 from .backup_cart_save_progress import BackupCartSaveProgressEventHandler
 from .cart_game_installed import CartGameInstalledEventHandler
+from .cart_game_metadata_completed import CartGameMetadataCompletedEventHandler
 from .cart_info_read import CartDataReadEventHandler
 from .cart_save_backup import CartSaveBackupEventHandler
 from .cart_save_erased import CartSaveErasedEventHandler
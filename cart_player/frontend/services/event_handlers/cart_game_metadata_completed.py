@@ -0,0 +1,29 @@
+from typing import Type
+
+from cart_player.backend.api.commands import ReadCartDataCommand
+from cart_player.backend.api.events import CartGameMetadataCompletedEvent
+from cart_player.core import Broker, Handler
+
+
+class CartGameMetadataCompletedEventHandler(Handler):
+    """Handle event 'CartGameMetadataCompletedEvent'.
+
+    Cart data is read again so that completed game metadata is displayed (game image is already displayed).
+    """
+
+    def __init__(self, broker: Broker):
+        super().__init__(broker)
+
+    @property
+    def message_type(self) -> Type:
+        return CartGameMetadataCompletedEvent
+
+    def _handle(self, evt: CartGameMetadataCompletedEvent):
+        self._publish(
+            ReadCartDataCommand(
+                cart_info=evt.cart_info,
+                skip_game_image=True,
+                raise_error=False,
+                device_id=evt.device_id,
+            ),
+        )
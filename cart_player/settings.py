@@ -20,6 +20,8 @@ SETTINGS_MEMORY_PATH = "memory_path"
 SETTINGS_USE_MEMORY_MOCK = "use_memory_mock"
 SETTINGS_NO_MEMORY = "no_memory"
 SETTINGS_USE_CART_FLASHER_MOCK = "use_cart_flasher_mock"
+SETTINGS_CART_FLASHER_PORTS = "cart_flasher_ports"
+SETTINGS_CART_FLASHER_SERIAL_NUMBERS = "cart_flasher_serial_numbers"
 SETTINGS_USE_METADATA_LIBRARIES_MOCK = "use_metadata_libraries_mock"
 SETTINGS_USE_IMAGE_LIBRARIES_MOCK = "use_image_libraries_mock"
 SETTINGS_RESET_MEMORY = "reset_memory"
@@ -40,6 +42,8 @@ if "child" in sys.argv[0]:  # pyinstaller build case
         def __init__(self):
             self.use_mock = False
             self.use_cart_flasher_mock = False
+            self.cart_flasher_port = []
+            self.cart_flasher_serial_number = []
             self.reset_memory = False
 
     __cli_settings = DefaultCLISettings()
@@ -48,6 +52,18 @@ else:  # standard CLI call
     __parser.add_argument("--use_mock", action="store_true", help="Use mock adapters")
     __parser.add_argument("--no_memory", action="store_true", help="Disable memory")
     __parser.add_argument("--use_cart_flasher_mock", action="store_true", help="Use mock adapter for cart flasher")
+    __parser.add_argument(
+        "--cart_flasher_port",
+        action="append",
+        default=[],
+        help="Serial port of a cart flasher device (repeat to use several devices in parallel)",
+    )
+    __parser.add_argument(
+        "--cart_flasher_serial_number",
+        action="append",
+        default=[],
+        help="USB serial number of a cart flasher device (repeat to use several devices in parallel)",
+    )
     __parser.add_argument("--reset_memory", action="store_true", help="Reset memory")
     __cli_settings = __parser.parse_args()
 
@@ -55,6 +71,8 @@ cli_settings = {
     SETTINGS_USE_MEMORY_MOCK: __cli_settings.use_mock,
     SETTINGS_NO_MEMORY: __cli_settings.no_memory,
     SETTINGS_USE_CART_FLASHER_MOCK: __cli_settings.use_mock or __cli_settings.use_cart_flasher_mock,
+    SETTINGS_CART_FLASHER_PORTS: __cli_settings.cart_flasher_port,
+    SETTINGS_CART_FLASHER_SERIAL_NUMBERS: __cli_settings.cart_flasher_serial_number,
     SETTINGS_USE_METADATA_LIBRARIES_MOCK: __cli_settings.use_mock,
     SETTINGS_USE_IMAGE_LIBRARIES_MOCK: __cli_settings.use_mock,
     SETTINGS_RESET_MEMORY: not __cli_settings.use_mock and __cli_settings.reset_memory,
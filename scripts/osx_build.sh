@@ -6,6 +6,9 @@ pip install pyinstaller==5.7
 python setup.py install
 pip list
 
+# Compile resources (No-Intro, md5, Launchbox and libretro data) into an indexed database
+python -m cart_player.backend.utils.resource_database
+
 # Build and package the app using PyInstaller
 pyinstaller --name CartPlayer --windowed --icon=app_icon_fullsize/app_icon_fullsize.icns  --noconfirm --clean cart_player/__main__.py
 
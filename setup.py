@@ -28,7 +28,6 @@ REQUIRED = [
     "rapidfuzz==2.13.*",
     "Unidecode==1.3.*",
     "requests==2.29.*",
-    "pexpect==4.8.*;platform_system=='Darwin'",
     "appdirs==1.4.*;platform_system=='Darwin'",
 ]
 